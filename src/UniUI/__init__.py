@@ -1,13 +1,15 @@
-import pygame
-pygame.init()
-
 from .core.math.vector2 import Vector2
 from .core.sceneManager import SceneManager
 from .core.object import BaseObject
 from .core.scene import Scene
+from .core.utils.objectPool import ObjectPool
+from .core.sceneFile import SceneFile
 from .core.screen import Screen
 from .core.time import Time
 from .core.ui.color import Color
 from .core.ui.text import Text
+from .core.ui.fonts import Fonts
+from .core.ui.virtualList import VirtualList
 from .core.ui.transform import Transform
-from .core.ui.align import Align, TextAlign, TextAlignX, TextAlignY
\ No newline at end of file
+from .core.ui.align import Align, TextAlign, TextAlignX, TextAlignY
+from .core.input import PointerEvent, PointerEventType, PointerEventPhase
\ No newline at end of file
@@ -0,0 +1,226 @@
+import pygame
+
+from enum import Enum
+from typing import Callable
+
+from .math.vector2 import Vector2
+
+
+class PointerEventType(Enum):
+
+    DOWN    = 1
+    UP      = 2
+    MOVE    = 3
+    CLICK   = 4 # button pressed and released over the same object
+    WHEEL   = 5
+    ENTER   = 6 # does not propagate, sent to every object the pointer entered
+    LEAVE   = 7 # does not propagate, sent to every object the pointer left
+
+
+class PointerEventPhase(Enum):
+
+    CAPTURE = 1 # from the root down to the parent of the target
+    TARGET  = 2
+    BUBBLE  = 3 # from the parent of the target up to the root
+
+
+class PointerEvent:
+    """
+    Pointer event delivered to the listeners added with `BaseObject.add_pointer_listener`.\n
+    Events travel from the root to the target calling the capture listeners, then back
+    from the target to the root calling the other ones, unless `stop_propagation` is called.
+    """
+
+    def __init__(
+            self, type: PointerEventType, position: Vector2, target: 'BaseObject',
+            button: int = 0, delta: Vector2 = None, wheel: Vector2 = None) -> None:
+
+        self.type = type
+        self.position = position
+        self.target = target
+        self.button = button
+        self.delta = delta if delta is not None else Vector2(0, 0)
+        self.wheel = wheel if wheel is not None else Vector2(0, 0)
+
+        self.current_target: 'BaseObject' = None
+        self.phase: PointerEventPhase = PointerEventPhase.TARGET
+        self._propagation_stopped: bool = False
+
+    def __repr__(self) -> str:
+        return f"PointerEvent({self.type.name}, {self.position}, target={self.target.name if self.target else None})"
+
+    def stop_propagation(self) -> None:
+        """Prevents the event from reaching the objects after the current one."""
+        self._propagation_stopped = True
+
+
+PointerListener = Callable[[PointerEvent], None]
+
+
+class Input:
+    """
+    Routes the mouse events of a scene to its objects, available as `scene.input`.\n
+    The target of an event is the topmost object under the pointer. It is found through the
+    scene's bounds tree and the subtree bounds of the objects, which are refreshed incrementally,
+    so only the branches under the pointer are visited. Nothing is hit-tested while no object
+    of the scene listens to pointer events.
+    """
+
+    EVENT_TYPES = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL)
+    WHEEL_BUTTONS = (4, 5) # legacy button events sent along with MOUSEWHEEL
+
+    def __init__(self, scene: 'Scene') -> None:
+        self._scene = scene
+        self._listeners: int = 0 # number of pointer listeners of the scene objects
+
+        self._position: Vector2 = Vector2(0, 0)
+        self._hovered: 'BaseObject' = None
+        self._pressed: dict[int, 'BaseObject'] = {} # button -> object under the pointer when pressed
+
+    #region Private
+    @staticmethod
+    def _path(obj: 'BaseObject') -> list['BaseObject']:
+        """Returns the parent chain of `obj`, from the root to `obj`."""
+        path = []
+        while obj is not None:
+            path.append(obj)
+            obj = obj._parent
+        path.reverse()
+        return path
+
+    def _dispatch(self, event: PointerEvent) -> None:
+        if event.target is None:
+            return
+
+        path = Input._path(event.target)
+
+        event.phase = PointerEventPhase.CAPTURE
+        for obj in path[:-1]:
+            obj._invoke_pointer_listeners(event, True)
+            if event._propagation_stopped:
+                return
+
+        event.phase = PointerEventPhase.TARGET
+        event.target._invoke_pointer_listeners(event, True)
+        if not event._propagation_stopped:
+            event.target._invoke_pointer_listeners(event, False)
+        if event._propagation_stopped:
+            return
+
+        event.phase = PointerEventPhase.BUBBLE
+        for obj in reversed(path[:-1]):
+            obj._invoke_pointer_listeners(event, False)
+            if event._propagation_stopped:
+                return
+
+    def _update_hover(self, target: 'BaseObject') -> None:
+        if target is self._hovered:
+            return
+
+        old_path = Input._path(self._hovered)
+        new_path = Input._path(target)
+        common = 0
+        while common < len(old_path) and common < len(new_path) and old_path[common] is new_path[common]:
+            common += 1
+
+        self._hovered = target
+        for obj in reversed(old_path[common:]):
+            event = PointerEvent(PointerEventType.LEAVE, self._position.copy(), obj)
+            obj._invoke_pointer_listeners(event, False)
+        for obj in new_path[common:]:
+            event = PointerEvent(PointerEventType.ENTER, self._position.copy(), obj)
+            obj._invoke_pointer_listeners(event, False)
+
+    def _handle_events(self, events: list[pygame.event.Event]) -> None:
+        if not self._listeners:
+            return
+
+        pointer_events = [event for event in events if event.type in Input.EVENT_TYPES]
+        if not pointer_events:
+            return
+
+        motion: pygame.event.Event = None
+        delta = [0, 0]
+        for event in pointer_events:
+            # consecutive motions are coalesced into one, with their deltas summed
+            if event.type == pygame.MOUSEMOTION:
+                motion = event
+                delta[0] += event.rel[0]
+                delta[1] += event.rel[1]
+                continue
+            if motion is not None:
+                self._handle_motion(motion, delta)
+                motion = None
+                delta = [0, 0]
+            self._handle_button(event)
+
+        if motion is not None:
+            self._handle_motion(motion, delta)
+
+    def _handle_motion(self, event: pygame.event.Event, delta: list[int]) -> None:
+        self._position = Vector2(*event.pos)
+        target = self.hit_test(self._position)
+        self._update_hover(target)
+        self._dispatch(PointerEvent(PointerEventType.MOVE, self._position.copy(), target, delta=Vector2(*delta)))
+
+    def _handle_button(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.MOUSEWHEEL:
+            event = PointerEvent(PointerEventType.WHEEL, self._position.copy(), self._hovered, wheel=Vector2(event.x, event.y))
+            self._dispatch(event)
+            return
+        if event.button in Input.WHEEL_BUTTONS:
+            return
+
+        self._position = Vector2(*event.pos)
+        position = self._position.copy()
+        target = self.hit_test(self._position)
+        self._update_hover(target)
+
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            self._pressed[event.button] = target
+            self._dispatch(PointerEvent(PointerEventType.DOWN, position, target, button=event.button))
+            return
+
+        self._dispatch(PointerEvent(PointerEventType.UP, position, target, button=event.button))
+
+        # the click goes to the closest common ancestor of the pressed and released objects
+        pressed = self._pressed.pop(event.button, None)
+        if pressed is None or target is None:
+            return
+        pressed_path = Input._path(pressed)
+        clicked = None
+        for a, b in zip(pressed_path, Input._path(target)):
+            if a is not b:
+                break
+            clicked = a
+        if clicked is not None:
+            self._dispatch(PointerEvent(PointerEventType.CLICK, position, clicked, button=event.button))
+
+    def _forget(self, obj: 'BaseObject') -> None:
+        """Drops the references to a destroyed object."""
+        if self._hovered is None and not self._pressed:
+            return
+        if self._hovered is not None and obj in Input._path(self._hovered):
+            self._hovered = obj._parent
+        for button, pressed in list(self._pressed.items()):
+            if pressed is not None and obj in Input._path(pressed):
+                del self._pressed[button]
+    #endregion
+
+    #region Public
+    @property
+    def position(self) -> Vector2:
+        """Last known position of the pointer."""
+        return self._position.copy()
+
+    @property
+    def hovered(self) -> 'BaseObject':
+        """Topmost object under the pointer, None if there is none."""
+        return self._hovered
+
+    def hit_test(self, position: Vector2) -> 'BaseObject':
+        """Returns the topmost object drawn at `position` or None."""
+        self._scene._refresh_hit_bounds()
+        return self._scene._pick((int(position.x), int(position.y)))
+    #endregion
+
@@ -6,52 +6,107 @@ from typing import Callable
 from ..tools.console import Console
 from ..utils.event import Event
 
+
+_FAST_TYPES = (int, float) # checked by exact type before the much slower numbers.Real check
+
+
+def _is_real(value: object) -> bool:
+    return type(value) in _FAST_TYPES or isinstance(value, numbers.Real)
+
+
 class Vector2:
 
+    __slots__ = ("_x", "_y", "_on_changed")
+
     def __init__(self, x: numbers.Real, y: numbers.Real, on_changed: Event = None) -> None:
-        self._x = x if isinstance(x, numbers.Real) else 0.0
-        self._y = y if isinstance(y, numbers.Real) else 0.0
-        self._on_changed = on_changed if isinstance(on_changed, Event) else Event([])
+        self._x = x if _is_real(x) else 0.0
+        self._y = y if _is_real(y) else 0.0
+        # the event is only allocated once somebody listens to the vector
+        self._on_changed = on_changed if isinstance(on_changed, Event) else None
 
     def __add__(self, other) -> 'Vector2':
         if isinstance(other, Vector2):
-            return Vector2(self.x + other.x, self.y + other.y)
-        elif isinstance(other, numbers.Real):
-            return Vector2(self.x + other, self.y + other)
+            return _new_vector(self._x + other._x, self._y + other._y)
+        elif _is_real(other):
+            return _new_vector(self._x + other, self._y + other)
         Console.error("The value can only be a vector")
 
     def __sub__(self, other) -> 'Vector2':
         if isinstance(other, Vector2):
-            return Vector2(self.x - other.x, self.y - other.y)
-        elif isinstance(other, numbers.Real):
-            return Vector2(self.x - other, self.y - other)
+            return _new_vector(self._x - other._x, self._y - other._y)
+        elif _is_real(other):
+            return _new_vector(self._x - other, self._y - other)
         Console.error("The value can only be a vector")
 
     def __mul__(self, other) -> 'Vector2':
         if isinstance(other, Vector2):
-            return Vector2(self.x * other.x, self.y * other.y)
-        elif isinstance(other, numbers.Real):
-            return Vector2(self.x * other, self.y * other)
+            return _new_vector(self._x * other._x, self._y * other._y)
+        elif _is_real(other):
+            return _new_vector(self._x * other, self._y * other)
         Console.error("The value can only be a vector")
 
     def __truediv__(self, other) -> 'Vector2':
         if isinstance(other, Vector2):
-            return Vector2(
-                self.x / other.x if other.x != 0 else float('inf'),
-                self.y / other.y if other.y != 0 else float('inf')
+            return _new_vector(
+                self._x / other._x if other._x != 0 else float('inf'),
+                self._y / other._y if other._y != 0 else float('inf')
             )
-        elif isinstance(other, numbers.Real):
-            return Vector2(
-                self.x / other if other != 0 else float('inf'),
-                self.y / other if other != 0 else float('inf')
+        elif _is_real(other):
+            return _new_vector(
+                self._x / other if other != 0 else float('inf'),
+                self._y / other if other != 0 else float('inf')
             )
         Console.error("The value can only be a vector")
 
+    #region In-place
+    # in-place operators modify the vector itself and notify listeners once
+
+    def __iadd__(self, other) -> 'Vector2':
+        if isinstance(other, Vector2):
+            self._set(self._x + other._x, self._y + other._y)
+        elif _is_real(other):
+            self._set(self._x + other, self._y + other)
+        else:
+            Console.error("The value can only be a vector")
+        return self
+
+    def __isub__(self, other) -> 'Vector2':
+        if isinstance(other, Vector2):
+            self._set(self._x - other._x, self._y - other._y)
+        elif _is_real(other):
+            self._set(self._x - other, self._y - other)
+        else:
+            Console.error("The value can only be a vector")
+        return self
+
+    def __imul__(self, other) -> 'Vector2':
+        if isinstance(other, Vector2):
+            self._set(self._x * other._x, self._y * other._y)
+        elif _is_real(other):
+            self._set(self._x * other, self._y * other)
+        else:
+            Console.error("The value can only be a vector")
+        return self
+
+    def __itruediv__(self, other) -> 'Vector2':
+        result = self / other
+        if result is not None:
+            self._set(result._x, result._y)
+        return self
+    #endregion
+
     def __eq__(self, other) -> bool:
-        return isinstance(other, Vector2) and self.x == other.x and self.y == other.y
+        return isinstance(other, Vector2) and self._x == other._x and self._y == other._y
 
     def __repr__(self) -> str:
-        return f"Vector2({self.x}, {self.y})"
+        return f"Vector2({self._x}, {self._y})"
+
+    def _set(self, x: numbers.Real, y: numbers.Real) -> None:
+        if x != self._x or y != self._y:
+            self._x = x
+            self._y = y
+            if self._on_changed is not None:
+                self._on_changed.invoke()
 
     @property
     def x(self) -> float:
@@ -59,9 +114,9 @@ class Vector2:
 
     @x.setter
     def x(self, value: numbers.Real) -> None:
-        if isinstance(value, numbers.Real):
+        if _is_real(value) and value != self._x:
             self._x = value
-            if isinstance(self._on_changed, Event):
+            if self._on_changed is not None:
                 self._on_changed.invoke()
 
     @property
@@ -70,17 +125,24 @@ class Vector2:
 
     @y.setter
     def y(self, value: numbers.Real) -> None:
-        if isinstance(value, numbers.Real):
+        if _is_real(value) and value != self._y:
             self._y = value
-            if isinstance(self._on_changed, Event):
+            if self._on_changed is not None:
                 self._on_changed.invoke()
 
     @property
     def xy(self) -> tuple[float, float]:
         return (self._x, self._y)
 
+    @property
+    def on_changed(self) -> Event:
+        """Event invoked whenever a component of the vector changes."""
+        if self._on_changed is None:
+            self._on_changed = Event([])
+        return self._on_changed
+
     def magnitude(self) -> float:
-        return math.hypot(self.x, self.y)
+        return math.hypot(self._x, self._y)
 
     def normalize(self) -> 'Vector2':
         mag = self.magnitude()
@@ -88,5 +150,20 @@ class Vector2:
             return Vector2(0, 0)
         return self / mag
 
+    def copy(self) -> 'Vector2':
+        """Returns a vector with the same components and no listeners."""
+        return _new_vector(self._x, self._y)
+
+
+_new_object: Callable[[type], Vector2] = object.__new__
+
+def _new_vector(x: numbers.Real, y: numbers.Real) -> Vector2:
+    """Creates a vector from already validated components, skipping `__init__`."""
+    vector = _new_object(Vector2)
+    vector._x = x
+    vector._y = y
+    vector._on_changed = None
+    return vector
+
 zero_vector = Vector2(0, 0)
-unit_vector = Vector2(1, 1)
\ No newline at end of file
+unit_vector = Vector2(1, 1)
@@ -1,17 +1,25 @@
 import pygame
 import numbers
 
-from .math.vector2 import Vector2, zero_vector, unit_vector
+from .math.vector2 import Vector2, zero_vector, unit_vector, _new_vector
 from .tools.console import Console, CallerInfo
 from .ui.align import Align
 from .ui.transform import Transform
 from .screen import Screen
 
+from .utils.layers import LayerList
+from .utils.event import Event
+from .input import PointerEvent, PointerEventType, PointerListener
+
 from typing import Union
-from collections import defaultdict
 
 
 class BaseObject:
+
+    _bitmap_scratch: pygame.Surface = None # shared offscreen surface used to rebuild bitmap caches
+    _pool: 'ObjectPool' = None # pool the object goes back to when destroyed, see `Scene.pool`
+    _pooled: bool = False # destroyed and waiting in its pool
+    _serializable: bool = True # saved by `SceneFile` with its children
     
     def __init__(
             self, *,
@@ -25,6 +33,7 @@ class BaseObject:
             size: Vector2 = None,
             align: Align = Align.MIDDLE,
             layer: int = 0,
+            cache_as_bitmap: bool = False,
             **kwargs: dict[str, object]) -> None:
 
         global Scene
@@ -33,10 +42,32 @@ class BaseObject:
         # ======
         self._name: str                     = name
         self._parent: BaseObject            = parent if isinstance(parent, BaseObject) else None
-        self.__children: list[BaseObject]   = []
-        self.__sorted_children: dict[int, list[BaseObject]] = {}
+        self.__children: LayerList          = LayerList() # ordered by layer
         self._root_caller_info: CallerInfo  = Console._get_root_caller_info()
 
+        # cached world transform, recomputed lazily when dirty
+        self._world_dirty: bool             = True
+        self._world_version: int            = -1
+        self._world_position: Vector2       = None
+        self._world_scale: Vector2          = None
+        self._world_rotation: numbers.Real  = 0
+        self._align_offset: Vector2         = None
+        self._refurbish_pending: bool       = False
+        self._store_row: int                = None # row in the scene's TransformStore, if any
+
+        # screen bounds, refreshed lazily before drawing and used by culling and the dirty rects mode
+        self._bounds_dirty: bool            = False
+        self._drawn_bounds: pygame.Rect     = None
+        self._subtree_bounds: pygame.Rect   = None
+        self._subtree_count: int            = 1
+        self._pointer_listeners: dict[tuple[PointerEventType, bool], Event] = None # created on demand
+
+        # retained rendering of the whole subtree, see `cache_as_bitmap`
+        self._cache_as_bitmap: bool         = False
+        self._bitmap_dirty: bool            = True
+        self._bitmap_surface: pygame.Surface = None
+        self._bitmap_position: tuple[int, int] = (0, 0)
+
         self._active: bool                  = active if isinstance(active, bool) else True
 
         self._transform                     = Transform(
@@ -44,7 +75,8 @@ class BaseObject:
             scale=scale,
             rotation=rotation,
             size=size,
-            on_property_changed_callback=self._refurbish_interior
+            on_property_changed_callback=self._on_transform_changed,
+            on_layout_changed_callback=self._invalidate_world_transform
         )
         self._align: Align                  = align if isinstance(align, Align) else Align.MIDDLE
         self._layer: int                    = layer if isinstance(layer, int) else 0
@@ -52,6 +84,14 @@ class BaseObject:
 
         self.__scene: Scene = scene
 
+        self.__attach(kwargs.get("children", None), cache_as_bitmap)
+    
+    def __str__(self) -> str:
+        return f"Object({self._name=}, {self._parent=})"
+    
+    #region Private
+    def __attach(self, children: list['BaseObject'] | None, cache_as_bitmap: bool) -> None:
+        """Adds the object to its parent or to the scene, with its children."""
         if self._parent and isinstance(self._parent, BaseObject):
             self._parent.add_child(self)
         else:
@@ -59,21 +99,24 @@ class BaseObject:
                 self.__scene._add_object(self)
             else:
                 raise Exception("Create a scene to create objects")
+        self._damage() # drawn where nothing was drawn before
+
+        if self.__scene._transform_store is not None:
+            self.__scene._transform_store.mark_dirty(self)
+        if type(self).update_async is not BaseObject.update_async:
+            self.__scene._add_async_object(self)
             
-        self.__initialize_children(kwargs.get("children", None))
-    
-    def __str__(self) -> str:
-        return f"Object({self._name=}, {self._parent=})"
-    
-    #region Private
+        self.__initialize_children(children)
+
+        if cache_as_bitmap is True:
+            self.cache_as_bitmap = True
+
     def __initialize_children(self, children: list['BaseObject'] | None) -> None:
         if children is None:
             return
         
         for child in children:
-            self.add_child(child, resort_objects=False)
-        
-        self._sort_children()
+            self.add_child(child)
     
     def _get_align_offset_root(self, container_size: Vector2) -> Vector2:
         """
@@ -169,16 +212,329 @@ class BaseObject:
             parent_size = self._parent._transform._size
             return self._get_align_offset_child(parent_size)
 
-    def _sort_children(self) -> None:
-        layers_dict = defaultdict(list)
-        for obj in self.__children:
-            layers_dict[obj.layer].append(obj)
+    def _invalidate_world_transform(self) -> None:
+        """
+        Marks the cached world transform of the object and all its descendants as dirty.
+        Already dirty branches are skipped, since their descendants are dirty as well.
+        """
+        scene = self.__scene
+        report_damage = scene._dirty_rects
+        self._invalidate_bitmap_caches()
+        self._invalidate_bounds()
+        if scene._transform_store is not None:
+            scene._transform_store.mark_dirty(self)
+
+        stack = [self]
+        while stack:
+            obj = stack.pop()
+            if obj._world_dirty:
+                continue
+            obj._world_dirty = True
+            obj._bitmap_dirty = True
+            obj._bounds_dirty = True
+            if report_damage:
+                scene._damage_object(obj)
+            stack.extend(obj.__children)
+
+    def _update_world_transform(self) -> None:
+        """
+        Brings the cached world transform up to date.
+        Walks up the parent chain only to the first valid cache and then recomputes
+        the stale part top-down, so a clean object is resolved in O(1).
+        """
+        version = Screen.Instance._layout_version
+        stale: list[BaseObject] = []
+        obj = self
+        while obj is not None and (obj._world_dirty or obj._world_version != version):
+            stale.append(obj)
+            obj = obj._parent
+
+        for obj in reversed(stale):
+            obj._compute_world_transform(version)
+
+    def _compute_world_transform(self, version: int) -> None:
+        """
+        Recomputes the world transform of the object, assuming the parent's cache is valid.
+        Reads it from the scene's TransformStore instead when the store is up to date.
+        """
+        store = self.__scene._transform_store
+        if store is not None and self._store_row is not None and store.is_synced:
+            x, y, scale_x, scale_y, rotation, offset_x, offset_y = store.read(self)
+            self._world_position = _new_vector(x, y)
+            self._world_scale = _new_vector(scale_x, scale_y)
+            self._world_rotation = rotation
+            self._align_offset = _new_vector(offset_x, offset_y)
+            self._world_version = version
+            self._world_dirty = False
+            return
+
+        transform = self._transform
+        self._align_offset = self._get_align_offset()
+
+        if self._parent is not None:
+            parent = self._parent
+            self._world_position = parent._world_position + self._align_offset
+            self._world_position += transform._position
+            self._world_scale = transform._scale * parent._world_scale
+            self._world_rotation = transform._rotation + parent._world_rotation
+        else:
+            self._world_position = self._align_offset + transform._position
+            self._world_scale = transform._scale.copy()
+            self._world_rotation = transform._rotation
+
+        self._world_version = version
+        self._world_dirty = False
+
+    def _on_transform_changed(self) -> None:
+        self._invalidate_world_transform()
+        self._request_refurbish(subtree=True)
+
+    def _request_refurbish(self, subtree: bool = False) -> None:
+        """
+        Schedules the object (and its descendants if `subtree` is set) to be refurbished
+        once before the next draw pass, no matter how many properties change until then.
+        """
+        stack = [self]
+        while stack:
+            obj = stack.pop()
+            if not obj._refurbish_pending:
+                obj._refurbish_pending = True
+                obj.__scene._queue_refurbish(obj)
+            if subtree:
+                stack.extend(obj.__children)
+
+    def _flush_refurbish(self) -> None:
+        if self._refurbish_pending:
+            self._refurbish_pending = False
+            self._refurbish_interior()
+            self._invalidate_bitmap_caches()
+            self._invalidate_bounds()
+            self._damage()
+
+    def _invalidate_bitmap_caches(self) -> None:
+        """Marks the bitmap caches of the object and of all its ancestors as outdated."""
+        if not self.__scene._bitmap_caches:
+            return
+
+        obj = self
+        while obj is not None:
+            obj._bitmap_dirty = True
+            obj = obj._parent
+
+    def _rebuild_bitmap_cache(self) -> None:
+        """
+        Draws the subtree into the shared scratch surface and keeps a copy of the area it covers.
+        """
+        bounds = self._refresh_bounds()
+        screen = Screen.Instance._screen
+        bounds = bounds.clip(screen.get_rect()) if bounds is not None else None
+
+        self._bitmap_dirty = False
+        if bounds is None or bounds.width <= 0 or bounds.height <= 0:
+            self._bitmap_surface = None
+            return
+
+        scratch = BaseObject._bitmap_scratch
+        if scratch is None or scratch.get_size() != screen.get_size():
+            scratch = BaseObject._bitmap_scratch = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+
+        scratch.fill((0, 0, 0, 0), bounds)
+        scratch.set_clip(bounds)
+        self.draw(scratch)
+        scratch.set_clip(None)
+
+        self._bitmap_surface = scratch.subsurface(bounds).copy()
+        self._bitmap_position = bounds.topleft
+
+    def _render(self, surface: pygame.Surface) -> None:
+        """
+        Draws the object with its children, using the bitmap cache when it is enabled.\n
+        Scenes and parents call it instead of `draw` directly.
+        """
+        if not self._cache_as_bitmap:
+            self.draw(surface)
+            return
+
+        if self._bitmap_dirty:
+            # an ancestor is being rebuilt into the scratch surface, which must not be reused here
+            if surface is BaseObject._bitmap_scratch:
+                self.draw(surface)
+                return
+            self._rebuild_bitmap_cache()
+        if self._bitmap_surface is not None:
+            surface.blit(self._bitmap_surface, self._bitmap_position)
+
+    def _damage(self, subtree: bool = False) -> None:
+        """
+        Reports the object (and its descendants if `subtree` is set) to the scene
+        as changed on screen. Does nothing unless the scene uses dirty rects.
+        """
+        scene = self.__scene
+        if not scene._dirty_rects:
+            return
+
+        stack = [self]
+        while stack:
+            obj = stack.pop()
+            scene._damage_object(obj)
+            if subtree:
+                stack.extend(obj.__children)
+
+    def _get_screen_bounds(self) -> pygame.Rect | None:
+        """
+        Returns the screen area covered by what the object itself draws (without children),
+        including its rotation and scale.\n
+        Objects overriding `draw` should override it as well, otherwise they are assumed
+        to cover the whole screen and are never culled.
+        """
+        if type(self).draw is BaseObject.draw:
+            return None
+        return Screen.Instance._screen.get_rect()
+
+    def _invalidate_bounds(self) -> None:
+        """
+        Marks the screen bounds of the object and the subtree bounds of all its ancestors
+        as outdated. Stops at the first ancestor that is already marked.
+        """
+        self._bounds_dirty = True
+        obj = self
+        while obj._parent is not None:
+            obj = obj._parent
+            if obj._bounds_dirty:
+                return
+            obj._bounds_dirty = True
+        obj.__scene._invalidate_root_bounds(obj)
+
+    def _refresh_bounds(self, damaged: dict['BaseObject', None] = None, damage: list[pygame.Rect] = None) -> pygame.Rect | None:
+        """
+        Recomputes the screen bounds of the outdated part of the subtree and adds the new bounds
+        of the objects found in `damaged` to `damage`.
+        Returns the bounds of the whole subtree.
+        """
+        order: list[BaseObject] = []
+        stack = [self]
+        while stack:
+            obj = stack.pop()
+            if obj._bounds_dirty:
+                order.append(obj)
+                stack.extend(obj.__children)
+
+        # children are visited before their parents
+        for obj in reversed(order):
+            obj._update_world_transform()
+            bounds = obj._get_screen_bounds()
+            if damage is not None and bounds is not None and obj in damaged:
+                damage.append(bounds)
+            obj._drawn_bounds = bounds
 
-        self.__sorted_children = dict(sorted(layers_dict.items()))
+            subtree_bounds = bounds.copy() if bounds is not None else None
+            count = 1
+            for child in obj.__children:
+                count += child._subtree_count
+                if child._subtree_bounds is None:
+                    continue
+                if subtree_bounds is None:
+                    subtree_bounds = child._subtree_bounds.copy()
+                else:
+                    subtree_bounds.union_ip(child._subtree_bounds)
+            obj._subtree_bounds = subtree_bounds
+            obj._subtree_count = count
+            obj._bounds_dirty = False
+
+        return self._subtree_bounds
+
+    def _hit_test(self, point: tuple[int, int]) -> bool:
+        """Whether the pointer at `point` is over what the object itself draws."""
+        return self._drawn_bounds is not None and self._drawn_bounds.collidepoint(point)
+
+    def _pick(self, point: tuple[int, int]) -> 'BaseObject | None':
+        """Returns the topmost object of the subtree drawn at `point`, children are drawn over their parent."""
+        for child in reversed(self.__children):
+            bounds = child._subtree_bounds
+            if bounds is not None and bounds.collidepoint(point):
+                found = child._pick(point)
+                if found is not None:
+                    return found
+        return self if self._hit_test(point) else None
+
+    def _invoke_pointer_listeners(self, event: PointerEvent, capture: bool) -> None:
+        listeners = self._pointer_listeners
+        if listeners is None:
+            return
+        handlers = listeners.get((event.type, capture))
+        if handlers is not None:
+            event.current_target = self
+            handlers.invoke(event)
+
+    def _update_child_layer(self, child: 'BaseObject') -> None:
+        self.__children.update_layer(child)
+        self._invalidate_bitmap_caches()
+        self.__scene._invalidate()
     
+    def _is_active_in_hierarchy(self) -> bool:
+        obj = self
+        while obj is not None:
+            if not obj._active:
+                return False
+            obj = obj._parent
+        return True
+
+    def _reset(
+            self, *,
+            name: str,
+            parent: 'BaseObject' = None,
+            active: bool = True,
+            position: Vector2 = None,
+            scale: Vector2 = None,
+            rotation: numbers.Real = 0,
+            size: Vector2 = None,
+            align: Align = Align.MIDDLE,
+            layer: int = 0,
+            cache_as_bitmap: bool = False,
+            **kwargs: dict[str, object]) -> None:
+        """
+        Gives a destroyed object taken from its `ObjectPool` the state the constructor would give it
+        with the same arguments and adds it back to the scene, reusing its transform and vectors.\n
+        Subclasses keeping state of their own override it, calling `super()._reset(**kwargs)` first.
+        """
+        self._name = name
+        self._parent = parent if isinstance(parent, BaseObject) else None
+
+        self._world_dirty = True
+        self._world_version = -1
+        self._world_position = None
+        self._world_scale = None
+        self._world_rotation = 0
+        self._align_offset = None
+        self._refurbish_pending = False
+
+        self._bounds_dirty = False
+        self._drawn_bounds = None
+        self._subtree_bounds = None
+        self._subtree_count = 1
+
+        self._bitmap_dirty = True
+        self._bitmap_surface = None
+
+        self._active = active if isinstance(active, bool) else True
+
+        # written directly, the object is not in the scene to be notified yet
+        transform = self._transform
+        transform._position._x, transform._position._y = (position._x, position._y) if isinstance(position, Vector2) else (0, 0)
+        transform._scale._x, transform._scale._y = (scale._x, scale._y) if isinstance(scale, Vector2) else (1, 1)
+        transform._rotation = rotation if isinstance(rotation, numbers.Real) else 0
+        transform._size._x, transform._size._y = (size._x, size._y) if isinstance(size, Vector2) else Transform.DEFAULT_SIZE.xy
+        self._align = align if isinstance(align, Align) else Align.MIDDLE
+        self._layer = layer if isinstance(layer, int) else 0
+
+        self.__attach(kwargs.get("children", None), cache_as_bitmap)
+
     def _refurbish_interior(self) -> None:
-        for child in self.__children:
-            child._refurbish_interior()
+        """
+        Rebuilds the render state of this object only.
+        Called by the scene for objects queued with `_request_refurbish`.
+        """
+        ...
     #endregion
 
     #region Properties
@@ -193,6 +549,15 @@ class BaseObject:
     @property
     def parent(self) -> 'BaseObject':
         return self._parent
+
+    @property
+    def scene(self) -> 'Scene':
+        return self.__scene
+
+    @property
+    def children(self) -> tuple['BaseObject', ...]:
+        """The children of the object ordered by layer."""
+        return self.__children.snapshot()
     
     @property
     def active(self) -> bool:
@@ -206,6 +571,22 @@ class BaseObject:
     def layer(self) -> int:
         return self._layer
 
+    @property
+    def cache_as_bitmap(self) -> bool:
+        """
+        If enabled, the object and its descendants are drawn once into an offscreen surface,
+        which is then blitted every frame until something inside the subtree changes.
+        """
+        return self._cache_as_bitmap
+
+    @property
+    def bitmap_cache_bytes(self) -> int:
+        """Memory occupied by the bitmap cache of the object, in bytes."""
+        surface = self._bitmap_surface
+        if surface is None:
+            return 0
+        return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
     @property
     def global_position(self) -> Vector2:
         """
@@ -213,27 +594,22 @@ class BaseObject:
         1. The position of the parent (if any)
         2. Alignment relative to the parent
         3. The local position of the object
+
+        The value is cached and only recomputed after the transform, align or
+        parent of the object (or of one of its ancestors) changes.
         """
-        align_offset = self._get_align_offset()
-        
-        if self._parent:
-            # Global position = parent position + alignment offset + local position
-            return self._parent.global_position + align_offset + self._transform.position
-        else:
-            # Root object: alignment offset + local position
-            return align_offset + self._transform.position
+        self._update_world_transform()
+        return self._world_position.copy()
 
     @property
     def global_scale(self) -> Vector2:
-        if self._parent:
-            return self._transform._scale * self._parent.global_scale
-        return self._transform._scale
+        self._update_world_transform()
+        return self._world_scale.copy()
     
     @property
-    def global_rotation(self) -> Vector2:
-        if self._parent:
-            return self._transform._rotation + self._parent.global_rotation
-        return self._transform._rotation
+    def global_rotation(self) -> numbers.Real:
+        self._update_world_transform()
+        return self._world_rotation
     #endregion
     
     #region Setters
@@ -241,6 +617,9 @@ class BaseObject:
     def transform(self, value: Transform) -> None:
         if isinstance(value, Transform):
             self._transform = value
+            value._on_property_changed.add_listener(self._on_transform_changed)
+            value._on_layout_changed.add_listener(self._invalidate_world_transform)
+            self._on_transform_changed()
         else:
             Console.error(f"Expected value for 'transform', got {type(value).__name__}")
     
@@ -271,6 +650,9 @@ class BaseObject:
     def active(self, value: bool) -> None:
         if isinstance(value, bool):
             
+            if value != self._active:
+                self._damage(subtree=True)
+
             # activating object
             if value and not self._active:
                 # activation: 0 = child, 1 = root
@@ -289,19 +671,34 @@ class BaseObject:
     @align.setter
     def align(self, value: Align) -> None:
         if isinstance(value, Align):
-            self._align = value
+            if value != self._align:
+                self._align = value
+                self._invalidate_world_transform()
         else:
             Console.error(f"Expected value for 'align', got {type(value).__name__}")
     
+    @cache_as_bitmap.setter
+    def cache_as_bitmap(self, value: bool) -> None:
+        if isinstance(value, bool):
+            if value != self._cache_as_bitmap:
+                self._cache_as_bitmap = value
+                self._bitmap_dirty = True
+                self._bitmap_surface = None
+                self.__scene._bitmap_caches += 1 if value else -1
+        else:
+            Console.error(f"Expected bool for 'cache_as_bitmap', got {type(value).__name__}")
+
     @layer.setter
     def layer(self, value: int) -> None:
         if isinstance(value, int):
             if value != self._layer:
                 self._layer = value
                 if self._parent is not None:
-                    self._parent._sort_children()
+                    self._parent._update_child_layer(self)
                 else:
-                    self.__scene._sort_objects()
+                    self.__scene._update_object_layer(self)
+                # the subtree is drawn over or under other objects now
+                self._damage(subtree=True)
         else:
             Console.error(f"Expected value for 'layer', got {type(value).__name__}")
     #endregion
@@ -315,25 +712,41 @@ class BaseObject:
         references. After calling this method, the object should no longer be used.
         
         Args:
-            remove_from_parent: If True, removes this object from its parent's
-                            children list. Set to False when destroying children
-                            recursively to avoid modifying the parent's list
-                            during iteration.
+            remove_from_parent: If True, detaches this object from its parent.
+                            Set to False when destroying children recursively,
+                            since the whole subtree is discarded anyway.
         
         Note:
             All child objects are destroyed automatically. You don't need to
             manually destroy them before destroying the parent.
+            Objects acquired from a pool (see `Scene.pool`) go back to it
+            to be reused, so they must not be used after being destroyed either.
         """
+        # before the parent is cleared, the pointer moves over to it
+        self.__scene._input._forget(self)
         if self._parent:
             self._parent.remove_child(self, remove_from_parent)
         else:
             self.__scene._remove_object(self)
 
+        self._refurbish_pending = False
+        self._damage()
+        if self._pointer_listeners is not None:
+            self.__scene._input._listeners -= sum(len(event._listeners) for event in self._pointer_listeners.values())
+            self._pointer_listeners = None
+        self.__scene._forget_activation(self)
+        self.__scene._remove_async_object(self)
+        self.cache_as_bitmap = False
+        if self.__scene._transform_store is not None:
+            self.__scene._transform_store.remove(self)
+
         for obj in self.__children:
             obj.destroy(False)
 
         self.__children.clear()
-        self.__sorted_children.clear()
+
+        if self._pool is not None:
+            self._pool._release(self)
 
     def root_object(self) -> 'BaseObject':
         """
@@ -351,20 +764,52 @@ class BaseObject:
             obj = obj.parent
         return obj
 
-    def add_child(self, child: 'BaseObject', update_parent: bool = True, resort_objects: bool = True) -> None:
+    def add_child(self, child: 'BaseObject', update_parent: bool = True) -> None:
         if isinstance(child, BaseObject) and (child not in self.__children or not update_parent):
             if update_parent: child._parent = self
-            self.__children.append(child)
-            if resort_objects:
-                self._sort_children()
+            self.__children.add(child)
+            child._invalidate_world_transform()
         else:
             Console.error("add_child: child must be an BaseObject")
 
+    def add_pointer_listener(self, type: PointerEventType, callback: PointerListener, capture: bool = False) -> None:
+        """
+        Calls `callback` with a `PointerEvent` of the given type when it reaches the object.\n
+        Capture listeners are called while the event travels down from the root to its target,
+        the others while it bubbles back up. Events of the children therefore reach their parents too.
+        """
+        if not isinstance(type, PointerEventType):
+            Console.error(f"Expected PointerEventType for 'type', got {type.__class__.__name__}")
+            return
+        if not callable(callback):
+            Console.error("add_pointer_listener: callback must be callable")
+            return
+
+        if self._pointer_listeners is None:
+            self._pointer_listeners = {}
+        event = self._pointer_listeners.get((type, bool(capture)))
+        if event is None:
+            event = self._pointer_listeners[(type, bool(capture))] = Event([])
+
+        if callback not in event._listeners:
+            event.add_listener(callback)
+            self.__scene._input._listeners += 1
+
+    def remove_pointer_listener(self, type: PointerEventType, callback: PointerListener, capture: bool = False) -> None:
+        if self._pointer_listeners is None:
+            return
+        event = self._pointer_listeners.get((type, bool(capture)))
+        if event is not None and callback in event._listeners:
+            event.remove_listener(callback)
+            self.__scene._input._listeners -= 1
+
     def remove_child(self, child: 'BaseObject', update_parent: bool = True) -> None:
         if isinstance(child, BaseObject):
             if update_parent: child._parent = None
             self.__children.remove(child)
-            self._sort_children()
+            child._invalidate_world_transform()
+            self._invalidate_bitmap_caches()
+            self._invalidate_bounds()
         else:
             Console.error("remove_child: child must be an BaseObject")
     #endregion
@@ -385,9 +830,22 @@ class BaseObject:
             to ensure child objects are properly updated. Place it at the beginning
             or end of the method depending on your update logic.
         """
-        for layer in self.__sorted_children:
-            for obj in self.__sorted_children[layer]:
+        profiler = self.__scene._object_profiler
+        if profiler is None:
+            for obj in self.__children:
                 obj.update()
+        else:
+            for obj in self.__children:
+                profiler._update(obj)
+
+    async def update_async(self) -> None:
+        """
+        Asynchronous counterpart of `update`, awaited after it on every update when the scene
+        runs with `Scene.start_async`. The hooks of all objects are awaited concurrently and
+        the frame continues once all of them finished; use `Scene.spawn` for longer work.\n
+        Unlike `update` it is called directly by the scene, so there is no need to call `super()`.
+        Not called by the blocking `Scene.start` loop.
+        """
 
     def draw(self, surface: pygame.Surface) -> None:
         """
@@ -405,7 +863,25 @@ class BaseObject:
             at the beginning or end of the method, depending on whether the child objects should be\n
             drawn before or after the current object.
         """
-        for layer in self.__sorted_children:
-            for obj in self.__sorted_children[layer]:
-                obj.draw(surface)
+        if not self.__children:
+            return
+
+        scene = self.__scene
+        render = BaseObject._render if scene._object_profiler is None else scene._object_profiler._render
+
+        if scene._culling or scene._dirty_rects:
+            # skip children whose subtree lies outside of the drawn area
+            clip = surface.get_clip()
+            for obj in self.__children:
+                bounds = obj._subtree_bounds
+                if bounds is None:
+                    continue
+                if clip.colliderect(bounds):
+                    render(obj, surface)
+                else:
+                    scene._culled_objects += obj._subtree_count
+            return
+
+        for obj in self.__children:
+            render(obj, surface)
     #endregion
\ No newline at end of file
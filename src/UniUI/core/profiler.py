@@ -0,0 +1,236 @@
+import json
+import pygame
+import pygame.freetype
+
+from collections import deque
+from time import perf_counter
+
+from .tools.console import Console
+
+
+class Profiler:
+    """
+    Frame profiler of a scene, available as `scene.profiler`.\n
+    When `enabled`, every phase of `Scene.start` is timed; with `objects` also set, the
+    `update` and `draw` of every object are timed and attributed by class and name.
+    The measurements are kept for the last `window` frames.
+    A disabled profiler costs a single check per frame.
+    """
+
+    PHASES = ("tick", "events", "update", "activation", "refurbish", "draw", "overlay", "present")
+    DEFAULT_WINDOW = 120
+    OVERLAY_OBJECTS = 5 # slowest objects listed by the overlay
+    OVERLAY_REFRESH = 15 # frames between the updates of the overlay text
+
+    def __init__(self, scene: 'Scene', window: int = DEFAULT_WINDOW) -> None:
+        self._scene = scene
+        self._enabled: bool = False
+        self._objects: bool = False
+        self._overlay: bool = False
+
+        self._frames: deque[tuple[dict[str, float], dict[tuple[str, str], list[float]]]] = deque(maxlen=max(1, window))
+        self._phases: dict[str, float] = {}
+        self._object_times: dict[tuple[str, str], list[float]] = {}
+        self._children_time: list[float] = [] # time spent in the children of the objects being timed
+        self._last_mark: float = 0.0
+
+        self._font: pygame.freetype.Font = None
+        self._overlay_rect: pygame.Rect = None
+        self._overlay_lines: list[str] = []
+        self._overlay_age: int = 0
+
+    #region Private
+    def _begin_frame(self) -> None:
+        self._phases = dict.fromkeys(Profiler.PHASES, 0.0)
+        self._object_times = {}
+        # switched only between frames, so that a frame is timed either fully or not at all
+        self._scene._object_profiler = self if self._objects else None
+        self._last_mark = perf_counter()
+
+    def _mark(self, phase: str) -> None:
+        """Attributes the time since the previous mark to `phase`."""
+        now = perf_counter()
+        self._phases[phase] += now - self._last_mark
+        self._last_mark = now
+
+    def _end_frame(self) -> None:
+        self._frames.append((self._phases, self._object_times))
+
+    def _record(self, obj: 'BaseObject', index: int, start: float) -> None:
+        elapsed = perf_counter() - start
+        children = self._children_time.pop()
+        if self._children_time:
+            self._children_time[-1] += elapsed
+
+        key = (type(obj).__name__, obj.name)
+        times = self._object_times.get(key)
+        if times is None:
+            # update total, update self, draw total, draw self
+            times = self._object_times[key] = [0.0, 0.0, 0.0, 0.0]
+        times[index] += elapsed
+        times[index + 1] += elapsed - children
+
+    def _update(self, obj: 'BaseObject') -> None:
+        self._children_time.append(0.0)
+        start = perf_counter()
+        obj.update()
+        self._record(obj, 0, start)
+
+    def _render(self, obj: 'BaseObject', surface: pygame.Surface) -> None:
+        self._children_time.append(0.0)
+        start = perf_counter()
+        obj._render(surface)
+        self._record(obj, 2, start)
+
+    def _format_overlay(self) -> list[str]:
+        snapshot = self.snapshot()
+        frame = snapshot["frame_ms"]
+        lines = [f"frame {frame['mean']:6.2f} ms  max {frame['max']:6.2f} ms  ({snapshot['frames']} frames)"]
+        lines += [f"{name:<11}{phase['mean']:6.2f} ms" for name, phase in snapshot["phases_ms"].items()]
+        for entry in snapshot["objects"][:Profiler.OVERLAY_OBJECTS]:
+            lines.append(f"{entry['class']}:{entry['name']}"[:28].ljust(29) + f"{entry['self_ms']:6.2f} ms")
+        return lines
+
+    def _draw_overlay(self, surface: pygame.Surface, rects: list[pygame.Rect] | None) -> list[pygame.Rect] | None:
+        """Draws the overlay in the top left corner and adds its area to the screen areas to update."""
+        if self._font is None:
+            self._font = pygame.freetype.SysFont("monospace", 12)
+            self._font.origin = False
+
+        # the snapshot is too expensive to be taken every frame
+        self._overlay_age -= 1
+        if self._overlay_age <= 0:
+            self._overlay_age = Profiler.OVERLAY_REFRESH
+            self._overlay_lines = self._format_overlay()
+
+        line_height = self._font.get_sized_height() + 2
+        rows = 1 + len(Profiler.PHASES) + Profiler.OVERLAY_OBJECTS
+        # the size is fixed, so in the dirty rects mode the box always covers its previous content
+        rect = pygame.Rect(0, 0, 360, rows * line_height + 8)
+
+        surface.fill((0, 0, 0), rect)
+        for i, line in enumerate(self._overlay_lines):
+            self._font.render_to(surface, (6, 4 + i * line_height), line, (0, 255, 0))
+
+        self._overlay_rect = rect
+        if rects is not None:
+            rects = rects + [rect]
+        return rects
+    #endregion
+
+    #region Properties
+    @property
+    def enabled(self) -> bool:
+        """Whether the phases of every frame are timed."""
+        return self._enabled
+
+    @property
+    def objects(self) -> bool:
+        """Whether the `update` and `draw` of every object are timed, requires `enabled`."""
+        return self._objects
+
+    @property
+    def overlay(self) -> bool:
+        """Whether the measurements are drawn on top of the scene, requires `enabled`."""
+        return self._overlay
+
+    @property
+    def window(self) -> int:
+        """Number of the last frames the measurements are kept for."""
+        return self._frames.maxlen
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        if isinstance(value, bool):
+            self._enabled = value
+            if not value and self._overlay_rect is not None:
+                self._overlay_rect = None
+                self._scene._redraw_all()
+        else:
+            Console.error(f"Expected bool for 'enabled', got {type(value).__name__}")
+
+    @objects.setter
+    def objects(self, value: bool) -> None:
+        if isinstance(value, bool):
+            self._objects = value
+        else:
+            Console.error(f"Expected bool for 'objects', got {type(value).__name__}")
+
+    @overlay.setter
+    def overlay(self, value: bool) -> None:
+        if isinstance(value, bool):
+            self._overlay = value
+            if not value and self._overlay_rect is not None:
+                self._overlay_rect = None
+                self._scene._redraw_all()
+        else:
+            Console.error(f"Expected bool for 'overlay', got {type(value).__name__}")
+
+    @window.setter
+    def window(self, value: int) -> None:
+        if isinstance(value, int) and value > 0:
+            self._frames = deque(self._frames, maxlen=value)
+        else:
+            Console.error(f"Expected positive int for 'window', got {value!r}")
+    #endregion
+
+    #region Public
+    def reset(self) -> None:
+        """Forgets all the measurements."""
+        self._frames.clear()
+
+    def snapshot(self) -> dict[str, object]:
+        """
+        Returns the measurements of the window: the frame and phase times (mean, max and
+        last, in milliseconds) and the objects sorted by their own time per frame, slowest first.
+        """
+        frames = len(self._frames)
+        if not frames:
+            empty = {"mean": 0.0, "max": 0.0, "last": 0.0}
+            return {"frames": 0, "frame_ms": empty, "phases_ms": {name: empty for name in Profiler.PHASES}, "objects": [], "classes": {}}
+
+        def stats(values: list[float]) -> dict[str, float]:
+            return {"mean": sum(values) / frames * 1000, "max": max(values) * 1000, "last": values[-1] * 1000}
+
+        phases = {name: stats([frame[0][name] for frame in self._frames]) for name in Profiler.PHASES}
+        frame = stats([sum(frame[0].values()) for frame in self._frames])
+
+        totals: dict[tuple[str, str], list[float]] = {}
+        for _, object_times in self._frames:
+            for key, times in object_times.items():
+                total = totals.get(key)
+                if total is None:
+                    totals[key] = list(times)
+                else:
+                    for i in range(4):
+                        total[i] += times[i]
+
+        objects = []
+        classes: dict[str, dict[str, float]] = {}
+        for (class_name, name), (update, update_self, draw, draw_self) in totals.items():
+            entry = {
+                "class": class_name,
+                "name": name,
+                "update_ms": update / frames * 1000,
+                "update_self_ms": update_self / frames * 1000,
+                "draw_ms": draw / frames * 1000,
+                "draw_self_ms": draw_self / frames * 1000,
+                "self_ms": (update_self + draw_self) / frames * 1000,
+            }
+            objects.append(entry)
+
+            summary = classes.setdefault(class_name, {"objects": 0, "update_self_ms": 0.0, "draw_self_ms": 0.0, "self_ms": 0.0})
+            summary["objects"] += 1
+            summary["update_self_ms"] += entry["update_self_ms"]
+            summary["draw_self_ms"] += entry["draw_self_ms"]
+            summary["self_ms"] += entry["self_ms"]
+
+        objects.sort(key=lambda entry: entry["self_ms"], reverse=True)
+        return {"frames": frames, "frame_ms": frame, "phases_ms": phases, "objects": objects, "classes": classes}
+
+    def dump(self, path: str) -> None:
+        """Writes the current snapshot to `path` as JSON."""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"scene": self._scene.name, **self.snapshot()}, file, indent=2)
+        Console.log(f"The profile of the scene '{self._scene.name}' has been saved to {path}")
+    #endregion
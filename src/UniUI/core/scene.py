@@ -1,3 +1,6 @@
+import gc
+import heapq
+import math
 import pygame
 
 from .object import BaseObject
@@ -5,67 +8,527 @@ from .tools.console import Console
 from .time import Time
 from .screen import Screen
 from .math.vector2 import Vector2
+from .utils.layers import LayerList
+from .utils.boundsTree import BoundsTree
+from .utils.rasterPool import RasterPool
+from .utils.objectPool import ObjectPool
+from .transformStore import TransformStore
+from .profiler import Profiler
+from .input import Input
 
-from collections import defaultdict
-from typing import Callable
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Awaitable, Callable, Iterator
+
+
+def _skip_mark(phase: str) -> None:
+    """Stands in for `Profiler._mark` while the profiler is disabled."""
 
 
 class Scene:
 
-    def __init__(self, name: str, init_func: Callable[['Scene'], None]) -> None:
+    MAX_DAMAGE_RECTS = 16 # above this count the damage is merged into a single rect
+    MAX_CATCH_UP = 5 # logic ticks run at most per frame, the rest of the lag is dropped
+    WAKE_EVENT = pygame.event.custom_type() # posted by `request_frame` to wake a scene waiting for events
+    ASYNC_IDLE_POLL = 1 / 60 # seconds between the event checks of an idle on-demand scene run by `start_async`
+
+    def __init__(
+            self, name: str, init_func: Callable[['Scene'], None],
+            dirty_rects: bool = False, transform_store: bool = False,
+            tick_rate: int | None = None, render_rate: int | None = None,
+            on_demand: bool = False) -> None:
 
         self.name = name
 
         self._is_loaded = False
-        self.__objects: list[BaseObject] = []
-        self.__sorted_objects: dict[int, list[BaseObject]] = {}
+        self.__objects: LayerList = LayerList() # root objects ordered by layer
         self.__deactivated_objects: dict[BaseObject, int] = {}
         self.__activated_objects: dict[BaseObject, int] = {}
+        self.__detached_objects: dict[BaseObject, None] = {} # taken out of their parent or the scene by deactivation
+        self.__refurbish_queue: list[BaseObject] = []
+
+        self._dirty_rects: bool = dirty_rects if isinstance(dirty_rects, bool) else False
+        self.__damaged_objects: dict[BaseObject, None] = {}
+        self.__released_objects: dict[BaseObject, None] = {} # damaged objects whose drawn bounds are in `__pending_damage`
+        self.__pending_damage: list[pygame.Rect] = [] # drawn bounds released by hit tests since the last frame
+        self.__full_redraw: bool = True
+        self._bitmap_caches: int = 0 # number of objects with cache_as_bitmap enabled
+        self._culling: bool = True
+        self._culled_objects: int = 0
+        self.__bounds_roots: dict[BaseObject, None] = {} # roots whose subtree bounds are outdated
+        self.__removed_roots: dict[BaseObject, None] = {} # roots to remove from the bounds tree
+        self.__bounds_tree: BoundsTree | None = None
+        self._transform_store: TransformStore | None = TransformStore() if transform_store is True else None
+        self._profiler: Profiler = Profiler(self)
+        self._object_profiler: Profiler | None = None # set while the profiler times every object
+        self._input: Input = Input(self)
+
+        # scheduler, see `tick_rate` and `render_rate`
+        self._tick_rate: int | None = None
+        self._render_rate: int | None = None
+        self._max_catch_up: int = Scene.MAX_CATCH_UP
+        self.__accumulator: float = 0.0
+        self.tick_rate = tick_rate
+        self.render_rate = render_rate
+
+        # on-demand rendering, see `on_demand`
+        self._on_demand: bool = on_demand if isinstance(on_demand, bool) else False
+        self.__invalidated: bool = True # something changed on screen since the last draw
+        self.__frame_requested: bool = False
+        self.__wake_event: pygame.event.Event | None = None # event that ended the last wait
+        self.__calls: dict[int, Callable[[], None]] = {} # id -> callback scheduled with `call_later`
+        self.__call_times: list[tuple[float, int]] = [] # heap of (due `perf_counter` time, id)
+        self.__next_call_id: int = 0
+
+        # asyncio loop, see `start_async`; asyncio is imported only by the async methods, it is slow to import
+        self.__async_objects: dict[BaseObject, None] = {} # objects overriding `update_async`
+        self.__tasks: dict['asyncio.Task', Callable[[object], None] | None] = {} # task -> callback, see `spawn`
+        self.__finished_tasks: list[tuple['asyncio.Task', Callable[[object], None] | None]] = []
+        self.__frame_start: float = 0.0
+
+        self.__pools: dict[type[BaseObject], ObjectPool] = {} # see `pool`
+        self._batch_depth: int = 0 # number of nested `batch` blocks being run
+        self.__gc_was_enabled: bool = True
+
         self.__init_func = init_func
 
     
     def _add_object(self, object: BaseObject) -> None:
         if isinstance(object, BaseObject):
-            self.__objects.append(object)
-            self._sort_objects()
+            self.__objects.add(object)
+            self.__invalidated = True
+            object._bounds_dirty = True
+            self.__bounds_roots[object] = None
         else:
             Console.error("This object does not belong to the BaseObject type")
     
     def _remove_object(self, object: BaseObject) -> None:
         if isinstance(object, BaseObject):
             self.__objects.remove(object)
-            self._sort_objects()
+            self.__removed_roots[object] = None
+            self.__invalidated = True
         else:
             Console.error("This object does not belong to the BaseObject type")
         
     def _activate_object(self, object: BaseObject, mode: int) -> None:
         if isinstance(object, BaseObject):
             self.__activated_objects[object] = mode
-            if self.__deactivated_objects.get(object, None):
-                self.__deactivated_objects.pop(object)
+            self.__invalidated = True
+            self.__deactivated_objects.pop(object, None)
         else:
             Console.error("This object does not belong to the BaseObject type")
     
     def _deactivate_object(self, object: BaseObject, mode: int) -> None:
         if isinstance(object, BaseObject):
             self.__deactivated_objects[object] = mode
-            if self.__activated_objects.get(object, None):
-                self.__activated_objects.pop(object)
+            self.__invalidated = True
+            self.__activated_objects.pop(object, None)
         else:
             Console.error("This object does not belong to the BaseObject type")
     
-    def _sort_objects(self) -> None:
-        layers_dict = defaultdict(list)
-        for obj in self.__objects:
-            layers_dict[obj.layer].append(obj)
+    def _detach_object(self, object: BaseObject, mode: int) -> None:
+        """Takes a deactivated object out of the scene (mode 1) or out of its parent (mode 0) until it is activated."""
+        if mode == 1:
+            self._remove_object(object)
+        else:
+            object._parent.remove_child(object, False)
+        self.__detached_objects[object] = None
+
+    def _forget_activation(self, object: BaseObject) -> None:
+        """Drops the queued activation or deactivation of a destroyed object, which may be reused by a pool."""
+        self.__activated_objects.pop(object, None)
+        self.__deactivated_objects.pop(object, None)
+        self.__detached_objects.pop(object, None)
+
+    def _detached_state(self) -> dict[BaseObject, bool]:
+        """
+        Returns the objects taken out by deactivation or queued to be, each with whether
+        it is still out once the queued activations and deactivations are applied.
+        """
+        state = {obj: obj not in self.__activated_objects for obj in self.__detached_objects}
+        state.update(dict.fromkeys(self.__deactivated_objects, True))
+        return state
+
+    def _queue_refurbish(self, object: BaseObject) -> None:
+        self.__refurbish_queue.append(object)
+        self.__invalidated = True
+
+    def _refurbish_objects(self) -> None:
+        """Refurbishes every object queued since the last frame, each at most once."""
+        while self.__refurbish_queue:
+            queue = self.__refurbish_queue
+            self.__refurbish_queue = []
+            for obj in queue:
+                obj._flush_refurbish()
+
+    def _add_async_object(self, object: BaseObject) -> None:
+        self.__async_objects[object] = None
+
+    def _remove_async_object(self, object: BaseObject) -> None:
+        self.__async_objects.pop(object, None)
+
+    def _invalidate_root_bounds(self, object: BaseObject) -> None:
+        self.__bounds_roots[object] = None
+        self.__invalidated = True
+
+    def _refresh_bounds(self, damaged: dict[BaseObject, None] = None, damage: list[pygame.Rect] = None) -> None:
+        """
+        Recomputes the outdated screen bounds of the visible objects and updates the bounds
+        tree of the root objects, rebuilding it only once it degraded after many changes.
+        """
+        objects = self.__objects
+        roots, self.__bounds_roots = self.__bounds_roots, {}
+        # roots that are no longer in the scene are refreshed once they are added back
+        roots = [obj for obj in roots if obj in objects]
+        for obj in roots:
+            obj._refresh_bounds(damaged, damage)
+
+        removed, self.__removed_roots = self.__removed_roots, {}
+        tree = self.__bounds_tree
+        if tree is None or tree.needs_rebuild:
+            self.__bounds_tree = BoundsTree(objects, objects.key)
+            return
+
+        for obj in removed:
+            if obj not in objects:
+                tree.remove(obj)
+        tree.update(roots)
+
+    def _pick(self, point: tuple[int, int]) -> BaseObject | None:
+        """Returns the topmost object drawn at `point`, the bounds must be up to date."""
+        objects, _ = self.__bounds_tree.query(pygame.Rect(point, (1, 1)))
+        for obj in reversed(objects):
+            found = obj._pick(point)
+            if found is not None:
+                return found
+        return None
+
+    def _damage_object(self, object: BaseObject) -> None:
+        self.__damaged_objects[object] = None
+        self.__invalidated = True
+
+    def _refresh_hit_bounds(self) -> None:
+        """
+        Brings the screen bounds up to date for hit testing between frames. In the dirty rects mode
+        the bounds the damaged objects were drawn at are kept for the next frame to clear.
+        """
+        if self._dirty_rects:
+            self.__release_drawn_bounds()
+        self._refresh_bounds()
+
+    def __release_drawn_bounds(self) -> None:
+        """Moves the bounds the damaged objects were last drawn at to the pending damage, once per frame."""
+        released = self.__released_objects
+        for obj in self.__damaged_objects:
+            if obj in released:
+                continue
+            released[obj] = None
+            if obj._drawn_bounds is not None:
+                self.__pending_damage.append(obj._drawn_bounds)
+                obj._drawn_bounds = None
+            obj._invalidate_bounds()
+
+    def _collect_damage(self) -> list[pygame.Rect]:
+        """
+        Refreshes the screen bounds of the changed objects and returns the merged
+        list of screen areas that changed since the previous frame.
+        """
+        # previous bounds of everything that moved, re-rendered or was hidden
+        self.__release_drawn_bounds()
+        damage, self.__pending_damage = self.__pending_damage, []
+        damaged, self.__damaged_objects = self.__damaged_objects, {}
+        released, self.__released_objects = self.__released_objects, {}
+
+        # bounds refreshed by a hit test are computed again to be added to the damage
+        for obj in released:
+            obj._invalidate_bounds()
+
+        # current bounds of everything that is still visible
+        self._refresh_bounds(damaged, damage)
+
+        return self._merge_rects(damage, Screen.Instance._screen.get_rect())
+
+    @staticmethod
+    def _merge_rects(rects: list[pygame.Rect], bounds: pygame.Rect) -> list[pygame.Rect]:
+        merged: list[pygame.Rect] = []
+        for rect in rects:
+            rect = rect.clip(bounds)
+            if rect.width <= 0 or rect.height <= 0:
+                continue
 
-        self.__sorted_objects = dict(sorted(layers_dict.items()))
+            i = 0
+            while i < len(merged):
+                if merged[i].colliderect(rect):
+                    rect.union_ip(merged.pop(i))
+                    i = 0
+                else:
+                    i += 1
+            merged.append(rect)
+
+        if len(merged) > Scene.MAX_DAMAGE_RECTS:
+            return [merged[0].unionall(merged[1:])]
+        return merged
+
+    def _draw_objects(self, surface: pygame.Surface) -> None:
+        render = BaseObject._render if self._object_profiler is None else self._object_profiler._render
+        if not self._culling:
+            for obj in self.__objects:
+                render(obj, surface)
+            return
+
+        # only the subtrees intersecting the screen are drawn
+        objects, culled = self.__bounds_tree.query(surface.get_clip())
+        self._culled_objects += culled
+        for obj in objects:
+            render(obj, surface)
+
+    def _draw_damage(self, surface: pygame.Surface, damage: list[pygame.Rect]) -> None:
+        """Clears and redraws only the objects intersecting the damaged areas."""
+        render = BaseObject._render if self._object_profiler is None else self._object_profiler._render
+        culled = self._culled_objects # objects outside of the damaged areas are not counted as culled
+        for rect in damage:
+            surface.set_clip(rect)
+            surface.fill(0, rect)
+            for obj in self.__bounds_tree.query(rect)[0]:
+                render(obj, surface)
+        surface.set_clip(None)
+        self._culled_objects = culled
+
+    def _update_object_layer(self, object: BaseObject) -> None:
+        self.__objects.update_layer(object)
+        self.__invalidated = True
+
+    def _invalidate(self) -> None:
+        """Makes the next frame draw the scene in the on-demand mode."""
+        self.__invalidated = True
+
+    def _redraw_all(self) -> None:
+        """Makes the next frame redraw the whole screen in the dirty rects mode."""
+        self.__full_redraw = True
+        self.__invalidated = True
     
+    @property
+    def dirty_rects(self) -> bool:
+        """Whether the scene redraws only the areas that changed since the previous frame."""
+        return self._dirty_rects
+
+    @dirty_rects.setter
+    def dirty_rects(self, value: bool) -> None:
+        if isinstance(value, bool):
+            if value != self._dirty_rects:
+                self._dirty_rects = value
+                self.__damaged_objects.clear()
+                self.__released_objects.clear()
+                self.__pending_damage.clear()
+                self.__full_redraw = True
+        else:
+            Console.error(f"Expected bool for 'dirty_rects', got {type(value).__name__}")
+
+    @property
+    def transform_store(self) -> TransformStore | None:
+        """Vectorized transform store of the scene, None unless the scene was created with `transform_store=True`."""
+        return self._transform_store
+
+    @property
+    def culling(self) -> bool:
+        """Whether objects lying entirely outside of the screen are skipped when drawing."""
+        return self._culling
+
+    @culling.setter
+    def culling(self, value: bool) -> None:
+        if isinstance(value, bool):
+            self._culling = value
+        else:
+            Console.error(f"Expected bool for 'culling', got {type(value).__name__}")
+
+    @property
+    def culled_objects(self) -> int:
+        """Number of objects skipped by culling in the last drawn frame."""
+        return self._culled_objects
+
+    @property
+    def tick_rate(self) -> int | None:
+        """
+        Logic ticks per second. When set, `update` runs at this fixed rate with a constant
+        `Time.delta_time`, independently of how often the scene is drawn: slow frames are
+        caught up with several ticks (at most `max_catch_up`), fast frames may run none and
+        use `Time.alpha` to interpolate. None runs one update per frame.
+        """
+        return self._tick_rate
+
+    @property
+    def render_rate(self) -> int | None:
+        """Frames drawn per second at most, None uses the refresh rate of the screen."""
+        return self._render_rate
+
+    @property
+    def max_catch_up(self) -> int:
+        """Logic ticks run at most per frame, the lag above it is dropped instead of slowing down further."""
+        return self._max_catch_up
+
+    @tick_rate.setter
+    def tick_rate(self, value: int | None) -> None:
+        if value is None or (isinstance(value, int) and value > 0):
+            self._tick_rate = value
+            self.__accumulator = 0.0
+            if self._is_loaded:
+                self.__reset_time()
+        else:
+            Console.error(f"Expected positive int or None for 'tick_rate', got {value!r}")
+
+    @render_rate.setter
+    def render_rate(self, value: int | None) -> None:
+        if value is None or (isinstance(value, int) and value >= 0):
+            self._render_rate = value
+        else:
+            Console.error(f"Expected non-negative int or None for 'render_rate', got {value!r}")
+
+    @max_catch_up.setter
+    def max_catch_up(self, value: int) -> None:
+        if isinstance(value, int) and value > 0:
+            self._max_catch_up = value
+        else:
+            Console.error(f"Expected positive int for 'max_catch_up', got {value!r}")
+
+    @property
+    def on_demand(self) -> bool:
+        """
+        Whether frames are produced only when needed. While nothing changed, no event is pending,
+        no frame was requested and no scheduled call is due, the loop sleeps in `pygame.event.wait`
+        instead of drawing the same frame again, and frames without changes are not drawn.\n
+        Objects that change without setting properties, e.g. animations or custom `draw` methods
+        depending on time, must call `request_frame` from their `update` while they run.
+        """
+        return self._on_demand
+
+    @on_demand.setter
+    def on_demand(self, value: bool) -> None:
+        if isinstance(value, bool):
+            self._on_demand = value
+            self.__invalidated = True
+        else:
+            Console.error(f"Expected bool for 'on_demand', got {type(value).__name__}")
+
+    @property
+    def input(self) -> Input:
+        """Pointer input of the scene, see `BaseObject.add_pointer_listener`."""
+        return self._input
+
+    @property
+    def objects(self) -> tuple[BaseObject, ...]:
+        """The root objects of the scene ordered by layer."""
+        return self.__objects.snapshot()
+
+    @property
+    def profiler(self) -> Profiler:
+        """Frame profiler of the scene, disabled until `profiler.enabled` is set."""
+        return self._profiler
+
+    def pool(self, cls: type[BaseObject], prewarm: int = 0, **kwargs: dict[str, object]) -> ObjectPool | None:
+        """
+        Returns the pool of reusable objects of `cls` in this scene, created on first use.
+        Objects acquired from it go back to it when destroyed, instead of being created again.
+        `prewarm` objects are created with `kwargs` right away, so the first acquisitions are reused too.
+        """
+        if not isinstance(cls, type) or not issubclass(cls, BaseObject):
+            Console.error(f"Expected a BaseObject subclass for 'cls', got {cls!r}")
+            return None
+
+        pool = self.__pools.get(cls)
+        if pool is None:
+            pool = self.__pools[cls] = ObjectPool(self, cls)
+        if isinstance(prewarm, int) and prewarm > 0:
+            pool.prewarm(prewarm, **kwargs)
+        return pool
+
+    @property
+    def pools(self) -> list[ObjectPool]:
+        """The pools created by `pool`, see `ObjectPool.stats` for their hit rates."""
+        return list(self.__pools.values())
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Defers the rendering of the texts created inside the block until it ends, for building many objects at once:\n
+        `with scene.batch(): ...`\n
+        The texts are then rendered together, as if a frame was refurbished. The cyclic garbage
+        collector is paused meanwhile and runs once at the end: its passes over the growing number
+        of new objects would take a large part of the time. Blocks may be nested, the outermost one renders.
+        """
+        if not self._batch_depth:
+            self.__gc_was_enabled = gc.isenabled()
+            gc.disable()
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                try:
+                    self._refurbish_objects()
+                finally:
+                    if self.__gc_was_enabled:
+                        gc.enable()
+                        # the objects made by the block are traversed once now, instead of during a later frame
+                        gc.collect()
+
+    def request_frame(self) -> None:
+        """
+        Makes the scene produce one more frame, even if nothing changed in it.
+        Wakes a scene waiting for events in the on-demand mode and may be called from other threads.
+        """
+        self.__frame_requested = True
+        if self._on_demand:
+            pygame.event.post(pygame.event.Event(Scene.WAKE_EVENT))
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> int:
+        """
+        Calls `callback` once, at the start of the first frame at least `delay` seconds from now.
+        Returns an id that can be passed to `cancel_call`.
+        """
+        if not isinstance(delay, (int, float)) or not callable(callback):
+            Console.error(f"Expected a number and a callable for 'call_later', got {type(delay).__name__} and {type(callback).__name__}")
+            return -1
+
+        call_id = self.__next_call_id
+        self.__next_call_id += 1
+        self.__calls[call_id] = callback
+        heapq.heappush(self.__call_times, (perf_counter() + max(0.0, delay), call_id))
+        return call_id
+
+    def cancel_call(self, call_id: int) -> None:
+        """Cancels a call scheduled with `call_later` that did not happen yet."""
+        self.__calls.pop(call_id, None)
+
+    def spawn(self, awaitable: Awaitable, callback: Callable[[object], None] = None) -> 'asyncio.Task | None':
+        """
+        Runs `awaitable` as a task of the asyncio loop running the scene (see `start_async`).
+        Its result is passed to `callback` at the start of the frame following its completion,
+        so objects are only changed at frame boundaries. Unfinished tasks are cancelled on unload.
+        """
+        import asyncio
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            Console.error("Tasks can only be spawned while the scene runs with 'start_async'")
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            return None
+
+        task = asyncio.ensure_future(awaitable)
+        self.__tasks[task] = callback
+        task.add_done_callback(self.__on_task_done)
+        return task
+
     def load(self):
-        self.__init_func(self)
-        self._is_loaded = True
+        self.__prepare_load()
         self.start()
 
+    async def load_async(self) -> None:
+        """Same as `load`, but runs the scene with `start_async`."""
+        self.__prepare_load()
+        await self.start_async()
+
     def unload(self):
         self._is_loaded = False
         
@@ -73,59 +536,340 @@ class Scene:
             obj.destroy()
 
         self.__objects.clear()
-        self.__sorted_objects.clear()
         self.__activated_objects.clear()
         self.__deactivated_objects.clear()
+        self.__detached_objects.clear()
+        self.__refurbish_queue.clear()
+        self.__damaged_objects.clear()
+        self.__released_objects.clear()
+        self.__pending_damage.clear()
+        self.__full_redraw = True
+        self.__bounds_roots.clear()
+        self.__removed_roots.clear()
+        self.__bounds_tree = None
+        self.__invalidated = True
+        self.__frame_requested = False
+        self.__wake_event = None
+        self.__calls.clear()
+        self.__call_times.clear()
+        self.__async_objects.clear()
+        tasks, self.__tasks = self.__tasks, {}
+        for task in tasks:
+            task.cancel()
+        self.__finished_tasks.clear()
+
+    def __prepare_load(self) -> None:
+        self.__init_func(self)
+        self._is_loaded = True
+        self.__accumulator = 0.0
+        self.__reset_time()
+        Screen.Instance._refresh_rate_object.tick() # the time spent loading is not caught up
+        self.__frame_start = perf_counter()
+
+    def __on_task_done(self, task: 'asyncio.Task') -> None:
+        if task not in self.__tasks:
+            return # cancelled by unload
+        self.__finished_tasks.append((task, self.__tasks.pop(task)))
+        self.request_frame()
     
-    def start(self) -> None:        
+    #region Frame
+    # one frame of the main loop split into its phases, `start` calls them in order
+
+    def __reset_time(self) -> None:
+        Time._update_fixed_delta_time(1 / self._tick_rate if self._tick_rate is not None else None)
+        Time._update_alpha(1.0)
+
+    def __next_call_delay(self) -> float | None:
+        """Returns the seconds until the next scheduled call, None if there is none."""
+        times = self.__call_times
+        while times and times[0][1] not in self.__calls:
+            heapq.heappop(times) # cancelled
+        if not times:
+            return None
+        return times[0][0] - perf_counter()
+
+    def __is_idle(self) -> bool:
+        """Whether nothing changed, no frame was requested and no event is pending."""
+        requested, self.__frame_requested = self.__frame_requested, False
+        if requested:
+            self.__invalidated = True
+        return not (self.__invalidated or pygame.event.peek())
+
+    def __wait(self) -> bool:
+        """
+        Sleeps until an event arrives or the next scheduled call is due, if the scene is idle.
+        Returns whether it slept.
+        """
+        if not self.__is_idle():
+            return False
+
+        delay = self.__next_call_delay()
+        if delay is None:
+            event = pygame.event.wait()
+        elif delay > 0:
+            event = pygame.event.wait(math.ceil(delay * 1000))
+        else:
+            return False
+
+        if event.type != pygame.NOEVENT:
+            self.__wake_event = event
+        return True
+
+    async def __wait_async(self) -> bool:
+        """
+        Same as `__wait` without blocking the asyncio loop: pygame has no awaitable event source,
+        so the events are polled every `ASYNC_IDLE_POLL` seconds while the scene is idle.
+        """
+        if not self.__is_idle():
+            return False
+
+        import asyncio
+        while True:
+            delay = self.__next_call_delay()
+            if delay is not None and delay <= 0:
+                return True
+            await asyncio.sleep(Scene.ASYNC_IDLE_POLL if delay is None else min(Scene.ASYNC_IDLE_POLL, delay))
+            if not self.__is_idle():
+                return True
+
+    def _run_calls(self) -> None:
+        """
+        Runs the scheduled calls that are due, passes the results of the finished tasks
+        to their callbacks and swaps in the surfaces rasterized in the background.
+        """
+        RasterPool.apply_all_finished()
+        if self.__finished_tasks:
+            finished, self.__finished_tasks = self.__finished_tasks, []
+            for task, callback in finished:
+                if task.cancelled():
+                    continue
+                result = task.result() # raises the exception of a failed task
+                if callback is not None:
+                    callback(result)
+
+        times = self.__call_times
+        if not times:
+            return
+
+        now = perf_counter()
+        while times and times[0][0] <= now:
+            callback = self.__calls.pop(heapq.heappop(times)[1], None)
+            if callback is not None:
+                callback()
+
+    def _tick(self) -> int:
+        """Waits for the next frame and returns the number of updates to run in it."""
+        clock = Screen.Instance._refresh_rate_object
+        rate = self._render_rate if self._render_rate is not None else Screen.Instance._refresh_rate
+        if self._on_demand and self.__wait():
+            # the time spent idle is not simulated, the first frame after it covers a single frame period
+            clock.tick()
+            elapsed = None
+        else:
+            elapsed = clock.tick(rate) / 1000
+        Screen.Instance._fps = int(clock.get_fps())
+        return self.__advance_time(elapsed, rate)
+
+    async def _tick_async(self) -> int:
+        """Same as `_tick`, but paced with `asyncio.sleep` to let the asyncio loop run meanwhile."""
+        import asyncio
+        clock = Screen.Instance._refresh_rate_object
+        rate = self._render_rate if self._render_rate is not None else Screen.Instance._refresh_rate
+        woken = self._on_demand and await self.__wait_async()
+        delay = self.__frame_start + 1 / rate - perf_counter() if rate > 0 and not woken else 0.0
+        # yields at least once per frame even when late
+        await asyncio.sleep(max(0.0, delay))
+        self.__frame_start = perf_counter()
+
+        elapsed = clock.tick() / 1000
+        Screen.Instance._fps = int(clock.get_fps())
+        return self.__advance_time(None if woken else elapsed, rate)
+
+    def __advance_time(self, elapsed: float | None, rate: int) -> int:
+        """Advances the time by `elapsed` seconds, None after sleeping idle, and returns the number of updates to run."""
+        if self._tick_rate is None:
+            if elapsed is None:
+                elapsed = 1 / rate if rate > 0 else 0.0
+            Time._update_delta_time(elapsed)
+            return 1
+
+        step = 1 / self._tick_rate
+        self.__accumulator = step if elapsed is None else self.__accumulator + elapsed
+        ticks = int(self.__accumulator / step)
+        if ticks > self._max_catch_up:
+            # too far behind: run the allowed ticks and drop the rest of the lag
+            ticks = self._max_catch_up
+            self.__accumulator %= step
+        else:
+            self.__accumulator -= ticks * step
+
+        Time._update_delta_time(step)
+        Time._update_alpha(min(1.0, self.__accumulator / step))
+        return ticks
+
+    def _handle_events(self) -> None:
+        events: list[pygame.event.Event] = pygame.event.get()
+        if self.__wake_event is not None:
+            events.insert(0, self.__wake_event)
+            self.__wake_event = None
+
+        for event in events:
+            if event.type == pygame.QUIT:
+                Screen.quit()
+            elif event.type == pygame.VIDEORESIZE:
+                Screen.Instance._update_screen(Vector2(event.w, event.h))
+                self.__full_redraw = True
+                for obj in self.__objects:
+                    obj._request_refurbish(subtree=True)
+            elif event.type == pygame.WINDOWEXPOSED:
+                self._redraw_all()
+
+        self._input._handle_events(events)
+
+    def _update_objects(self) -> None:
+        if self._object_profiler is None:
+            for obj in self.__objects:
+                obj.update()
+        else:
+            for obj in self.__objects:
+                self._object_profiler._update(obj)
+
+        # if settings.DEBUG_APP:
+        #     Console.log(f"{len(self.__objects)} objects have been updated")
+
+    async def _update_objects_async(self) -> None:
+        """Awaits the `update_async` hooks of the updated objects concurrently."""
+        if not self.__async_objects:
+            return
+
+        updates = [obj.update_async() for obj in self.__async_objects if obj._is_active_in_hierarchy()]
+        if updates:
+            import asyncio
+            await asyncio.gather(*updates)
+
+    def _apply_activation(self) -> None:
+        # activating objects
+        if self.__activated_objects:
+            activated, self.__activated_objects = self.__activated_objects, {}
+            for (object, mode) in activated.items():
+                if mode == 1:
+                    self._add_object(object)
+                else:
+                    object._parent.add_child(object, False)
+                self.__detached_objects.pop(object, None)
+
+        # deactivating objects
+        if self.__deactivated_objects:
+            deactivated, self.__deactivated_objects = self.__deactivated_objects, {}
+            for (object, mode) in deactivated.items():
+                self._detach_object(object, mode)
+
+    def _refurbish(self) -> None:
+        # recomputing world transforms of all changed objects at once
+        if self._transform_store is not None:
+            self._transform_store.sync()
+
+        # refurbishing objects changed during this frame
+        self._refurbish_objects()
+
+    def _draw(self) -> list[pygame.Rect] | None:
+        """Draws the scene, returns the screen areas to update or None to update the whole screen."""
+        self._culled_objects = 0
+        if self._on_demand and not self.__invalidated:
+            return []
+        rects = self.__draw_changes(Screen.Instance._screen)
+        # cleared after drawing, which itself refreshes the invalidated bounds
+        self.__invalidated = False
+        return rects
+
+    def __draw_changes(self, screen: pygame.Surface) -> list[pygame.Rect] | None:
+        if self._dirty_rects:
+            damage = self._collect_damage()
+            if self.__full_redraw:
+                self.__full_redraw = False
+                screen.fill(0)
+                self._draw_objects(screen)
+                return None
+            if damage:
+                self._draw_damage(screen, damage)
+            return damage
+
+        if self._culling:
+            self._refresh_bounds()
+        screen.fill(0)
+        self._draw_objects(screen)
+        return None
+
+    def _present(self, rects: list[pygame.Rect] | None) -> None:
+        if rects is None:
+            pygame.display.update()
+        elif rects:
+            pygame.display.update(rects)
+
+    def __begin_frame(self) -> Callable[[str], None]:
+        """Starts timing the frame if the profiler is enabled, returns the function marking the end of a phase."""
+        profiler = self._profiler
+        if profiler._enabled:
+            profiler._begin_frame()
+            return profiler._mark
+        self._object_profiler = None
+        return _skip_mark
+
+    def __finish_frame(self, mark: Callable[[str], None]) -> None:
+        self._refurbish()
+        mark("refurbish")
+        rects = self._draw()
+        mark("draw")
+        profiling = mark is not _skip_mark
+        if profiling and self._profiler._overlay:
+            rects = self._profiler._draw_overlay(Screen.Instance._screen, rects)
+            mark("overlay")
+        self._present(rects)
+        mark("present")
+        if profiling:
+            self._profiler._end_frame()
+
+    def _frame(self) -> None:
+        mark = self.__begin_frame()
+        ticks = self._tick()
+        mark("tick")
+        self._handle_events()
+        mark("events")
+        self._run_calls()
+        mark("update")
+        for _ in range(ticks):
+            self._update_objects()
+            mark("update")
+            self._apply_activation()
+            mark("activation")
+        self.__finish_frame(mark)
+
+    async def _frame_async(self) -> None:
+        mark = self.__begin_frame()
+        ticks = await self._tick_async()
+        mark("tick")
+        self._handle_events()
+        mark("events")
+        self._run_calls()
+        mark("update")
+        for _ in range(ticks):
+            self._update_objects()
+            await self._update_objects_async()
+            mark("update")
+            self._apply_activation()
+            mark("activation")
+        self.__finish_frame(mark)
+    #endregion
+
+    def start(self) -> None:
+        while self._is_loaded:
+            self._frame()
+
+    async def start_async(self) -> None:
+        """
+        Runs the frames inside the running asyncio event loop until the scene is unloaded.
+        Frames are paced with `asyncio.sleep`, so other tasks run between them; the `update_async`
+        hooks of the objects are awaited every update and `spawn` can be used for longer work.
+        """
         while self._is_loaded:
-            Screen.Instance._screen.fill(0)
-            Time._update_delta_time(Screen.Instance._refresh_rate_object.tick(Screen.Instance._refresh_rate) / 1000)
-            Screen.Instance._fps = int(Screen.Instance._refresh_rate_object.get_fps())
-
-            events: list[pygame.event.Event] = pygame.event.get()
-
-            # events handle
-            for event in events:
-                if event.type == pygame.QUIT:
-                    Screen.quit()
-                elif event.type == pygame.VIDEORESIZE:
-                    Screen.Instance._update_screen(Vector2(event.w, event.h))
-                    for obj in self.__objects:
-                        obj._refurbish_interior()
-            
-            # updating
-            for layer in self.__sorted_objects:
-                for obj in self.__sorted_objects[layer]:
-                    obj.update()
-            
-            # if settings.DEBUG_APP:
-            #     Console.log(f"{len(self.__objects)} objects have been updated")
-            
-            # activating objects
-            if self.__activated_objects:
-                while len(self.__activated_objects) > 0:
-                    (object, mode) = self.__activated_objects.popitem()
-                    if mode == 1:
-                        self._add_object(object)
-                    else:
-                        object._parent.add_child(object, False)
-            
-            # deactivating objects
-            if self.__deactivated_objects:
-                while len(self.__deactivated_objects) > 0:
-                    (object, mode) = self.__deactivated_objects.popitem()
-                    if mode == 1:
-                        self._remove_object(object)
-                    else:
-                        object._parent.remove_child(object, False)
-            
-            # drawing
-            for layer in self.__sorted_objects:
-                for obj in self.__sorted_objects[layer]:
-                    obj.draw(Screen.Instance._screen)
-            
-            # if settings.DEBUG_APP:
-            #     Console.log(f"{len(self.__objects)} objects have been drawed\n{"-"*42}")
-            
-            pygame.display.update()
\ No newline at end of file
+            await self._frame_async()
@@ -0,0 +1,446 @@
+import importlib
+import os
+import pygame
+import struct
+import sys
+import zlib
+
+from array import array
+from collections.abc import Mapping
+from typing import Callable, Iterator
+
+from .object import BaseObject
+from .math.vector2 import Vector2
+from .ui.align import Align, TextAlign
+from .ui.color import Color
+from .ui.fonts import Fonts
+from .ui.text import Text, get_default_font
+from .tools.console import Console
+
+
+MAGIC = b"UISC"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sH")
+_LENGTH = struct.Struct("<I")
+
+# bits of the flag columns
+_ACTIVE = 1
+_CACHE_AS_BITMAP = 2
+_DETACHED = 4 # deactivated out of its parent or the scene, inactive objects are drawn otherwise
+_WORD_WRAP = 1
+_ASYNC_RENDER = 2
+
+_TRANSFORM_VALUES = 7 # position x and y, scale x and y, rotation, width, height
+_ALIGNS = {align.value: align for align in Align}
+
+
+class _Writer:
+    """Packs the columns of a scene file, the arrays are stored little-endian."""
+
+    def __init__(self) -> None:
+        self.parts: list[bytes] = []
+
+    def blob(self, data: bytes) -> None:
+        self.parts.append(_LENGTH.pack(len(data)))
+        self.parts.append(data)
+
+    def column(self, values: array) -> None:
+        if sys.byteorder == "big":
+            values = array(values.typecode, values)
+            values.byteswap()
+        self.parts.append(values.typecode.encode())
+        self.blob(values.tobytes())
+
+
+class _Reader:
+    """Unpacks the columns written by `_Writer` in the same order."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def blob(self) -> memoryview:
+        (length,) = _LENGTH.unpack_from(self.data, self.offset)
+        start = self.offset + _LENGTH.size
+        if start + length > len(self.data):
+            raise ValueError("truncated column")
+        self.offset = start + length
+        return self.data[start:self.offset]
+
+    def column(self, typecode: str) -> array:
+        if bytes(self.data[self.offset:self.offset + 1]) != typecode.encode():
+            raise ValueError(f"expected a column of type '{typecode}'")
+        self.offset += 1
+        values = array(typecode)
+        values.frombytes(self.blob())
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+
+class _LineRasters(Mapping):
+    """
+    Lines rendered when the file was saved, keyed like `Text.line_cache`. Only the alpha of a
+    line is stored, its color is the color of the text; the surfaces are made on first lookup.
+    """
+
+    def __init__(self, keys: list[tuple], sizes: array, rects: array, alpha: memoryview) -> None:
+        self._entries: dict[tuple, int] = {key: index for index, key in enumerate(keys)}
+        self._sizes = sizes
+        self._rects = rects
+        self._offsets: list[int] = []
+        offset = 0
+        for index in range(len(keys)):
+            self._offsets.append(offset)
+            offset += sizes[index * 2] * sizes[index * 2 + 1]
+        self._alpha = alpha
+        self._tables: dict[tuple[int, ...], tuple[bytes, bytes, bytes]] = {} # color -> alpha to channel translations
+
+    def __getitem__(self, key: tuple) -> tuple[pygame.Surface, pygame.Rect]:
+        index = self._entries[key]
+        width, height = self._sizes[index * 2], self._sizes[index * 2 + 1]
+        alpha = bytes(self._alpha[self._offsets[index]:self._offsets[index] + width * height])
+
+        # the rendered pixels are the color of the text wherever they are not fully transparent
+        tables = self._tables.get(key[2])
+        if tables is None:
+            tables = self._tables[key[2]] = tuple(bytes((0,)) + bytes((value,)) * 255 for value in key[2][:3])
+        pixels = bytearray(width * height * 4)
+        pixels[0::4] = alpha.translate(tables[0])
+        pixels[1::4] = alpha.translate(tables[1])
+        pixels[2::4] = alpha.translate(tables[2])
+        pixels[3::4] = alpha
+        surface = pygame.image.fromstring(bytes(pixels), (width, height), "RGBA").convert_alpha()
+        return surface, pygame.Rect(*self._rects[index * 4:index * 4 + 4])
+
+    def __iter__(self) -> Iterator[tuple]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SceneFile:
+    """
+    Compact binary format of the object tree of a scene.\n
+    `save` writes the class, name, transform, align, layer and parent of every object and the
+    properties of the texts as one column per property, with every string stored once, and
+    compresses the whole with zlib. `load` creates the objects again inside `Scene.batch`, so a
+    scene saved once loads without running its init function:
+    `manager.scene("main")(SceneFile.loader("main.uiscene"))`\n
+    Objects are created with the keyword arguments of `BaseObject` and `Text` only, so the state
+    of subclasses, the listeners and the callbacks are not saved. Objects of classes with
+    `_serializable` unset, e.g. `VirtualList` whose rows are made by functions, are left out with their children.
+    Inactive objects are saved with their children and loaded inactive.
+    """
+
+    #region Private
+    @staticmethod
+    def _class_name(cls: type[BaseObject]) -> str:
+        return f"{cls.__module__}:{cls.__qualname__}"
+
+    @staticmethod
+    def _resolve(name: str) -> type[BaseObject] | None:
+        module, _, qualname = name.partition(":")
+        try:
+            cls = importlib.import_module(module)
+            for attribute in qualname.split("."):
+                cls = getattr(cls, attribute)
+        except (ImportError, AttributeError):
+            cls = None
+        return cls if isinstance(cls, type) and issubclass(cls, BaseObject) else None
+
+    @staticmethod
+    def _encode(scene: 'Scene', rasters: bool) -> bytes:
+        strings: dict[str, int] = {}
+        def string(value: str) -> int:
+            index = strings.get(value)
+            if index is None:
+                index = strings[value] = len(strings)
+            return index
+
+        default_font = get_default_font()
+        def font_index(font: 'pygame.freetype.Font') -> int:
+            # the default font is loaded again by name, the other fonts by the path of their file
+            return -1 if font is default_font or not font.path else string(font.path)
+
+        classes: dict[type[BaseObject], int] = {}
+        class_ids, parents, names = array("H"), array("i"), array("I")
+        flags, aligns, layers, transforms = array("B"), array("B"), array("i"), array("d")
+        text_objects, texts, fonts, font_sizes = array("I"), array("I"), array("i"), array("d")
+        colors, text_aligns, paddings, text_flags, steps = array("B"), array("B"), array("d"), array("B"), array("d")
+        line_keys: dict[tuple, None] = {}
+        skipped = 0
+
+        # deactivated objects are out of the lists of their parent or of the scene, they are saved with their siblings
+        detached = scene._detached_state()
+        roots = scene.objects
+        outside: dict[BaseObject | None, list[BaseObject]] = {}
+        for obj in detached:
+            if obj not in (roots if obj._parent is None else obj._parent.children):
+                outside.setdefault(obj._parent, []).append(obj)
+
+        def ordered(parent: BaseObject | None, objects: tuple[BaseObject, ...]) -> tuple[BaseObject, ...]:
+            if parent in outside:
+                objects = tuple(sorted([*objects, *outside[parent]], key=lambda obj: obj.layer))
+            return objects
+
+        # depth first, so that parents are created before their children and every layer keeps its order
+        pending: list[tuple[BaseObject, int]] = [(obj, -1) for obj in reversed(ordered(None, roots))]
+        while pending:
+            obj, parent = pending.pop()
+            if not obj._serializable:
+                skipped += 1
+                continue
+
+            index = len(names)
+            class_id = classes.get(type(obj))
+            if class_id is None:
+                class_id = classes[type(obj)] = len(classes)
+            class_ids.append(class_id)
+            parents.append(parent)
+            names.append(string(obj.name))
+            flags.append(
+                (_ACTIVE if obj.active else 0) | (_CACHE_AS_BITMAP if obj.cache_as_bitmap else 0)
+                | (_DETACHED if detached.get(obj) else 0)
+            )
+            aligns.append(obj.align.value)
+            layers.append(obj.layer)
+            transform = obj.transform
+            transforms.extend((
+                transform.position.x, transform.position.y, transform.scale.x, transform.scale.y,
+                transform.rotation, transform.width, transform.height
+            ))
+
+            if isinstance(obj, Text):
+                text_objects.append(index)
+                texts.append(string(obj.text))
+                fonts.append(font_index(obj.font))
+                font_sizes.append(obj.font_size)
+                colors.extend(obj.color.rgba)
+                text_aligns.extend((obj.text_align.x, obj.text_align.y))
+                paddings.append(obj.padding)
+                text_flags.append((_WORD_WRAP if obj.word_wrap else 0) | (_ASYNC_RENDER if obj.async_render else 0))
+                steps.extend((obj.rotation_step, obj.scale_step))
+                # the lines of fonts without a file would be drawn with the default font
+                if rasters and (obj.font is default_font or obj.font.path):
+                    line_keys.update(dict.fromkeys(obj._line_keys()))
+
+            pending.extend((child, index) for child in reversed(ordered(obj, obj.children)))
+
+        if skipped:
+            Console.warning(f"{skipped} objects of the scene '{scene.name}' cannot be saved, they are left out with their children")
+
+        # only the alpha of the lines is stored, it compresses far better than whole pixels
+        raster_fonts, raster_sizes, raster_colors, raster_lines = array("i"), array("d"), array("B"), array("I")
+        surface_sizes, rects, alpha = array("I"), array("i"), []
+        for font, font_size, color, line in line_keys:
+            surface, rect = Text._render_line(font, line, font_size, color)
+            raster_fonts.append(font_index(font))
+            raster_sizes.append(font_size)
+            raster_colors.extend(color)
+            raster_lines.append(string(line))
+            surface_sizes.extend(surface.get_size())
+            rects.extend((rect.x, rect.y, rect.width, rect.height))
+            alpha.append(pygame.image.tostring(surface, "RGBA")[3::4])
+
+        class_names = array("I", (string(SceneFile._class_name(cls)) for cls in classes))
+        encoded = [value.encode() for value in strings]
+
+        writer = _Writer()
+        writer.column(array("I", (len(value) for value in encoded)))
+        writer.blob(b"".join(encoded))
+        for column in (
+                class_names, class_ids, parents, names, flags, aligns, layers, transforms,
+                text_objects, texts, fonts, font_sizes, colors, text_aligns, paddings, text_flags, steps,
+                raster_fonts, raster_sizes, raster_colors, raster_lines, surface_sizes, rects):
+            writer.column(column)
+        writer.blob(b"".join(alpha))
+        return _HEADER.pack(MAGIC, VERSION) + zlib.compress(b"".join(writer.parts))
+
+    @staticmethod
+    def _decode(data: bytes) -> dict[str, object]:
+        magic, version = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("not a scene file")
+        if version != VERSION:
+            raise ValueError(f"unsupported version {version}")
+
+        reader = _Reader(zlib.decompress(memoryview(data)[_HEADER.size:]))
+        lengths = reader.column("I")
+        blob = reader.blob()
+        strings = []
+        offset = 0
+        for length in lengths:
+            strings.append(str(blob[offset:offset + length], "utf-8"))
+            offset += length
+
+        columns = {"strings": strings}
+        for key, typecode in (
+                ("class_names", "I"), ("class_ids", "H"), ("parents", "i"), ("names", "I"), ("flags", "B"),
+                ("aligns", "B"), ("layers", "i"), ("transforms", "d"), ("text_objects", "I"), ("texts", "I"),
+                ("fonts", "i"), ("font_sizes", "d"), ("colors", "B"), ("text_aligns", "B"), ("paddings", "d"),
+                ("text_flags", "B"), ("steps", "d"), ("raster_fonts", "i"), ("raster_sizes", "d"),
+                ("raster_colors", "B"), ("raster_lines", "I"), ("surface_sizes", "I"), ("rects", "i")):
+            columns[key] = reader.column(typecode)
+        columns["alpha"] = reader.blob()
+
+        count = len(columns["names"])
+        texts = len(columns["texts"])
+        lengths = (
+            (columns["class_ids"], count), (columns["parents"], count), (columns["flags"], count),
+            (columns["aligns"], count), (columns["layers"], count), (columns["transforms"], count * _TRANSFORM_VALUES),
+            (columns["text_objects"], texts), (columns["fonts"], texts), (columns["font_sizes"], texts),
+            (columns["colors"], texts * 4), (columns["text_aligns"], texts * 2), (columns["paddings"], texts),
+            (columns["text_flags"], texts), (columns["steps"], texts * 2),
+        )
+        rasters = len(columns["raster_lines"])
+        lengths += (
+            (columns["raster_fonts"], rasters), (columns["raster_sizes"], rasters), (columns["raster_colors"], rasters * 4),
+            (columns["surface_sizes"], rasters * 2), (columns["rects"], rasters * 4),
+        )
+        if any(len(column) != length for column, length in lengths):
+            raise ValueError("columns of different lengths")
+        # indices pointing outside of their tables, or parents saved after their children;
+        # -1 stands for the default font and for no parent, lower values would index from the end
+        if any(index >= len(strings) for key in ("class_names", "names", "texts", "raster_lines") for index in columns[key]):
+            raise ValueError("string index out of range")
+        if any(not -1 <= index < len(strings) for key in ("fonts", "raster_fonts") for index in columns[key]):
+            raise ValueError("font index out of range")
+        if any(index >= len(columns["class_names"]) for index in columns["class_ids"]):
+            raise ValueError("class index out of range")
+        if any(parent < -1 for parent in columns["parents"]):
+            raise ValueError("parent index out of range")
+        if any(parent >= index for index, parent in enumerate(columns["parents"])):
+            raise ValueError("parent saved after its child")
+        if any(index >= count for index in columns["text_objects"]):
+            raise ValueError("object index out of range")
+        sizes = columns["surface_sizes"]
+        if sum(sizes[i] * sizes[i + 1] for i in range(0, len(sizes), 2)) != len(columns["alpha"]):
+            raise ValueError("rasters of different sizes")
+        return columns
+
+    @staticmethod
+    def _read(path: str | os.PathLike) -> dict[str, object] | None:
+        try:
+            with open(path, "rb") as file:
+                return SceneFile._decode(file.read())
+        except (OSError, ValueError, IndexError, struct.error, zlib.error) as error:
+            Console.error(f"Cannot read the scene file '{os.fspath(path)}': {error}")
+            return None
+
+    @staticmethod
+    def _create(scene: 'Scene', columns: dict[str, object]) -> list[BaseObject]:
+        strings = columns["strings"]
+        classes = []
+        for name in columns["class_names"]:
+            cls = SceneFile._resolve(strings[name])
+            if cls is None:
+                Console.error(f"Cannot find the class '{strings[name]}' of the scene file, its objects are created as Text or BaseObject")
+            classes.append(cls)
+
+        # every font is looked up once, so that a missing file is reported once
+        default_font = get_default_font()
+        loaded_fonts: dict[int, 'pygame.freetype.Font'] = {-1: default_font}
+        for index in (*columns["fonts"], *columns["raster_fonts"]):
+            if index not in loaded_fonts:
+                loaded_fonts[index] = Fonts.get(strings[index]) or default_font
+
+        raster_fonts, raster_sizes, raster_colors = columns["raster_fonts"], columns["raster_sizes"], columns["raster_colors"]
+        line_keys = [
+            (loaded_fonts[raster_fonts[i]], raster_sizes[i], tuple(raster_colors[i * 4:i * 4 + 4]), strings[line])
+            for i, line in enumerate(columns["raster_lines"])
+        ]
+
+        class_ids, parents, names = columns["class_ids"], columns["parents"], columns["names"]
+        flags, aligns, layers, transforms = columns["flags"], columns["aligns"], columns["layers"], columns["transforms"]
+        text_rows = {index: row for row, index in enumerate(columns["text_objects"])}
+        texts, fonts, font_sizes, colors = columns["texts"], columns["fonts"], columns["font_sizes"], columns["colors"]
+        text_aligns, paddings, text_flags, steps = columns["text_aligns"], columns["paddings"], columns["text_flags"], columns["steps"]
+        shared_colors: dict[tuple[int, ...], Color] = {} # colors cannot be changed, texts of the same color share one
+
+        objects: list[BaseObject] = []
+        # the texts are rendered when the batch ends, from the saved lines as long as the scale factor is the same
+        line_source = Text.line_source
+        Text.line_source = _LineRasters(line_keys, columns["surface_sizes"], columns["rects"], columns["alpha"])
+        try:
+            with scene.batch():
+                for index in range(len(names)):
+                    parent = parents[index]
+                    t = index * _TRANSFORM_VALUES
+                    kwargs = {
+                        "name": strings[names[index]],
+                        "scene": scene,
+                        "parent": objects[parent] if parent >= 0 else None,
+                        "active": bool(flags[index] & _ACTIVE),
+                        "position": Vector2(transforms[t], transforms[t + 1]),
+                        "scale": Vector2(transforms[t + 2], transforms[t + 3]),
+                        "rotation": transforms[t + 4],
+                        "size": Vector2(transforms[t + 5], transforms[t + 6]),
+                        "align": _ALIGNS.get(aligns[index], Align.MIDDLE),
+                        "layer": layers[index],
+                        "cache_as_bitmap": bool(flags[index] & _CACHE_AS_BITMAP),
+                    }
+
+                    cls = classes[class_ids[index]]
+                    row = text_rows.get(index)
+                    if row is not None:
+                        rgba = tuple(colors[row * 4:row * 4 + 4])
+                        color = shared_colors.get(rgba)
+                        if color is None:
+                            color = shared_colors[rgba] = Color(*rgba)
+                        kwargs.update(
+                            text=strings[texts[row]],
+                            font=loaded_fonts[fonts[row]],
+                            font_size=font_sizes[row],
+                            color=color,
+                            text_align=TextAlign(text_aligns[row * 2], text_aligns[row * 2 + 1]),
+                            padding=paddings[row],
+                            word_wrap=bool(text_flags[row] & _WORD_WRAP),
+                            async_render=bool(text_flags[row] & _ASYNC_RENDER),
+                            rotation_step=steps[row * 2],
+                            scale_step=steps[row * 2 + 1],
+                        )
+                        if cls is None or not issubclass(cls, Text):
+                            cls = Text
+                    elif cls is None:
+                        cls = BaseObject
+
+                    obj = cls(**kwargs)
+                    if flags[index] & _DETACHED:
+                        # constructed inactive, the object is still in the lists and would be drawn
+                        scene._detach_object(obj, 0 if parent >= 0 else 1)
+                    objects.append(obj)
+        finally:
+            Text.line_source = line_source
+        return objects
+    #endregion
+
+    #region Public
+    @staticmethod
+    def save(scene: 'Scene', path: str | os.PathLike, rasters: bool = True) -> None:
+        """
+        Writes the objects of `scene` to the file at `path`.\n
+        With `rasters`, the lines of the texts are stored as rendered at the current scale factor,
+        so that loading does not render them again unless the scale factor changed. They make the
+        file larger: about 60 bytes for a short line.
+        """
+        with open(path, "wb") as file:
+            file.write(SceneFile._encode(scene, rasters))
+
+    @staticmethod
+    def load(scene: 'Scene', path: str | os.PathLike) -> list[BaseObject]:
+        """Creates the objects saved in the file at `path` in `scene` and returns them, parents before their children."""
+        columns = SceneFile._read(path)
+        if columns is None:
+            return []
+        return SceneFile._create(scene, columns)
+
+    @staticmethod
+    def loader(path: str | os.PathLike) -> Callable[['Scene'], None]:
+        """Returns an init function loading the file at `path`, for `Scene` and `SceneManager.scene`."""
+        def init_func(scene: 'Scene') -> None:
+            SceneFile.load(scene, path)
+        return init_func
+    #endregion
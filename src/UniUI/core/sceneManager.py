@@ -5,19 +5,50 @@ class SceneManager:
     def __init__(self) -> None:
         self.scenes: dict[str, Scene] = {}
         self.active_scene: Scene = None
+        self.__running_async: bool = False
+        self.__next_scene: str | None = None # scene to load once the active one stops, see `run_async`
         
-    def scene(self, name):
+    def scene(
+            self, name, dirty_rects: bool = False, transform_store: bool = False,
+            tick_rate: int | None = None, render_rate: int | None = None, on_demand: bool = False):
         def decorator(init_func: Callable[[Scene], None]) -> Scene:
-            scene = Scene(name, init_func)
+            scene = Scene(name, init_func, dirty_rects, transform_store, tick_rate, render_rate, on_demand)
             self.scenes[name] = scene
             return scene
         return decorator
         
     def load_scene(self, name: str) -> None:
+        if self.__running_async:
+            # the loop of `run_async` loads it once the active scene stops
+            self.__next_scene = name
+            if self.active_scene:
+                self.active_scene.unload()
+            return
+
         if self.active_scene:
             self.active_scene.unload()
             
         scene = self.scenes.get(name)
         if scene:
             self.active_scene = scene
-            scene.load()
\ No newline at end of file
+            scene.load()
+
+    async def run_async(self, name: str) -> None:
+        """
+        Loads the scene `name` and runs it inside the running asyncio event loop, e.g.
+        `asyncio.run(manager.run_async("main"))`. Returns once no scene is loaded anymore.
+        """
+        self.__running_async = True
+        self.__next_scene = name
+        try:
+            while self.__next_scene is not None:
+                name, self.__next_scene = self.__next_scene, None
+                if self.active_scene and self.active_scene._is_loaded:
+                    self.active_scene.unload()
+
+                scene = self.scenes.get(name)
+                if scene:
+                    self.active_scene = scene
+                    await scene.load_async()
+        finally:
+            self.__running_async = False
@@ -29,6 +29,9 @@ class Screen:
         else:
             Console.error("Screen: the screen has already been created")
             return
+
+        # only the modules the framework needs, the others are initialized by the application if it uses them
+        pygame.display.init()
         
         self.title = title
         self.icon = icon
@@ -38,13 +41,13 @@ class Screen:
         self.pg_flags = pg_flags
         self.vsync = vsync
         self.scale_factor = None
+        self._layout_version: int = 0 # bumped whenever resolution or scale_factor changes
 
         self._screen: pygame.Surface = None
-        self.__system_refresh_rate = system.get_refresh_rate()
         self._refresh_rate_object = pygame.time.Clock()
         self._refresh_rate = (
             refresh_rate if isinstance(refresh_rate, int) and refresh_rate != -1 
-                        else self.__system_refresh_rate
+                        else system.get_refresh_rate()
         )
         self._fps: int = None
 
@@ -73,6 +76,7 @@ class Screen:
         self._screen = pygame.display.set_mode(new_resolution.xy, self.pg_flags, vsync = self.vsync)
         self.resolution = new_resolution
         self._calc_scale_factor()
+        self._layout_version += 1
     
     def _calc_scale_factor(self) -> float:
         self.scale_factor = pow(self.resolution.x / self.referense_resolution.x, 1-self.priority) * \
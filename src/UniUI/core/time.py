@@ -10,11 +10,36 @@ class Time:
             raise Exception("Time: the time object has already been created")
 
         self.__delta_time: float = None
+        self.__fixed_delta_time: float = None
+        self.__alpha: float = 1.0
     
     @property
     def delta_time(self) -> float:
+        """Seconds covered by the current update, equal to `fixed_delta_time` when the scene uses a tick rate."""
         return self.__delta_time
+
+    @property
+    def fixed_delta_time(self) -> float:
+        """Length of a logic tick in seconds, None when updates run once per frame."""
+        return self.__fixed_delta_time
+
+    @property
+    def alpha(self) -> float:
+        """
+        Fraction of the next logic tick already elapsed when the frame is drawn, from 0 to 1.\n
+        Drawing `previous + (current - previous) * alpha` smooths the motion between ticks.
+        Always 1 when updates run once per frame.
+        """
+        return self.__alpha
     
     @staticmethod
     def _update_delta_time(value: float) -> None:
-        Time.Instance.__delta_time = value
\ No newline at end of file
+        Time.Instance.__delta_time = value
+
+    @staticmethod
+    def _update_fixed_delta_time(value: float | None) -> None:
+        Time.Instance.__fixed_delta_time = value
+
+    @staticmethod
+    def _update_alpha(value: float) -> None:
+        Time.Instance.__alpha = value
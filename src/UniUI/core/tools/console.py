@@ -1,4 +1,4 @@
-import sys, os, inspect, time, linecache, ast
+import sys, time, linecache, ast
 
 class Color:
 
@@ -53,10 +53,21 @@ class Color:
         BRIGHT_WHITE:   str = '\033[107m'
 
 class CallerInfo:
-    def __init__(self, filename: str, lineno: int, code_context: list[str] | str | None):
+    def __init__(self, filename: str, lineno: int, code_context: list[str] | str | None = None):
         self.filename = filename
         self.lineno = lineno
-        self.code_context = code_context
+        self._code_context = code_context
+
+    @property
+    def code_context(self) -> list[str] | str:
+        """Source line of the call, read only when it is actually needed."""
+        if self._code_context is None:
+            self._code_context = linecache.getline(self.filename, self.lineno).strip()
+        return self._code_context
+
+    @code_context.setter
+    def code_context(self, value: list[str] | str | None) -> None:
+        self._code_context = value
 
     def __repr__(self):
         return f"CallerInfo(filename={self.filename!r}, lineno={self.lineno}, code_context={self.code_context!r})"
@@ -87,24 +98,20 @@ class Console:
     
     @staticmethod
     def _get_root_caller_info() -> CallerInfo:
-        stack = inspect.stack()
-
-        update_index = None
-        for i, frame in enumerate(stack):
-            if frame.function == "update":
-                update_index = i
+        """
+        Finds the innermost `update` frame of the call stack, or the outermost frame if there is none.\n
+        Only follows frame links, the source line is read lazily by `CallerInfo.code_context`.
+        """
+        frame = sys._getframe()
+        target_frame = None
+        while frame is not None:
+            if frame.f_code.co_name == "update" and frame.f_back is not None:
+                target_frame = frame
                 break
+            target_frame = frame
+            frame = frame.f_back
 
-        if update_index is not None and update_index + 1 < len(stack):
-            target_frame = stack[update_index]
-        else:
-            target_frame = stack[-1]
-
-        filename = target_frame.filename
-        lineno = target_frame.lineno
-        code_context = target_frame.code_context[0].strip()
-
-        return CallerInfo(filename, lineno, code_context)
+        return CallerInfo(target_frame.f_code.co_filename, target_frame.f_lineno)
 
     @staticmethod
     def log(message: str) -> None:
@@ -135,4 +142,7 @@ class Console:
 
     @staticmethod
     def clear() -> None:
-        os.system("cls" if sys.platform == "win32" else "clear -r")
\ No newline at end of file
+        """Clears the terminal with escape codes, does nothing if the output is not a terminal."""
+        if sys.stdout is not None and sys.stdout.isatty():
+            sys.stdout.write("\033[2J\033[H")
+            sys.stdout.flush()
\ No newline at end of file
@@ -0,0 +1,305 @@
+try:
+    import numpy as np
+except ImportError: # numpy is an optional dependency, only required by TransformStore
+    np = None
+
+from .screen import Screen
+from .ui.align import Align
+
+
+# Alignment of every axis expressed as a mode, indexed by Align.value.
+# Root objects:  0 = at the start, 1 = centered, 2 = at the end of the screen.
+# Child objects: 0 = no offset, -1 = outside before the parent, 1 = after the parent.
+_ROOT_MODES = {
+    Align.MIDDLE:       (1, 1),
+    Align.LEFT:         (0, 1),
+    Align.RIGHT:        (2, 1),
+    Align.TOP:          (1, 0),
+    Align.BOTTOM:       (1, 2),
+    Align.TOPLEFT:      (0, 0),
+    Align.TOPRIGHT:     (2, 0),
+    Align.BOTTOMLEFT:   (0, 2),
+    Align.BOTTOMRIGHT:  (2, 2),
+}
+_CHILD_MODES = {
+    Align.MIDDLE:       (0, 0),
+    Align.LEFT:         (-1, 0),
+    Align.RIGHT:        (1, 0),
+    Align.TOP:          (0, -1),
+    Align.BOTTOM:       (0, 1),
+    Align.TOPLEFT:      (-1, -1),
+    Align.TOPRIGHT:     (1, -1),
+    Align.BOTTOMLEFT:   (-1, 1),
+    Align.BOTTOMRIGHT:  (1, 1),
+}
+
+
+class TransformStore:
+    """
+    Scene-level struct-of-arrays copy of the object transforms (requires numpy).\n
+    Objects keep their `Transform` as the source of truth; the store mirrors the rows of
+    objects whose transform, align or parent changed and recomputes the align offsets and
+    world transforms of those rows and their descendants with a few vectorized passes, one per
+    hierarchy level. The rows are kept in preorder, so the descendants of a row are one range.
+    Objects with an outdated world transform then read it from their row instead of computing it.
+    """
+
+    INITIAL_CAPACITY = 256
+
+    def __init__(self) -> None:
+        if np is None:
+            raise ImportError("TransformStore requires numpy, install it with `pip install numpy`")
+
+        self._capacity: int = 0
+        self._count: int = 0 # high-water mark of used rows
+        self._free_rows: list[int] = []
+        self._objects: list['BaseObject | None'] = [] # object owning each row
+
+        self._dirty: dict['BaseObject', None] = {}
+        self._structure_dirty: bool = True
+        self._version: int = -1
+
+        # the hierarchy, rebuilt when rows are added, removed or reparented
+        self._order: 'np.ndarray' = np.zeros(0, dtype=np.int32) # alive rows in preorder
+        self._order_index: 'np.ndarray' = np.zeros(0, dtype=np.int32) # position of every row in `_order`
+        self._subtree_size: 'np.ndarray' = np.zeros(0, dtype=np.int32) # rows in the subtree of every row
+        self._depth: 'np.ndarray' = np.zeros(0, dtype=np.int32)
+
+        self._root_modes = np.zeros((len(Align) + 1, 2), dtype=np.int8)
+        self._child_modes = np.zeros((len(Align) + 1, 2), dtype=np.int8)
+        for align in Align:
+            self._root_modes[align.value] = _ROOT_MODES[align]
+            self._child_modes[align.value] = _CHILD_MODES[align]
+
+        self._grow(TransformStore.INITIAL_CAPACITY)
+
+    def __len__(self) -> int:
+        return self._count - len(self._free_rows)
+
+    #region Private
+    def _grow(self, capacity: int) -> None:
+        def resize(array: 'np.ndarray | None', shape: tuple, dtype, fill) -> 'np.ndarray':
+            new = np.full(shape, fill, dtype=dtype)
+            if array is not None:
+                new[:len(array)] = array
+            return new
+
+        get = lambda name: getattr(self, name, None)
+        self.position       = resize(get("position"), (capacity, 2), np.float64, 0.0)
+        self.size           = resize(get("size"), (capacity, 2), np.float64, 0.0)
+        self.scale          = resize(get("scale"), (capacity, 2), np.float64, 1.0)
+        self.rotation       = resize(get("rotation"), (capacity,), np.float64, 0.0)
+        self.align          = resize(get("align"), (capacity,), np.int8, Align.MIDDLE.value)
+        self.parent         = resize(get("parent"), (capacity,), np.int32, -1)
+        self.alive          = resize(get("alive"), (capacity,), np.bool_, False)
+
+        # one row of results per object, read at once by `read`
+        self.results        = resize(get("results"), (capacity, 7), np.float64, (0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 0.0))
+        self.world_position = self.results[:, 0:2]
+        self.world_scale    = self.results[:, 2:4]
+        self.world_rotation = self.results[:, 4]
+        self.align_offset   = self.results[:, 5:7]
+
+        self._capacity = capacity
+
+    def _row_of(self, obj: 'BaseObject') -> int:
+        row = obj._store_row
+        if row is not None:
+            return row
+
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            if self._count == self._capacity:
+                self._grow(self._capacity * 2)
+            row = self._count
+            self._count += 1
+            self._objects.append(None)
+
+        self.alive[row] = True
+        self._objects[row] = obj
+        obj._store_row = row
+        self._structure_dirty = True
+        return row
+
+    def _write_rows(self, objects: list['BaseObject']) -> 'np.ndarray':
+        """Copies the transforms of `objects` into their rows at once, returns the rows."""
+        row_of = self._row_of
+        rows: list[int] = []
+        parents: list[int] = []
+        aligns: list[int] = []
+        values: list[float] = []
+        extend = values.extend
+        for obj in objects:
+            row = obj._store_row
+            rows.append(row if row is not None else row_of(obj))
+            parent = obj._parent
+            parents.append(-1 if parent is None else parent._store_row if parent._store_row is not None else row_of(parent))
+            aligns.append(obj._align._value_) # `Align.value` is a much slower property
+            transform = obj._transform
+            position, size, scale = transform._position, transform._size, transform._scale
+            extend((position._x, position._y, size._x, size._y, scale._x, scale._y, transform._rotation))
+
+        rows = np.array(rows, dtype=np.int64)
+        values = np.array(values, dtype=np.float64).reshape(-1, 7)
+        self.position[rows] = values[:, 0:2]
+        self.size[rows] = values[:, 2:4]
+        self.scale[rows] = values[:, 4:6]
+        self.rotation[rows] = values[:, 6]
+        self.align[rows] = aligns
+
+        parents = np.array(parents, dtype=np.int32)
+        if (self.parent[rows] != parents).any():
+            self.parent[rows] = parents
+            self._structure_dirty = True
+        return rows
+
+    def _rebuild_order(self) -> None:
+        """Lays the alive rows out in preorder and measures the depth and the subtree of every row."""
+        n = self._count
+        parent = self.parent[:n]
+        alive = np.flatnonzero(self.alive[:n])
+
+        depth = np.zeros(n, dtype=np.int32)
+        ancestor = parent.copy()
+        has_ancestor = ancestor >= 0
+        while has_ancestor.any():
+            depth[has_ancestor] += 1
+            ancestor[has_ancestor] = parent[ancestor[has_ancestor]]
+            has_ancestor = ancestor >= 0
+
+        alive_depth = depth[alive]
+        by_depth = alive[np.argsort(alive_depth, kind="stable")]
+        counts = np.bincount(alive_depth) if len(alive) else np.zeros(0, dtype=np.int64)
+        levels = np.split(by_depth, np.cumsum(counts)[:-1]) if len(counts) else []
+
+        # subtree sizes from the deepest level up
+        size = np.ones(n, dtype=np.int32)
+        for rows in reversed(levels[1:]):
+            np.add.at(size, parent[rows], size[rows])
+
+        # every row starts after its parent and the subtrees of its previous siblings
+        index = np.zeros(n, dtype=np.int32)
+        for depth_level, rows in enumerate(levels):
+            owners = parent[rows]
+            rows = rows[np.argsort(owners, kind="stable")]
+            owners = parent[rows]
+            ends = np.cumsum(size[rows])
+            starts = ends - size[rows]
+            if depth_level:
+                first = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]])
+                group_starts = np.repeat(starts[first], np.diff(np.r_[first, len(rows)]))
+                index[rows] = index[owners] + 1 + (starts - group_starts)
+            else:
+                index[rows] = starts
+
+        order = np.empty(len(alive), dtype=np.int32)
+        order[index[alive]] = alive
+        self._order = order
+        self._order_index = index
+        self._subtree_size = size
+        self._depth = depth
+        self._structure_dirty = False
+
+    def _subtree_rows(self, rows: 'np.ndarray') -> 'np.ndarray':
+        """Returns the rows of the subtrees of `rows` in preorder, each row once."""
+        if not len(rows):
+            return rows
+        starts = self._order_index[rows]
+        ends = starts + self._subtree_size[rows]
+        sort = np.argsort(starts, kind="stable")
+        starts = starts[sort]
+        ends = ends[sort]
+
+        # subtrees are either nested or disjoint, the nested ones are already covered
+        covered = np.r_[0, np.maximum.accumulate(ends)[:-1]]
+        keep = starts >= covered
+        starts = starts[keep]
+        lengths = ends[keep] - starts
+
+        total = int(lengths.sum())
+        offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        return self._order[offsets + np.arange(total)]
+
+    def _compute(self, rows: 'np.ndarray') -> None:
+        """Recomputes the align offsets and world transforms of `rows`, the parents of the others must be up to date."""
+        scale_factor = Screen.Instance.scale_factor
+        resolution = np.array(Screen.Instance.resolution.xy, dtype=np.float64)
+
+        depth = self._depth[rows]
+        for level in range(int(depth.min()), int(depth.max()) + 1) if len(rows) else ():
+            level_rows = rows[depth == level]
+            own_size = self.size[level_rows] * scale_factor
+            code = self.align[level_rows]
+
+            # the same expressions as BaseObject._get_align_offset_root/_child
+            if level == 0:
+                modes = self._root_modes[code]
+                offset = np.where(
+                    modes == 1, resolution // 2 - own_size // 2,
+                    np.where(modes == 2, resolution - own_size, 0.0)
+                )
+                self.align_offset[level_rows] = offset
+                self.world_position[level_rows] = offset + self.position[level_rows]
+                self.world_scale[level_rows] = self.scale[level_rows]
+                self.world_rotation[level_rows] = self.rotation[level_rows]
+                continue
+
+            parents = self.parent[level_rows]
+            modes = self._child_modes[code]
+            offset = np.where(
+                modes == -1, -own_size,
+                np.where(modes == 1, self.size[parents] * scale_factor, 0.0)
+            )
+            self.align_offset[level_rows] = offset
+            self.world_position[level_rows] = (self.world_position[parents] + offset) + self.position[level_rows]
+            self.world_scale[level_rows] = self.scale[level_rows] * self.world_scale[parents]
+            self.world_rotation[level_rows] = self.rotation[level_rows] + self.world_rotation[parents]
+
+    #endregion
+
+    #region Public
+    @property
+    def is_synced(self) -> bool:
+        """Whether the arrays reflect the current transforms of all objects."""
+        return not self._dirty and self._version == Screen.Instance._layout_version
+
+    def mark_dirty(self, obj: 'BaseObject') -> None:
+        """Schedules the row of `obj` to be refreshed from its transform on the next sync."""
+        self._dirty[obj] = None
+
+    def remove(self, obj: 'BaseObject') -> None:
+        self._dirty.pop(obj, None)
+        row = obj._store_row
+        if row is None:
+            return
+
+        obj._store_row = None
+        self._objects[row] = None
+        self.alive[row] = False
+        self.parent[row] = -1
+        self._free_rows.append(row)
+        self._structure_dirty = True
+
+    def sync(self) -> None:
+        """
+        Copies the changed transforms into the arrays and recomputes the world transforms of
+        the changed objects and their descendants, or of all objects if the screen layout changed.
+        The objects read the results when they need their world transform.
+        """
+        if self.is_synced:
+            return
+
+        dirty, self._dirty = self._dirty, {}
+        rows = self._write_rows(list(dirty)) if dirty else np.zeros(0, dtype=np.int64)
+        if self._structure_dirty:
+            self._rebuild_order()
+
+        version = Screen.Instance._layout_version
+        self._compute(self._order if version != self._version else self._subtree_rows(rows))
+        self._version = version
+
+    def read(self, obj: 'BaseObject') -> list[float]:
+        """Returns the world position x and y, world scale x and y, world rotation and align offset x and y of `obj`."""
+        return self.results[obj._store_row].tolist()
+    #endregion
@@ -0,0 +1,144 @@
+import os
+import string
+import pygame
+import pygame.freetype
+
+from typing import Iterable
+
+from ..tools.console import Console
+from ..screen import Screen
+
+
+pygame.freetype.init()
+
+
+class Fonts:
+    """
+    Registry of the loaded font faces.\n
+    `get` loads every font file or system family once and returns the same
+    `pygame.freetype.Font` to every caller, so texts and widgets can share faces
+    instead of parsing the same file again. Texts accept a name or path wherever
+    they accept a font and resolve it through the registry.
+    """
+
+    FONT_EXTENSIONS = (".ttf", ".otf", ".ttc", ".fon", ".pfb", ".woff", ".woff2")
+    DEFAULT_CHARACTERS = string.ascii_letters + string.digits + string.punctuation + " "
+
+    _fonts: dict[str, pygame.freetype.Font] = {} # key of the requested path or family -> face
+    _faces: dict[str, pygame.freetype.Font] = {} # file of the face -> face, shared by all its keys
+    _names: dict[str, pygame.freetype.Font] = {} # family name as requested -> face, skips resolving its key
+
+    #region Private
+    @staticmethod
+    def _is_path(name: str) -> bool:
+        return os.path.isfile(name) or os.path.splitext(name)[1].lower() in Fonts.FONT_EXTENSIONS
+
+    @staticmethod
+    def _key(name: str) -> str:
+        if Fonts._is_path(name):
+            return "file:" + os.path.normcase(os.path.abspath(name))
+        return "family:" + name.lower().replace(" ", "")
+
+    @staticmethod
+    def __remember(name: str, key: str, font: pygame.freetype.Font) -> None:
+        # relative paths depend on the working directory, only families are looked up by name
+        if key.startswith("family:"):
+            Fonts._names[name] = font
+
+    @staticmethod
+    def _load(name: str) -> pygame.freetype.Font | None:
+        if not Fonts._is_path(name):
+            return pygame.freetype.SysFont(name, 0)
+        try:
+            return pygame.freetype.Font(name, 0)
+        except (OSError, IOError) as error:
+            Console.error(f"Cannot load the font '{name}': {error}")
+            return None
+    #endregion
+
+    #region Public
+    @staticmethod
+    def get(name: str | os.PathLike) -> pygame.freetype.Font | None:
+        """
+        Returns the shared face of a font file or a system font family, loading it on first use.
+        Families missing on the system resolve to the pygame default font, like `SysFont`.
+        Returns None if a font file cannot be loaded.
+        """
+        name = os.fspath(name)
+        font = Fonts._names.get(name)
+        if font is not None:
+            return font
+
+        key = Fonts._key(name)
+        font = Fonts._fonts.get(key)
+        if font is not None:
+            Fonts.__remember(name, key, font)
+            return font
+
+        font = Fonts._load(name)
+        if font is None:
+            return None
+
+        # several names can resolve to the same file, e.g. a family and its path
+        if font.path:
+            font = Fonts._faces.setdefault(os.path.normcase(os.path.abspath(font.path)), font)
+        Fonts._fonts[key] = font
+        Fonts.__remember(name, key, font)
+        return font
+
+    @staticmethod
+    def prewarm(font: pygame.freetype.Font | str | os.PathLike, sizes: Iterable[float], characters: str = DEFAULT_CHARACTERS) -> None:
+        """
+        Renders `characters` at every size of `sizes` to fill the glyph cache of the face,
+        e.g. during a loading screen. The sizes are `Text.font_size` values: they are scaled
+        by the current scale factor of the screen like the texts are.
+        """
+        if not isinstance(font, pygame.freetype.Font):
+            font = Fonts.get(font)
+            if font is None:
+                return
+
+        scale_factor = Screen.Instance.scale_factor if Screen.Instance is not None else 1
+        characters = "".join(dict.fromkeys(characters)) # every glyph once
+        for size in sizes:
+            font.render_raw(characters, size=size * scale_factor)
+
+    @staticmethod
+    def release(name: str | os.PathLike) -> None:
+        """Forgets the face registered for `name`; it is freed once no text uses it anymore."""
+        font = Fonts._fonts.pop(Fonts._key(os.fspath(name)), None)
+        Fonts._names.clear()
+        if font is not None and font not in Fonts._fonts.values():
+            for path, face in list(Fonts._faces.items()):
+                if face is font:
+                    del Fonts._faces[path]
+
+    @staticmethod
+    def clear() -> None:
+        """Forgets all the registered faces."""
+        Fonts._fonts.clear()
+        Fonts._faces.clear()
+        Fonts._names.clear()
+
+    @staticmethod
+    def count() -> int:
+        """Returns the number of distinct loaded faces."""
+        return len({id(font) for font in Fonts._fonts.values()})
+
+    @staticmethod
+    def stats() -> dict[str, object]:
+        """
+        Returns the number of loaded faces and their memory, estimated by the size of their files
+        (FreeType keeps the whole file in memory; the glyph caches are not reported by pygame).
+        """
+        faces = []
+        seen: set[int] = set()
+        for key, font in Fonts._fonts.items():
+            if id(font) in seen:
+                continue
+            seen.add(id(font))
+            size = os.path.getsize(font.path) if font.path and os.path.isfile(font.path) else 0
+            faces.append({"name": font.name, "path": font.path, "bytes": size})
+
+        return {"faces": len(faces), "bytes": sum(face["bytes"] for face in faces), "fonts": faces}
+    #endregion
@@ -1,44 +1,87 @@
 import pygame
 import pygame.freetype
+import math
 import numbers
+import os
+import threading
+
+from typing import Mapping
 
 from ..object import BaseObject
-from ..math.vector2 import Vector2
+from ..math.vector2 import Vector2, _is_real
 from ..ui.color import Color
 from ..ui.align import TextAlign, TextAlignX, TextAlignY
+from ..ui.fonts import Fonts
+from ..ui.textLayout import TextLayout
 from ..tools.console import Console
 from ..screen import Screen
-
-
-pygame.freetype.init()
+from ..utils.cache import SurfaceCache
+from ..utils.rasterPool import RasterPool
 
 
 DEFAULT_FONT_NAME = "Arial"
-DEFAULT_FONT = pygame.freetype.SysFont(DEFAULT_FONT_NAME, 0)
 DEFAULT_FONT_SIZE = 16
 DEFAULT_PADDING = 0
+DEFAULT_COLOR = Color() # colors cannot be changed, the texts created without one share it
+DEFAULT_LINE_CACHE_BYTES = 32 * 1024 * 1024
+DEFAULT_TRANSFORM_CACHE_BYTES = 32 * 1024 * 1024
+DEFAULT_ROTATION_STEP = 0.5 # degrees
+DEFAULT_SCALE_STEP = 0.01
+
+# rendered lines shared by every Text, keyed by (font, size, color, line)
+LINE_CACHE = SurfaceCache(DEFAULT_LINE_CACHE_BYTES)
+# rotated and scaled surfaces shared by every Text, keyed by (content, quantized rotation, quantized scale)
+TRANSFORM_CACHE = SurfaceCache(DEFAULT_TRANSFORM_CACHE_BYTES)
+# horizontal advances of the glyphs measured for wrapping, keyed by (font, size)
+GLYPH_ADVANCES: dict[tuple[pygame.freetype.Font, float], dict[str, float]] = {}
+# workers of the texts with `async_render` enabled
+RASTER_POOL = RasterPool()
+# freetype and the caches are not thread-safe, the lines are rendered by one thread at a time
+_RENDER_LOCK = threading.Lock()
+
+
+def get_default_font() -> pygame.freetype.Font:
+    """Returns the font of the texts created without one, looked up among the system fonts on first use."""
+    return Fonts.get(DEFAULT_FONT_NAME)
+
+
+def __getattr__(name: str) -> object:
+    # DEFAULT_FONT is resolved lazily, the system font lookup is slow
+    if name == "DEFAULT_FONT":
+        return get_default_font()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Text(BaseObject):
 
+    line_cache: SurfaceCache = LINE_CACHE
+    transform_cache: SurfaceCache = TRANSFORM_CACHE
+    raster_pool: RasterPool = RASTER_POOL
+    # lines rendered in advance, looked up by the keys of `line_cache` before rendering a missing line, see `SceneFile`
+    line_source: Mapping[tuple, tuple[pygame.Surface, pygame.Rect]] = None
+
+    # the base object may invalidate the world transform before `__init__` sets these
+    _word_wrap: bool = False
+    _wrap_width: float = None # width of the transform the lines were last wrapped within
+
     def __init__(self, name: str, scene: str, **kwargs: dict[str, object]) -> None:
         super().__init__(name=name, scene=scene, **kwargs)
 
-        self._text: str = kwargs.get("text", "Hello, World!")
-        self._color: Color = kwargs.get("color", Color())
-        self._font_size: float = kwargs.get("font_size", DEFAULT_FONT_SIZE)
-        self._text_align: TextAlign = kwargs.get("text_align", TextAlign())
-        
-        padding = kwargs.get("padding", None)
-        self._padding: float = padding if isinstance(padding, numbers.Real) else DEFAULT_PADDING
-
+        self.__set_properties(kwargs)
         self._preffered_size: Vector2 = Vector2(0, 0)
-
-        font = kwargs.get("font", None)
-        self.__font: pygame.freetype.Font = font if isinstance(font, pygame.freetype.Font) else DEFAULT_FONT
         self.__surface: pygame.Surface = None
-
-        self.__update_surface()
+        # unrotated and unscaled raster, kept for the content it was rendered from
+        self.__base: pygame.Surface = None
+        self.__base_content: tuple = None
+        self.__layout: TextLayout = TextLayout()
+        # render position cached for the world position it was computed from
+        self.__render_origin: Vector2 = None
+        self.__render_position: tuple[float, float] = (0, 0)
+
+        if self.scene._batch_depth:
+            self._request_refurbish() # rendered with the other texts when the batch ends
+        else:
+            self.__update_surface()
 
     #region Properties
     @property
@@ -67,121 +110,324 @@ class Text(BaseObject):
     
     @property
     def preffered_size(self) -> Vector2:
+        self._flush_refurbish()
         return self._preffered_size
+
+    @property
+    def async_render(self) -> bool:
+        """
+        Whether the text is rasterized by the workers of `Text.raster_pool` instead of the main thread.
+        The previous surface stays on screen until the new one is ready, it is swapped in at the start
+        of a frame; `preffered_size` is updated at the same time.
+        """
+        return self._async_render
+
+    @property
+    def word_wrap(self) -> bool:
+        """
+        Whether the lines are wrapped within the width of the transform, between words where possible.
+        Nothing is wrapped while the width is 0.
+        """
+        return self._word_wrap
+
+    @property
+    def rotation_step(self) -> float:
+        """
+        Degrees the rotation is rounded to before the surface is rotated, 0 to rotate by the exact angle.
+        Coarser steps let animations reuse more of the surfaces in `Text.transform_cache`.
+        """
+        return self._rotation_step
+
+    @property
+    def scale_step(self) -> float:
+        """Step the scale is rounded to before the surface is scaled, 0 to scale by the exact value."""
+        return self._scale_step
     #endregion
     
     #region Setters
     @text.setter
     def text(self, value: str) -> None:
-        self._text = str(value)
-        self.__update_surface()
+        value = str(value)
+        if value != self._text:
+            self._text = value
+            self._request_refurbish()
     
     @color.setter
     def color(self, value: Color) -> None:
         if isinstance(value, Color):
-            self._color = value
-            self.__update_surface()
+            if value != self._color:
+                self._color = value
+                self._request_refurbish()
         else:
             Console.error("Invalid color value")
     
     @font.setter
-    def font(self, value: str | None) -> None:
+    def font(self, value: pygame.freetype.Font | str | os.PathLike) -> None:
+        if isinstance(value, (str, os.PathLike)):
+            # a path or a family name, shared through the registry
+            value = Fonts.get(value)
+            if value is None:
+                return
         if isinstance(value, pygame.freetype.Font):
-            self.__font = value
-            self.__update_surface()
+            if value is not self.__font:
+                self.__font = value
+                self._request_refurbish()
         else:
-            Console.error("The font must be an object of type pygame.freetype.Font")
+            Console.error("The font must be an object of type pygame.freetype.Font, a font path or a family name")
     
     @font_size.setter
     def font_size(self, value: numbers.Real) -> None:
         if isinstance(value, numbers.Real):
-            self._font_size = value
-            self.__update_surface()
+            if value != self._font_size:
+                self._font_size = value
+                self._request_refurbish()
         else:
             Console.error("The value must be an integer")
     
     @text_align.setter
     def text_align(self, value: TextAlign) -> None:
         if isinstance(value, TextAlign):
-            self._text_align = value
-            self.__update_surface()
+            if (value.x, value.y) != (self._text_align.x, self._text_align.y):
+                self._text_align = value
+                self._request_refurbish()
         else:
             Console.error("The value must be an integer")
     
     @padding.setter
     def padding(self, value: numbers.Real) -> None:
         if isinstance(value, numbers.Real):
-            self._padding = value
-            self.__update_surface()
+            if value != self._padding:
+                self._padding = value
+                self._request_refurbish()
         else:
             Console.error("The value must be a number")
     
     @preffered_size.setter
     def preffered_size(self, value: Vector2) -> None:
         Console.error("You cannot change preffered_size, it is a private variable.")
+
+    @async_render.setter
+    def async_render(self, value: bool) -> None:
+        if isinstance(value, bool):
+            if value != self._async_render:
+                self._async_render = value
+                if not value:
+                    Text.raster_pool.cancel(self)
+                self._request_refurbish()
+        else:
+            Console.error(f"Expected bool for 'async_render', got {type(value).__name__}")
+
+    @word_wrap.setter
+    def word_wrap(self, value: bool) -> None:
+        if isinstance(value, bool):
+            if value != self._word_wrap:
+                self._word_wrap = value
+                self._request_refurbish()
+        else:
+            Console.error(f"Expected bool for 'word_wrap', got {type(value).__name__}")
+
+    @rotation_step.setter
+    def rotation_step(self, value: numbers.Real) -> None:
+        if isinstance(value, numbers.Real) and value >= 0:
+            if value != self._rotation_step:
+                self._rotation_step = value
+                self._request_refurbish()
+        else:
+            Console.error(f"Expected non-negative number for 'rotation_step', got {value!r}")
+
+    @scale_step.setter
+    def scale_step(self, value: numbers.Real) -> None:
+        if isinstance(value, numbers.Real) and value >= 0:
+            if value != self._scale_step:
+                self._scale_step = value
+                self._request_refurbish()
+        else:
+            Console.error(f"Expected non-negative number for 'scale_step', got {value!r}")
     #endregion
 
     #region Private
+    def __set_properties(self, kwargs: dict[str, object]) -> None:
+        self._text: str = kwargs.get("text", "Hello, World!")
+        self._color: Color = kwargs.get("color", DEFAULT_COLOR)
+        self._font_size: float = kwargs.get("font_size", DEFAULT_FONT_SIZE)
+        text_align = kwargs.get("text_align", None)
+        self._text_align: TextAlign = text_align if text_align is not None else TextAlign()
+        
+        padding = kwargs.get("padding", None)
+        self._padding: float = padding if _is_real(padding) else DEFAULT_PADDING
 
-    def __render_lines(self) -> tuple[dict[pygame.Surface, pygame.Rect], int, int]:
-        lines = self._text.split("\n")
-        lenght = len(lines)
-        rendered_lines: dict[pygame.Surface, pygame.Rect] = {}
-        width = height = 0
-
-        for line in lines:
-            surf, size = self.__font.render(
-                text=line,
-                fgcolor=self._color.rgba,
-                size=self._font_size*Screen.Instance.scale_factor
-            )
-
-            surf = surf.convert_alpha()
-            rendered_lines[surf] = size
-            height += size.height
-            width = max(width, size.width)
-
-        height += self._padding * Screen.Instance.scale_factor * (lenght - 1)
-
-        return rendered_lines, width, height
+        font = kwargs.get("font", None)
+        if isinstance(font, (str, os.PathLike)):
+            font = Fonts.get(font)
+        self.__font: pygame.freetype.Font = font if isinstance(font, pygame.freetype.Font) else get_default_font()
+        async_render = kwargs.get("async_render", False)
+        self._async_render: bool = async_render if isinstance(async_render, bool) else False
+        word_wrap = kwargs.get("word_wrap", False)
+        self._word_wrap: bool = word_wrap if isinstance(word_wrap, bool) else False
+        rotation_step = kwargs.get("rotation_step", DEFAULT_ROTATION_STEP)
+        self._rotation_step: float = rotation_step if _is_real(rotation_step) and rotation_step >= 0 else DEFAULT_ROTATION_STEP
+        scale_step = kwargs.get("scale_step", DEFAULT_SCALE_STEP)
+        self._scale_step: float = scale_step if _is_real(scale_step) and scale_step >= 0 else DEFAULT_SCALE_STEP
+
+    def _reset(self, **kwargs: dict[str, object]) -> None:
+        super()._reset(**kwargs)
+        self.__set_properties(kwargs)
+        # the previous surface and layout stay until the refurbish, unchanged lines are reused
+        self.__render_origin = None
+        self._request_refurbish()
+
+    @staticmethod
+    def _render_line(font: pygame.freetype.Font, line: str, font_size: float, color: tuple[int, int, int, int]) -> tuple[pygame.Surface, pygame.Rect]:
+        key = (font, font_size, color, line)
+        with _RENDER_LOCK:
+            rendered = Text.line_cache.get(key)
+            if rendered is None:
+                rendered = Text.line_source.get(key) if Text.line_source is not None else None
+                if rendered is None:
+                    surf, size = font.render(text=line, fgcolor=color, size=font_size)
+                    rendered = (surf.convert_alpha(), size)
+                surf = rendered[0]
+                Text.line_cache.put(key, rendered, surf.get_bytesize() * surf.get_width() * surf.get_height())
+        return rendered
+
+    @staticmethod
+    def _measure(font: pygame.freetype.Font, font_size: float, text: str) -> dict[str, float]:
+        """Returns the advances of the glyphs of `font` at `font_size`, measuring the ones of `text` not measured yet."""
+        with _RENDER_LOCK:
+            advances = GLYPH_ADVANCES.get((font, font_size))
+            if advances is None:
+                advances = GLYPH_ADVANCES[(font, font_size)] = {}
+            missing = "".join(set(text).difference(advances))
+            if missing:
+                for char, metrics in zip(missing, font.get_metrics(missing, size=font_size)):
+                    # characters without a glyph are not drawn
+                    advances[char] = metrics[4] if metrics is not None else 0.0
+        return advances
+
+    @staticmethod
+    def _quantize(value: numbers.Real, step: float) -> float:
+        if step <= 0:
+            return value
+        # rounded again to drop the float error of the multiplication
+        return round(round(value / step) * step, 9)
+
+    @staticmethod
+    def _draw_outline(surface: pygame.Surface, color: tuple[int, int, int], rect: pygame.Rect) -> None:
+        """
+        Draws the one pixel outline of `rect`. `pygame.draw.rect` outlines the rect clipped to
+        the clip area instead, which leaves stale edges when only damaged areas are redrawn.
+        """
+        right, bottom = rect.right - 1, rect.bottom - 1
+        pygame.draw.lines(surface, color, True, (rect.topleft, (right, rect.top), (right, bottom), (rect.left, bottom)))
 
-    def __update_surface(self) -> None:
-        global_scale = self.global_scale
-        rendered_lines, width, height = self.__render_lines()
-        surface = pygame.Surface((width, height), pygame.SRCALPHA)
-
-        y = 0
-        for surf in rendered_lines:
-            surf_size = rendered_lines[surf]
-            if self._text_align.x == TextAlignX.RIGHT:
-                x = width - surf_size.width
-            elif self._text_align.x == TextAlignX.MIDDLE:
-                x = (width - surf_size.width) // 2
-            else:
-                x = 0
-
-            surface.blit(surf, (x, y))
-            y += surf_size.height + self._padding * Screen.Instance.scale_factor
+    def __get_raster_params(self) -> tuple[tuple, float, tuple[float, float]]:
+        """
+        Returns everything the surface depends on, so that it can be rasterized by another thread:
+        the content of the base raster and the quantized rotation and scale applied to it.
+        """
+        scale_factor = Screen.Instance.scale_factor
+        self._wrap_width = self._transform.width if self._word_wrap else None
+        wrap_width = self._transform.width * scale_factor if self._word_wrap and self._transform.width > 0 else None
+        content = (
+            self.__font, self._text, self._font_size * scale_factor, self._color.rgba,
+            self._text_align.x, self._padding * scale_factor, wrap_width
+        )
+        # full turns are dropped so that spinning texts come back to the same keys
+        rotation = Text._quantize(math.remainder(self.global_rotation, 360), self._rotation_step)
+        scale = self.global_scale
+        scale = (Text._quantize(scale.x, self._scale_step), Text._quantize(scale.y, self._scale_step))
+        return content, rotation, scale
+
+    @staticmethod
+    def _transform_base(base: pygame.Surface, rotation: numbers.Real, scale: tuple[float, float]) -> pygame.Surface:
+        """Returns `base` rotated and scaled, safe to call from any thread."""
+        surface = base
+        width, height = surface.get_size()
 
         # Apply rotation
-        global_rotation = self.global_rotation
-        if global_rotation != 0:
-            surface = pygame.transform.rotozoom(surface, global_rotation, 1)
+        if rotation != 0:
+            surface = pygame.transform.rotozoom(surface, rotation, 1)
             width, height = surface.get_size()
 
         # Apply scaling
-        if global_scale.x != 1 or global_scale.y != 1:
-            new_size = (Vector2(width, height) * global_scale).xy
+        if scale[0] != 1 or scale[1] != 1:
+            new_size = (width * scale[0], height * scale[1])
             surface = pygame.transform.smoothscale(surface, (max(0, new_size[0]), max(0, new_size[1])))
-            width, height = surface.get_size()
 
-        pygame.draw.rect(surface, (255, 0, 0), surface.get_rect(), 1)  # Debug border
-        pygame.draw.line(surface, (255, 0, 0), (0, height // 2), (width, height // 2))
-        pygame.draw.line(surface, (255, 0, 0), (width // 2, 0), (width // 2, height))
+        return surface
+
+    @staticmethod
+    def _rasterize(
+            layout: TextLayout, content: tuple, base: pygame.Surface | None,
+            rotation: numbers.Real, scale: tuple[float, float]) -> tuple[pygame.Surface, pygame.Surface]:
+        """
+        Lays out the base raster if `base` is None and transforms it, safe to call from any thread.
+        Returns the base raster and the transformed surface.
+        """
+        if base is None:
+            font, text, font_size, color, align_x, padding, wrap_width = content
+            base = layout.render(
+                text, (font, font_size, color), align_x, padding, wrap_width,
+                lambda line: Text._render_line(font, line, font_size, color),
+                lambda text: Text._measure(font, font_size, text)
+            )
+        return base, Text._transform_base(base, rotation, scale)
+
+    def _line_keys(self) -> list[tuple]:
+        """Returns the keys of `line_cache` of the lines of the text at the current scale factor."""
+        font, text, font_size, color, _, _, wrap_width = self.__get_raster_params()[0]
+        lines = TextLayout()._split(text, wrap_width, lambda text: Text._measure(font, font_size, text))
+        return [(font, font_size, color, line) for line in lines]
 
-        self._preffered_size = Vector2(width, height)
+    def __set_surface(self, surface: pygame.Surface) -> None:
+        self._preffered_size = Vector2(*surface.get_size())
         self.__surface = surface
+        self.__render_origin = None
+
+    def __store_raster(self, key: tuple, base: pygame.Surface, surface: pygame.Surface) -> None:
+        self.__base = base
+        self.__base_content = key[0]
+        Text.transform_cache.put(key, surface, surface.get_bytesize() * surface.get_width() * surface.get_height())
+        self.__set_surface(surface)
+
+    def __apply_raster(self, key: tuple, result: tuple[pygame.Surface, pygame.Surface]) -> None:
+        """Swaps in a surface rasterized by the pool and invalidates what `_flush_refurbish` would."""
+        self.__store_raster(key, *result)
+        self._invalidate_bitmap_caches()
+        self._invalidate_bounds()
+        self._damage()
+
+    def __update_surface(self) -> None:
+        # the render position depends on more than the raster, e.g. the vertical text align
+        self.__render_origin = None
+        key = self.__get_raster_params()
+        surface = Text.transform_cache.get(key)
+        if surface is not None:
+            if self._async_render:
+                # a job started for an older state must not replace the cached surface
+                Text.raster_pool.cancel(self)
+            if surface is not self.__surface:
+                self.__set_surface(surface)
+            return
+
+        content, rotation, scale = key
+        # a rotation or scale change reuses the glyphs rendered for the same content
+        base = self.__base if self.__base_content == content else None
+        layout = self.__layout
+        if self._async_render:
+            Text.raster_pool.submit(
+                self, lambda: Text._rasterize(layout, content, base, rotation, scale),
+                lambda result: self.__apply_raster(key, result), self.scene.request_frame
+            )
+        else:
+            self.__store_raster(key, *Text._rasterize(layout, content, base, rotation, scale))
     
+    def _invalidate_world_transform(self) -> None:
+        super()._invalidate_world_transform()
+        # the size of the transform only changes the layout, except for the wrapped lines
+        if self._word_wrap and self._transform.width != self._wrap_width:
+            self._request_refurbish()
+
     def _refurbish_interior(self):
         self.__update_surface()
         super()._refurbish_interior()
@@ -208,11 +454,38 @@ class Text(BaseObject):
                 pos.y += self._transform.height * Screen.Instance.scale_factor // 2 - self._preffered_size.y // 2
 
         return pos
+
+    def _get_render_xy(self) -> tuple[float, float]:
+        """Returns the render position, recomputed only when the world position or the surface changed."""
+        self._flush_refurbish()
+        self._update_world_transform()
+        if self.__render_origin is not self._world_position:
+            # every recomputation of the world transform creates a new world position vector
+            self.__render_origin = self._world_position
+            self.__render_position = self._get_text_align_offset(self._world_position.copy()).xy
+        return self.__render_position
+
+    def _get_screen_bounds(self) -> pygame.Rect | None:
+        if not self.__surface:
+            return None
+
+        scale_factor = Screen.Instance.scale_factor
+        bounds = pygame.Rect(self._get_render_xy(), self.__surface.get_size())
+        bounds.union_ip(pygame.Rect(
+            self._world_position.xy,
+            (self._transform.width * scale_factor, self._transform.height * scale_factor)
+        ))
+        # one extra pixel on each side covers rounding of float positions
+        return bounds.inflate(2, 2)
     #endregion
 
     #region Public 
     def get_render_position(self) -> Vector2:
-        return self._get_text_align_offset(self.global_position)
+        return Vector2(*self._get_render_xy())
+
+    def destroy(self, remove_from_parent: bool = True) -> None:
+        Text.raster_pool.cancel(self)
+        super().destroy(remove_from_parent)
     #endregion
 
     #region UniUI Hooks
@@ -223,21 +496,27 @@ class Text(BaseObject):
     def draw(self, surface: pygame.Surface) -> None:
         if self.__surface:
             
-            container_pos = self.global_position
+            render_position = self._get_render_xy()
+            container_pos = self._world_position
             container_width = self._transform.width
             container_height = self._transform.height
             
-            surface.blit(self.__surface, self.get_render_position().xy)
+            surface.blit(self.__surface, render_position)
             # FOR DEBUG
-            pygame.draw.rect(
-                surface, 
-                (255, 255, 255), 
-                (
-                    *container_pos.xy,
-                    container_width*Screen.Instance.scale_factor,
-                    container_height*Screen.Instance.scale_factor
-                ), 
-                1
+            # drawn over the text instead of into it, the surface is shared through the caches
+            x, y = int(render_position[0]), int(render_position[1]) # blit truncates the position too
+            width, height = self.__surface.get_size()
+            Text._draw_outline(surface, (255, 0, 0), pygame.Rect(x, y, width, height))  # Debug border
+            pygame.draw.line(surface, (255, 0, 0), (x, y + height // 2), (x + width - 1, y + height // 2))
+            pygame.draw.line(surface, (255, 0, 0), (x + width // 2, y), (x + width // 2, y + height - 1))
+            # snapped like the container in `_get_screen_bounds`
+            Text._draw_outline(
+                surface,
+                (255, 255, 255),
+                pygame.Rect(
+                    container_pos.xy,
+                    (container_width*Screen.Instance.scale_factor, container_height*Screen.Instance.scale_factor)
+                )
             )
         
         super().draw(surface)
@@ -0,0 +1,217 @@
+import pygame
+import re
+import threading
+
+from typing import Callable
+
+from ..ui.align import TextAlignX
+
+
+RenderLine = Callable[[str], tuple[pygame.Surface, pygame.Rect]]
+MeasureText = Callable[[str], dict[str, float]]
+
+_TOKENS = re.compile(r"\S+|\s+")
+
+
+class TextLayout:
+    """
+    Splits the text of a `Text` into lines, wrapped within a width if one is given, and composes
+    the rendered lines into one surface.\n
+    The layout remembers the lines of its last surface. When the text changes, the lines before
+    and after the changed ones are copied from the previous surface in two blocks and only the
+    changed lines are rendered and blitted, so appending a line to a long text costs about one line.
+    Wrapped paragraphs are reused as long as the font and the width do not change.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock() # jobs of the same text may run on several workers at once
+
+        self._style: tuple = None # everything but the text the previous surface was composed with
+        self._paragraphs: dict[str, list[str]] = {} # paragraph -> wrapped lines
+        self._lines: list[str] = []
+        self._sizes: list[tuple[int, int]] = []
+        self._tops: list[int] = [] # y of every line in the surface
+        self._surface: pygame.Surface = None
+
+        self.rendered_lines: int = 0 # lines blitted one by one by the last `render`
+
+    #region Private
+    @staticmethod
+    def _wrap(paragraph: str, width: float, advances: dict[str, float]) -> list[str]:
+        """Breaks `paragraph` into lines not wider than `width`, between words where possible."""
+        lines: list[str] = []
+        line = ""
+        line_width = 0.0
+
+        for token in _TOKENS.findall(paragraph):
+            token_width = sum(advances[char] for char in token)
+            if token.isspace():
+                # the spaces at the start of a wrapped line are dropped, the indentation of a paragraph is kept
+                if line or not lines:
+                    line += token
+                    line_width += token_width
+                continue
+
+            if line_width + token_width > width and line.strip():
+                lines.append(line.rstrip())
+                line = ""
+                line_width = 0.0
+            if line_width + token_width <= width:
+                line += token
+                line_width += token_width
+                continue
+
+            # words wider than a whole line are broken between characters
+            for char in token:
+                if line_width + advances[char] > width and line.strip():
+                    lines.append(line)
+                    line = ""
+                    line_width = 0.0
+                line += char
+                line_width += advances[char]
+
+        lines.append(line)
+        return lines
+
+    def _split(self, text: str, width: float | None, measure: MeasureText) -> list[str]:
+        if width is None:
+            return text.split("\n")
+
+        lines: list[str] = []
+        paragraphs: dict[str, list[str]] = {}
+        for paragraph in text.split("\n"):
+            wrapped = paragraphs.get(paragraph)
+            if wrapped is None:
+                wrapped = self._paragraphs.get(paragraph)
+                if wrapped is None:
+                    wrapped = TextLayout._wrap(paragraph, width, measure(paragraph))
+                paragraphs[paragraph] = wrapped
+            lines.extend(wrapped)
+
+        # only the paragraphs of the current text are kept
+        self._paragraphs = paragraphs
+        return lines
+
+    @staticmethod
+    def _line_x(align_x: TextAlignX, width: int, line_width: int) -> int:
+        if align_x == TextAlignX.RIGHT:
+            return width - line_width
+        if align_x == TextAlignX.MIDDLE:
+            return (width - line_width) // 2
+        return 0
+
+    def _compose(self, lines: list[str], render_line: RenderLine, align_x: TextAlignX, padding: float) -> pygame.Surface:
+        rendered_lines = [render_line(line) for line in lines]
+        width = height = 0
+        for _, size in rendered_lines:
+            height += size.height
+            width = max(width, size.width)
+
+        height += padding * (len(rendered_lines) - 1)
+        tops = []
+        if len(rendered_lines) == 1 and rendered_lines[0][0].get_size() == (width, height):
+            # a single line is the surface itself, shared with the line cache since surfaces are never drawn on
+            surface = rendered_lines[0][0]
+            tops.append(0)
+        else:
+            surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            y = 0
+            for surf, surf_size in rendered_lines:
+                surface.blit(surf, (TextLayout._line_x(align_x, width, surf_size.width), y))
+                tops.append(y)
+                y += surf_size.height + padding
+
+        self._sizes = [size.size for _, size in rendered_lines]
+        self._tops = tops
+        self.rendered_lines = len(lines)
+        return surface
+
+    def _recompose(self, lines: list[str], render_line: RenderLine, align_x: TextAlignX, padding: int) -> pygame.Surface | None:
+        """
+        Composes the surface reusing the unchanged lines at the start and at the end of the previous one.
+        Returns None if the lines cannot be reused.
+        """
+        old_lines = self._lines
+        old_sizes = self._sizes
+        old_tops = self._tops
+        old_surface = self._surface
+
+        limit = min(len(old_lines), len(lines))
+        start = 0
+        while start < limit and old_lines[start] == lines[start]:
+            start += 1
+        end = 0 # number of unchanged lines at the end
+        while end < limit - start and old_lines[-1 - end] == lines[-1 - end]:
+            end += 1
+
+        changed = [render_line(line) for line in lines[start:len(lines) - end]]
+        sizes = old_sizes[:start] + [size.size for _, size in changed] + old_sizes[len(old_sizes) - end:]
+
+        width = max(size[0] for size in sizes)
+        if align_x != TextAlignX.LEFT and width != old_surface.get_width():
+            return None # every line moves horizontally
+
+        tops = []
+        y = 0
+        for size in sizes:
+            tops.append(y)
+            y += size[1] + padding
+        height = y - padding
+
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        # the blocks are copied exactly, lines do not overlap with a non-negative padding
+        if start:
+            block = pygame.Rect(0, 0, min(width, old_surface.get_width()), old_tops[start - 1] + old_sizes[start - 1][1])
+            surface.blit(old_surface, (0, 0), block, pygame.BLEND_RGBA_MAX)
+        if end:
+            old_first = len(old_lines) - end
+            block = pygame.Rect(0, old_tops[old_first], min(width, old_surface.get_width()), old_surface.get_height() - old_tops[old_first])
+            surface.blit(old_surface, (0, tops[len(lines) - end]), block, pygame.BLEND_RGBA_MAX)
+
+        for i, (surf, surf_size) in enumerate(changed, start):
+            surface.blit(surf, (TextLayout._line_x(align_x, width, surf_size.width), tops[i]))
+
+        self._sizes = sizes
+        self._tops = tops
+        self.rendered_lines = len(changed)
+        return surface
+    #endregion
+
+    #region Public
+    def render(
+            self, text: str, style: tuple, align_x: TextAlignX, padding: float, width: float | None,
+            render_line: RenderLine, measure: MeasureText) -> pygame.Surface:
+        """
+        Returns the surface of `text`, safe to call from any thread.\n
+        `style` identifies everything the rendered lines depend on besides their text, `width` is
+        the width to wrap the lines within or None, `render_line` renders one line and `measure`
+        returns the advances of the characters of a string.
+        """
+        with self._lock:
+            style = (style, align_x, padding, width)
+            if style != self._style:
+                self._paragraphs.clear()
+                self._surface = None
+
+            lines = self._split(text, width, measure)
+
+            surface = None
+            # fractional paddings round differently once the lines move, they are composed from scratch
+            if self._surface is not None and padding >= 0 and float(padding).is_integer():
+                surface = self._recompose(lines, render_line, align_x, int(padding))
+            if surface is None:
+                surface = self._compose(lines, render_line, align_x, padding)
+
+            self._style = style
+            self._lines = lines
+            self._surface = surface
+            return surface
+
+    def clear(self) -> None:
+        """Forgets the previous surface, the next `render` composes every line."""
+        with self._lock:
+            self._style = None
+            self._paragraphs.clear()
+            self._lines = []
+            self._surface = None
+    #endregion
@@ -14,17 +14,20 @@ class Transform:
                  scale: Vector2 = None,
                  rotation: numbers.Real = None,
                  size: Vector2 = None,
-                 on_property_changed_callback: Callable[[], None] = None
+                 on_property_changed_callback: Callable[[], None] = None,
+                 on_layout_changed_callback: Callable[[], None] = None
     ) -> None:
         
         self._on_property_changed = Event([on_property_changed_callback] if on_property_changed_callback is not None else [])
+        self._on_layout_changed = Event([on_layout_changed_callback] if on_layout_changed_callback is not None else [])
 
-        self._position  = position if position is not None and isinstance(position, Vector2) else Vector2(0, 0)
+        self._position  = Vector2(position._x, position._y, self._on_layout_changed) \
+            if position is not None and isinstance(position, Vector2) else Vector2(0, 0, self._on_layout_changed)
         self._scale     = Vector2(scale._x, scale._y, self._on_property_changed) \
             if scale is not None and isinstance(scale, Vector2) else Vector2(1, 1, self._on_property_changed)
         self._rotation  = rotation if rotation is not None and isinstance(rotation, numbers.Real) else 0
-        self._size      = size if isinstance(size, Vector2) else Vector2(
-            Transform.DEFAULT_SIZE.x, Transform.DEFAULT_SIZE.y)
+        self._size      = Vector2(size._x, size._y, self._on_layout_changed) if isinstance(size, Vector2) else Vector2(
+            Transform.DEFAULT_SIZE.x, Transform.DEFAULT_SIZE.y, self._on_layout_changed)
     
     @property
     def position(self) -> Vector2:
@@ -58,39 +61,45 @@ class Transform:
     @position.setter
     def position(self, value: Vector2) -> None:
         if isinstance(value, Vector2):
-            self._position = value
+            if value != self._position:
+                self._position = Vector2(value._x, value._y, self._on_layout_changed)
+                self._on_layout_changed.invoke()
         else:
             Console.error("The value can only be a vector")
     
     @scale.setter
     def scale(self, value: Vector2) -> None:
         if isinstance(value, Vector2):
-            self._scale = value
-            self._on_property_changed.invoke()
+            if value != self._scale:
+                self._scale = Vector2(value._x, value._y, self._on_property_changed)
+                self._on_property_changed.invoke()
         else:
             Console.error("The value can only be a vector")
     
     @rotation.setter
     def rotation(self, value: numbers.Real) -> None:
         if isinstance(value, numbers.Real):
-            self._rotation = value
-            self._on_property_changed.invoke()
+            if value != self._rotation:
+                self._rotation = value
+                self._on_property_changed.invoke()
         else:
             Console.error("The value can only be a vector")
     
     @width.setter
     def width(self, value: float | int) -> None:
         if isinstance(value, float | int):
-            self._size._x = value
-            self._on_property_changed.invoke()
+            if value != self._size._x:
+                self._size._x = value
+                self._on_layout_changed.invoke()
         else:
             Console.error("The value can only be a float or an integer")
     
     @height.setter
     def height(self, value: float | int) -> None:
         if isinstance(value, float | int):
-            self._size._y = value
-            self._on_property_changed.invoke()
+            if value != self._size._y:
+                self._size._y = value
+                self._on_layout_changed.invoke()
         else:
             Console.error("The value can only be a float or an integer")
     
@@ -100,19 +109,21 @@ class Transform:
             if len(value) == 2:
                 call_event: bool = False
                 if isinstance(value[0], float | int):
-                    self._size._x = value[0]
-                    call_event = True
+                    if value[0] != self._size._x:
+                        self._size._x = value[0]
+                        call_event = True
                 else:
                     Console.error("The width can only be a float or an integer")
                 
                 if isinstance(value[1], float | int):
-                    self._size._y = value[1]
-                    call_event = True
+                    if value[1] != self._size._y:
+                        self._size._y = value[1]
+                        call_event = True
                 else:
                     Console.error("The height can only be a float or an integer")
                 
                 if call_event:
-                    self._on_property_changed.invoke()
+                    self._on_layout_changed.invoke()
             else:
                 Console.error("The size of the tuple should be 2")
         else:
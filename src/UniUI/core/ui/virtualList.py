@@ -0,0 +1,314 @@
+import pygame
+import numbers
+
+from array import array
+from bisect import bisect_right
+from typing import Callable
+
+from ..object import BaseObject
+from ..math.vector2 import Vector2
+from ..input import PointerEvent, PointerEventType
+from ..tools.console import Console
+from ..screen import Screen
+
+
+DEFAULT_ROW_HEIGHT = 24
+DEFAULT_OVERSCAN = 2
+DEFAULT_SCROLL_STEP = 48
+
+
+class VirtualList(BaseObject):
+    """
+    Vertical list of `item_count` items showing only the rows inside the transform of the list.\n
+    Row objects exist only for the visible items plus `overscan` items on each side. They are made
+    by `create_row(list)` and filled by `bind_row(row, index)`; rows scrolled out of the list are
+    detached and bound again to the items scrolling in, so the number of objects and the cost of a
+    frame do not depend on the number of items.\n
+    `row_height` is a number or a function of the item index. Variable heights are summed lazily
+    into a prefix-sum index, only as far as the list has been scrolled; call `invalidate_heights`
+    when they change. Rows keep the default `Align.MIDDLE`, which places them at the top left of the list.
+    """
+
+    # the base object may invalidate the world transform before `__init__` sets this
+    _laid_out_size: tuple[float, float] = None
+    _serializable: bool = False # the rows are made by functions, see `SceneFile`
+
+    def __init__(self, name: str, scene: 'Scene', **kwargs: dict[str, object]) -> None:
+        super().__init__(name=name, scene=scene, **kwargs)
+        self.__set_up(kwargs)
+
+    #region Properties
+    @property
+    def item_count(self) -> int:
+        return self._item_count
+
+    @property
+    def row_height(self) -> float | Callable[[int], float]:
+        return self._row_height
+
+    @property
+    def overscan(self) -> int:
+        """Number of rows kept above and below the visible ones, so that scrolling does not bind them all at once."""
+        return self._overscan
+
+    @property
+    def scroll_step(self) -> float:
+        """Distance scrolled by one notch of the mouse wheel."""
+        return self._scroll_step
+
+    @property
+    def scroll_offset(self) -> float:
+        """Distance from the top of the first item to the top of the list, clamped once the list is laid out."""
+        return self._scroll_offset
+
+    @property
+    def content_height(self) -> float:
+        """Height of all the items, measures every item when the heights are variable."""
+        return self.__item_top(self._item_count)
+
+    @property
+    def visible_range(self) -> tuple[int, int]:
+        """Indices of the first item with a row and of the item after the last one."""
+        self._flush_refurbish()
+        return self.__visible
+
+    @property
+    def row_count(self) -> int:
+        """Number of row objects created by the list, bound or not."""
+        return len(self.__rows) + len(self.__free_rows)
+    #endregion
+
+    #region Setters
+    @item_count.setter
+    def item_count(self, value: int) -> None:
+        if isinstance(value, int) and value >= 0:
+            if value != self._item_count:
+                self._item_count = value
+                if len(self.__tops) > value + 1:
+                    del self.__tops[value + 1:]
+                self._request_refurbish()
+        else:
+            Console.error(f"Expected non-negative int for 'item_count', got {value!r}")
+
+    @row_height.setter
+    def row_height(self, value: float | Callable[[int], float]) -> None:
+        if callable(value) or (isinstance(value, numbers.Real) and value > 0):
+            self._row_height = value
+            self.invalidate_heights()
+        else:
+            Console.error(f"Expected positive number or callable for 'row_height', got {value!r}")
+
+    @overscan.setter
+    def overscan(self, value: int) -> None:
+        if isinstance(value, int) and value >= 0:
+            if value != self._overscan:
+                self._overscan = value
+                self._request_refurbish()
+        else:
+            Console.error(f"Expected non-negative int for 'overscan', got {value!r}")
+
+    @scroll_step.setter
+    def scroll_step(self, value: numbers.Real) -> None:
+        if isinstance(value, numbers.Real):
+            self._scroll_step = value
+        else:
+            Console.error(f"Expected number for 'scroll_step', got {type(value).__name__}")
+
+    @scroll_offset.setter
+    def scroll_offset(self, value: numbers.Real) -> None:
+        if isinstance(value, numbers.Real):
+            value = max(0.0, float(value))
+            if value != self._scroll_offset:
+                self._scroll_offset = value
+                self._request_refurbish()
+        else:
+            Console.error(f"Expected number for 'scroll_offset', got {type(value).__name__}")
+    #endregion
+
+    #region Private
+    def __set_up(self, kwargs: dict[str, object]) -> None:
+        create_row = kwargs.get("create_row", None)
+        bind_row = kwargs.get("bind_row", None)
+        if not callable(create_row) or not callable(bind_row):
+            Console.error("VirtualList needs the callables 'create_row' and 'bind_row'", True, self._root_caller_info)
+        self._create_row: Callable[['VirtualList'], BaseObject] = create_row if callable(create_row) else None
+        self._bind_row: Callable[[BaseObject, int], None] = bind_row if callable(bind_row) else None
+
+        item_count = kwargs.get("item_count", 0)
+        self._item_count: int = item_count if isinstance(item_count, int) and item_count >= 0 else 0
+        overscan = kwargs.get("overscan", DEFAULT_OVERSCAN)
+        self._overscan: int = overscan if isinstance(overscan, int) and overscan >= 0 else DEFAULT_OVERSCAN
+        scroll_step = kwargs.get("scroll_step", DEFAULT_SCROLL_STEP)
+        self._scroll_step: float = scroll_step if isinstance(scroll_step, numbers.Real) else DEFAULT_SCROLL_STEP
+        self._scroll_offset: float = 0.0
+
+        self._row_height: float | Callable[[int], float] = DEFAULT_ROW_HEIGHT
+        # tops of the items measured so far, with the bottom of the last one at the end
+        self.__tops: array = array("d", [0.0])
+        self.row_height = kwargs.get("row_height", DEFAULT_ROW_HEIGHT)
+
+        self.__rows: dict[int, BaseObject] = {} # item index -> row bound to it
+        self.__free_rows: list[BaseObject] = [] # detached rows waiting to be bound again
+        self.__visible: tuple[int, int] = (0, 0)
+
+        # the listeners of a pooled list are removed when it is destroyed
+        if kwargs.get("scroll_with_wheel", True) is True:
+            self.add_pointer_listener(PointerEventType.WHEEL, self.__on_wheel)
+
+        self._request_refurbish()
+
+    def _reset(self, **kwargs: dict[str, object]) -> None:
+        super()._reset(**kwargs)
+        self._laid_out_size = None
+        self.__set_up(kwargs)
+
+    def __measure(self, index: int) -> None:
+        """Extends the prefix-sum index up to the top of the item at `index`."""
+        tops = self.__tops
+        height = self._row_height
+        bottom = tops[-1]
+        for i in range(len(tops) - 1, min(index, self._item_count)):
+            bottom += height(i)
+            tops.append(bottom)
+
+    def __item_top(self, index: int) -> float:
+        if not callable(self._row_height):
+            return index * self._row_height
+        if index >= len(self.__tops):
+            self.__measure(index)
+        return self.__tops[index]
+
+    def __item_at(self, offset: float) -> int:
+        """Returns the index of the item at `offset` from the top of the first one."""
+        if not callable(self._row_height):
+            return int(offset // self._row_height)
+
+        tops = self.__tops
+        # measured in chunks until the offset is reached, every item at most once
+        while tops[-1] <= offset and len(tops) <= self._item_count:
+            self.__measure(len(tops) * 2)
+        return bisect_right(tops, offset) - 1
+
+    def __clamp_scroll(self, view_height: float) -> None:
+        last = self.__item_at(self._scroll_offset + view_height)
+        if last < self._item_count:
+            return # the items below fill the list
+        max_offset = max(0.0, self.__item_top(self._item_count) - view_height)
+        if self._scroll_offset > max_offset:
+            self._scroll_offset = max_offset
+
+    def __acquire_row(self) -> BaseObject:
+        if self.__free_rows:
+            row = self.__free_rows.pop()
+            self.add_child(row)
+            return row
+
+        row = self._create_row(self)
+        if row.parent is not self:
+            row.parent = self
+        return row
+
+    def __release_row(self, index: int) -> None:
+        """Detaches the row bound to `index`, it is neither updated nor drawn until bound again."""
+        row = self.__rows.pop(index)
+        row._damage(subtree=True)
+        self.scene._input._forget(row)
+        self.remove_child(row)
+        self.__free_rows.append(row)
+
+    def __on_wheel(self, event: PointerEvent) -> None:
+        self.scroll_offset = self._scroll_offset - event.wheel.y * self._scroll_step
+
+    def _invalidate_world_transform(self) -> None:
+        super()._invalidate_world_transform()
+        # the size of the transform only changes the layout, except for the rows of a list
+        if self._laid_out_size is not None and self._transform.wh != self._laid_out_size:
+            self._request_refurbish()
+
+    def _refurbish_interior(self) -> None:
+        """Binds rows to the items inside the list and places them, reusing the rows of the items that left it."""
+        width, view_height = self._laid_out_size = self._transform.wh
+        if self._create_row is None or self._bind_row is None:
+            return
+
+        self.__clamp_scroll(view_height)
+        scroll = self._scroll_offset
+        if self._item_count:
+            first = max(0, self.__item_at(scroll) - self._overscan)
+            last = min(self._item_count, self.__item_at(scroll + view_height) + 1 + self._overscan)
+        else:
+            first = last = 0
+        self.__visible = (first, last)
+
+        for index in [index for index in self.__rows if index < first or index >= last]:
+            self.__release_row(index)
+
+        scale_factor = Screen.Instance.scale_factor
+        for index in range(first, last):
+            row = self.__rows.get(index)
+            if row is None:
+                row = self.__rows[index] = self.__acquire_row()
+                self._bind_row(row, index)
+
+            top = self.__item_top(index)
+            row.transform.wh = (width, self.__item_top(index + 1) - top)
+            row.transform.position = Vector2(0, (top - scroll) * scale_factor)
+
+        super()._refurbish_interior()
+
+    def _get_screen_bounds(self) -> pygame.Rect | None:
+        self._update_world_transform()
+        scale_factor = Screen.Instance.scale_factor
+        return pygame.Rect(
+            self._world_position.xy,
+            (self._transform.width * scale_factor, self._transform.height * scale_factor)
+        )
+
+    def _pick(self, point: tuple[int, int]) -> BaseObject | None:
+        # the overscan rows outside of the list are not drawn
+        if not self._hit_test(point):
+            return None
+        return super()._pick(point)
+    #endregion
+
+    #region Public
+    def scroll_to(self, index: int) -> None:
+        """Scrolls the list so that the item at `index` is at its top, or as close to it as possible."""
+        if isinstance(index, int):
+            self.scroll_offset = self.__item_top(max(0, min(index, self._item_count)))
+        else:
+            Console.error(f"Expected int for 'index', got {type(index).__name__}")
+
+    def refresh(self, index: int = None) -> None:
+        """Binds the rows again to their items after the data changed, only the row of `index` if given."""
+        self._flush_refurbish()
+        if index is None:
+            for index, row in self.__rows.items():
+                self._bind_row(row, index)
+            return
+        row = self.__rows.get(index)
+        if row is not None:
+            self._bind_row(row, index)
+
+    def invalidate_heights(self, start: int = 0) -> None:
+        """Forgets the measured heights of the items from `start` on, call it when they change."""
+        if len(self.__tops) > start + 1:
+            del self.__tops[max(0, start) + 1:]
+        self._request_refurbish()
+
+    def destroy(self, remove_from_parent: bool = True) -> None:
+        for row in self.__free_rows:
+            row.destroy(False)
+        self.__free_rows.clear()
+        self.__rows.clear()
+        super().destroy(remove_from_parent)
+    #endregion
+
+    #region UniUI Hooks
+    def draw(self, surface: pygame.Surface) -> None:
+        # rows are clipped to the list
+        clip = surface.get_clip()
+        surface.set_clip(clip.clip(self._get_screen_bounds()))
+        super().draw(surface)
+        surface.set_clip(clip)
+    #endregion
@@ -0,0 +1,227 @@
+import pygame
+
+from typing import Callable, Iterable
+
+
+class BoundsTree:
+    """
+    Bounding volume hierarchy over the `_subtree_bounds` of a collection of objects.\n
+    `query` finds the objects intersecting a rect in O(log n) and returns them sorted by `key`,
+    so they can be drawn in order. Objects are inserted into the leaf whose box grows the least
+    and removed from their leaf, and when the bounds of some objects change only the nodes above
+    them are refitted; the tree asks to be rebuilt after many changes, since the boxes may overlap
+    more and more.
+    """
+
+    LEAF_SIZE = 4
+    REBUILD_RATIO = 4 # changes per object after which the tree asks to be rebuilt
+
+    def __init__(self, objects: Iterable[object], key: Callable[[object], object]) -> None:
+        self._key = key
+
+        # nodes are stored in parallel lists, a parent always precedes its children;
+        # a leaf has `left == -1` and a list of items
+        self._rects: list[pygame.Rect | None] = []
+        self._counts: list[int] = [] # number of objects in the subtrees below the node
+        self._left: list[int] = []
+        self._right: list[int] = []
+        self._parents: list[int] = []
+        self._items: list[list[object] | None] = []
+
+        self._leaf_of: dict[object, int] = {}
+        self._changes: int = 0
+
+        self._build([obj for obj in objects if obj._subtree_bounds is not None], -1)
+
+    def __len__(self) -> int:
+        return len(self._leaf_of)
+
+    def __contains__(self, obj: object) -> bool:
+        return obj in self._leaf_of
+
+    #region Private
+    def _add_node(self, parent: int) -> int:
+        self._rects.append(None)
+        self._counts.append(0)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._parents.append(parent)
+        self._items.append(None)
+        return len(self._rects) - 1
+
+    @staticmethod
+    def _partition(objects: list[object]) -> tuple[list[object], list[object]]:
+        """Splits `objects` at the median of their centers along the longest axis."""
+        bounds = [obj._subtree_bounds for obj in objects]
+        xs = [rect.centerx for rect in bounds]
+        ys = [rect.centery for rect in bounds]
+        centers = xs if max(xs) - min(xs) >= max(ys) - min(ys) else ys
+        order = sorted(range(len(objects)), key=centers.__getitem__)
+        middle = len(order) // 2
+        return [objects[k] for k in order[:middle]], [objects[k] for k in order[middle:]]
+
+    def _build(self, objects: list[object], parent: int) -> int:
+        node = self._add_node(parent)
+        self._fill(node, objects)
+        return node
+
+    def _fill(self, node: int, objects: list[object]) -> None:
+        """Makes `node` a leaf of `objects`, or splits them below it if there are too many."""
+        if len(objects) <= BoundsTree.LEAF_SIZE:
+            self._items[node] = objects
+            for obj in objects:
+                self._leaf_of[obj] = node
+        else:
+            left, right = BoundsTree._partition(objects)
+            self._items[node] = None
+            self._left[node] = self._build(left, node)
+            self._right[node] = self._build(right, node)
+        self._fit(node)
+
+    def _fit(self, node: int) -> None:
+        """Recomputes the rect and the object count of `node` from what is below it."""
+        rect = None
+        count = 0
+
+        items = self._items[node]
+        if items is not None:
+            for obj in items:
+                bounds = obj._subtree_bounds
+                if bounds is None:
+                    continue
+                count += obj._subtree_count
+                if rect is None:
+                    rect = bounds.copy()
+                else:
+                    rect.union_ip(bounds)
+        else:
+            for child in (self._left[node], self._right[node]):
+                bounds = self._rects[child]
+                count += self._counts[child]
+                if bounds is None:
+                    continue
+                if rect is None:
+                    rect = bounds.copy()
+                else:
+                    rect.union_ip(bounds)
+
+        self._rects[node] = rect
+        self._counts[node] = count
+
+    def _refit_up(self, node: int) -> None:
+        while node != -1:
+            self._fit(node)
+            node = self._parents[node]
+
+    def _growth(self, node: int, bounds: pygame.Rect) -> int:
+        """Area the rect of `node` would grow by to cover `bounds`, empty nodes grow the least."""
+        rect = self._rects[node]
+        if rect is None:
+            return 0
+        union = rect.union(bounds)
+        return union.width * union.height - rect.width * rect.height
+
+    def _insert(self, obj: object) -> None:
+        bounds = obj._subtree_bounds
+        node = 0
+        while self._items[node] is None:
+            left, right = self._left[node], self._right[node]
+            node = left if self._growth(left, bounds) <= self._growth(right, bounds) else right
+
+        items = self._items[node]
+        items.append(obj)
+        self._leaf_of[obj] = node
+        if len(items) > 2 * BoundsTree.LEAF_SIZE:
+            self._fill(node, items)
+        self._refit_up(node)
+    #endregion
+
+    #region Public
+    @property
+    def needs_rebuild(self) -> bool:
+        return self._changes > max(len(self._leaf_of), BoundsTree.LEAF_SIZE) * BoundsTree.REBUILD_RATIO
+
+    def update(self, objects: list[object]) -> None:
+        """
+        Refits the tree after the bounds of `objects` changed, every node at most once,
+        and inserts the ones that are not in the tree yet.
+        """
+        nodes: set[int] = set()
+        for obj in objects:
+            node = self._leaf_of.get(obj)
+            if node is None:
+                if obj._subtree_bounds is not None:
+                    self._insert(obj)
+                continue
+
+            while node != -1 and node not in nodes:
+                nodes.add(node)
+                node = self._parents[node]
+
+        # children have greater indices than their parents
+        for node in sorted(nodes, reverse=True):
+            self._fit(node)
+        self._changes += len(objects)
+
+    def remove(self, obj: object) -> None:
+        """Removes `obj` from the tree if it is there."""
+        node = self._leaf_of.pop(obj, None)
+        if node is None:
+            return
+        self._items[node].remove(obj)
+        self._refit_up(node)
+        self._changes += 1
+
+    def query(self, rect: pygame.Rect) -> tuple[list[object], int]:
+        """
+        Returns the objects whose bounds intersect `rect`, sorted by `key`,
+        and the number of objects in the subtrees of the ones that do not.
+        """
+        found: list[object] = []
+        culled = 0
+
+        rects = self._rects
+        stack = [0]
+        inside: list[int] = [] # nodes entirely within `rect`
+        while stack:
+            node = stack.pop()
+            bounds = rects[node]
+            if bounds is None:
+                continue
+            if not rect.colliderect(bounds):
+                culled += self._counts[node]
+                continue
+
+            items = self._items[node]
+            if rect.contains(bounds):
+                if items is None:
+                    inside.append(node)
+                else:
+                    found.extend(obj for obj in items if obj._subtree_bounds is not None)
+                continue
+            if items is None:
+                stack.append(self._left[node])
+                stack.append(self._right[node])
+                continue
+
+            for obj in items:
+                bounds = obj._subtree_bounds
+                if bounds is None:
+                    continue
+                if rect.colliderect(bounds):
+                    found.append(obj)
+                else:
+                    culled += obj._subtree_count
+
+        while inside:
+            node = inside.pop()
+            items = self._items[node]
+            if items is None:
+                inside.append(self._left[node])
+                inside.append(self._right[node])
+            else:
+                found.extend(obj for obj in items if obj._subtree_bounds is not None)
+
+        found.sort(key=self._key)
+        return found, culled
+    #endregion
@@ -0,0 +1,90 @@
+from collections import OrderedDict
+from typing import Hashable
+
+
+class SurfaceCache:
+    """
+    LRU cache for rendered surfaces limited by the total number of bytes they occupy.\n
+    The least recently used entries are evicted once the budget is exceeded.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._entries: OrderedDict[Hashable, tuple[object, int]] = OrderedDict()
+        self._max_bytes: int = max_bytes
+        self._size_bytes: int = 0
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    #region Private
+    def _evict(self) -> None:
+        while self._size_bytes > self._max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._size_bytes -= size
+            self.evictions += 1
+    #endregion
+
+    #region Properties
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        self._max_bytes = max(0, int(value))
+        self._evict()
+    #endregion
+
+    #region Public
+    def get(self, key: Hashable) -> object | None:
+        """Returns the cached value for `key` or None, marking it as recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, value: object, size: int) -> None:
+        """Stores `value` under `key`, `size` is the number of bytes it occupies."""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size_bytes -= old[1]
+
+        if size > self._max_bytes:
+            return
+
+        self._entries[key] = (value, size)
+        self._size_bytes += size
+        self._evict()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size_bytes = 0
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self._size_bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+    #endregion
@@ -0,0 +1,116 @@
+from bisect import bisect_left, insort
+from operator import itemgetter
+from typing import Iterator
+
+
+class LayerList:
+    """
+    Collection of objects ordered by their `layer` and, inside a layer, by insertion order.\n
+    Adding, removing and re-layering an object does not resort the collection.
+    Iteration walks a snapshot that is rebuilt only after a change, so the collection
+    may be safely modified while it is being iterated.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[object, tuple[int, int]] = {} # object -> (layer, order)
+        self._buckets: dict[int, dict[object, int]] = {}  # layer -> {object: order}
+        self._layers: list[int] = []                      # sorted layer keys
+        self._unsorted_layers: set[int] = set()
+        self._next_order: int = 0
+        self._snapshot: tuple[object, ...] | None = ()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, obj: object) -> bool:
+        return obj in self._entries
+
+    def __iter__(self) -> Iterator[object]:
+        return iter(self.snapshot())
+
+    def __reversed__(self) -> Iterator[object]:
+        return reversed(self.snapshot())
+
+    #region Private
+    def _build_snapshot(self) -> tuple[object, ...]:
+        for layer in self._unsorted_layers:
+            bucket = self._buckets.get(layer)
+            if bucket is not None:
+                self._buckets[layer] = dict(sorted(bucket.items(), key=itemgetter(1)))
+        self._unsorted_layers.clear()
+
+        return tuple(obj for layer in self._layers for obj in self._buckets[layer])
+
+    def _insert(self, obj: object, layer: int, order: int) -> None:
+        bucket = self._buckets.get(layer)
+        if bucket is None:
+            bucket = self._buckets[layer] = {}
+            insort(self._layers, layer)
+        elif order < self._next_order:
+            # the object is older than the ones already there, restore the order lazily
+            self._unsorted_layers.add(layer)
+
+        bucket[obj] = order
+        self._entries[obj] = (layer, order)
+        self._snapshot = None
+
+    def _discard(self, obj: object) -> tuple[int, int] | None:
+        entry = self._entries.pop(obj, None)
+        if entry is None:
+            return None
+
+        layer = entry[0]
+        bucket = self._buckets[layer]
+        del bucket[obj]
+        if not bucket:
+            del self._buckets[layer]
+            del self._layers[bisect_left(self._layers, layer)]
+            self._unsorted_layers.discard(layer)
+
+        self._snapshot = None
+        return entry
+    #endregion
+
+    #region Public
+    def snapshot(self) -> tuple[object, ...]:
+        """Returns the objects in order as a tuple, the same tuple until the collection changes."""
+        if self._snapshot is None:
+            self._snapshot = self._build_snapshot()
+        return self._snapshot
+
+    def key(self, obj: object) -> tuple[int, int]:
+        """Returns the sort key of `obj`, sorting by it puts objects in the order of the collection."""
+        return self._entries[obj]
+
+    def add(self, obj: object) -> None:
+        """Adds `obj` after all the objects of its layer. Does nothing if it is already present."""
+        if obj in self._entries:
+            return
+
+        self._insert(obj, obj.layer, self._next_order)
+        self._next_order += 1
+
+    def extend(self, objects: list[object]) -> None:
+        for obj in objects:
+            self.add(obj)
+
+    def remove(self, obj: object) -> bool:
+        """Removes `obj`, returns False if it was not present."""
+        return self._discard(obj) is not None
+
+    def update_layer(self, obj: object) -> None:
+        """Moves `obj` to its current `layer`, keeping its insertion order."""
+        entry = self._entries.get(obj)
+        if entry is None or entry[0] == obj.layer:
+            return
+
+        self._discard(obj)
+        self._insert(obj, obj.layer, entry[1])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._buckets.clear()
+        self._layers.clear()
+        self._unsorted_layers.clear()
+        self._snapshot = ()
+    #endregion
@@ -0,0 +1,106 @@
+DEFAULT_MAX_SIZE = 1024
+
+
+class ObjectPool:
+    """
+    Destroyed objects of one class kept for reuse, made by `Scene.pool`.\n
+    `acquire` takes the keyword arguments of the constructor of the class (without the scene).
+    It reuses a destroyed object if there is one, resetting it with `_reset` instead of building
+    its transform, vectors, events and caches again, and creates a new one otherwise.
+    Objects made by a pool go back to it when they are destroyed, so they must not be used
+    after `destroy`. Subclasses keeping state of their own override `_reset`.
+    """
+
+    def __init__(self, scene: 'Scene', cls: type['BaseObject'], max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self._scene = scene
+        self._cls = cls
+        self._max_size: int = max(0, max_size)
+        self._free: list['BaseObject'] = []
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.discarded: int = 0 # destroyed objects dropped because the pool was full
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    #region Private
+    def _release(self, obj: 'BaseObject') -> None:
+        """Takes back a destroyed object, called by `BaseObject.destroy`."""
+        if obj._pooled:
+            return # destroyed twice
+        if len(self._free) >= self._max_size:
+            obj._pool = None
+            self.discarded += 1
+            return
+        obj._pooled = True
+        self._free.append(obj)
+    #endregion
+
+    #region Properties
+    @property
+    def cls(self) -> type['BaseObject']:
+        return self._cls
+
+    @property
+    def max_size(self) -> int:
+        """Number of destroyed objects kept at most, the ones above it are left to the garbage collector."""
+        return self._max_size
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of the acquired objects that were reused, 0 before the first `acquire`."""
+        acquired = self.hits + self.misses
+        return self.hits / acquired if acquired else 0.0
+
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        self._max_size = max(0, int(value))
+        while len(self._free) > self._max_size:
+            self._free.pop()._pool = None
+    #endregion
+
+    #region Public
+    def acquire(self, **kwargs: dict[str, object]) -> 'BaseObject':
+        """Returns an object of the pool's class initialized with `kwargs`, reusing a destroyed one if possible."""
+        if self._free:
+            obj = self._free.pop()
+            obj._pooled = False
+            self.hits += 1
+            obj._reset(**kwargs)
+            return obj
+
+        self.misses += 1
+        obj = self._cls(scene=self._scene, **kwargs)
+        obj._pool = self
+        return obj
+
+    def prewarm(self, count: int, **kwargs: dict[str, object]) -> None:
+        """Creates objects with `kwargs` until `count` destroyed objects are waiting in the pool."""
+        kwargs.setdefault("name", self._cls.__name__)
+        count = min(count, self._max_size)
+        while len(self._free) < count:
+            obj = self._cls(scene=self._scene, **kwargs)
+            obj._pool = self
+            obj.destroy()
+
+    def clear(self) -> None:
+        """Drops the destroyed objects waiting in the pool."""
+        for obj in self._free:
+            obj._pool = None
+        self._free.clear()
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = self.discarded = 0
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "class": self._cls.__name__,
+            "free": len(self._free),
+            "max_size": self._max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "discarded": self.discarded,
+        }
+    #endregion
@@ -0,0 +1,157 @@
+import os
+import threading
+import weakref
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Hashable
+
+
+class RasterPool:
+    """
+    Worker threads rasterizing surfaces off the main thread.\n
+    Every job belongs to an owner and only the newest job of an owner matters: submitting
+    a new one cancels the previous one if it did not start yet and discards its result otherwise.
+    Results are not applied by the workers but on the main thread by `apply_finished`, which
+    scenes call at the start of every frame, so objects only change at frame boundaries.
+    At most `max_in_flight` jobs run or wait in the executor, the others wait in the pool
+    and are started by the workers as soon as there is room.
+    """
+
+    DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+    DEFAULT_MAX_IN_FLIGHT = 8
+
+    _busy: 'weakref.WeakSet[RasterPool]' = weakref.WeakSet() # pools with unapplied jobs
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT) -> None:
+        self._workers: int = max(1, workers)
+        self._max_in_flight: int = max(1, max_in_flight)
+        self._executor: ThreadPoolExecutor = None # started with the first job
+
+        self._latest: dict[Hashable, tuple[Future, Callable[[object], None]]] = {} # owner -> newest submitted job
+        self._waiting: dict[Hashable, tuple[Callable[[], object], Callable[[object], None], Callable[[], None] | None]] = {}
+        self._finished: deque[tuple[Hashable, Future]] = deque()
+        self._in_flight: int = 0 # jobs given to the executor and not finished yet
+        self._lock = threading.RLock() # the workers update the state when a job finishes
+
+    def __len__(self) -> int:
+        return len(self._latest) + len(self._waiting)
+
+    #region Private
+    def _start(self, owner: Hashable, job: Callable[[], object], apply: Callable[[object], None], wake: Callable[[], None] | None) -> None:
+        """Gives the job to the executor, the lock must be held."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self._workers, thread_name_prefix="UniUI-raster")
+
+        def on_done(future: Future) -> None:
+            with self._lock:
+                self._in_flight -= 1
+                self._finished.append((owner, future))
+                self._start_waiting()
+            if wake is not None:
+                wake()
+
+        future = self._executor.submit(job)
+        self._in_flight += 1
+        self._latest[owner] = (future, apply)
+        future.add_done_callback(on_done)
+
+    def _start_waiting(self) -> None:
+        while self._waiting and self._in_flight < self._max_in_flight:
+            owner = next(iter(self._waiting))
+            self._start(owner, *self._waiting.pop(owner))
+    #endregion
+
+    #region Properties
+    @property
+    def max_in_flight(self) -> int:
+        return self._max_in_flight
+
+    @max_in_flight.setter
+    def max_in_flight(self, value: int) -> None:
+        with self._lock:
+            self._max_in_flight = max(1, int(value))
+            self._start_waiting()
+    #endregion
+
+    #region Public
+    def submit(
+            self, owner: Hashable, job: Callable[[], object],
+            apply: Callable[[object], None], wake: Callable[[], None] = None) -> None:
+        """
+        Runs `job` on a worker and later passes its result to `apply` on the main thread,
+        unless another job is submitted for `owner` meanwhile. `wake` is called from the worker
+        thread once the job finished, e.g. to wake a scene waiting for events.
+        """
+        with self._lock:
+            self.cancel(owner)
+            RasterPool._busy.add(self)
+            if self._in_flight >= self._max_in_flight:
+                self._waiting[owner] = (job, apply, wake)
+                return
+            self._start(owner, job, apply, wake)
+
+    def cancel(self, owner: Hashable) -> None:
+        """Drops the job of `owner`, its result will not be applied."""
+        with self._lock:
+            self._waiting.pop(owner, None)
+            latest = self._latest.pop(owner, None)
+        if latest is not None:
+            latest[0].cancel()
+
+    def apply_finished(self) -> int:
+        """
+        Applies the results of the finished jobs that are still the newest of their owner.
+        Returns the number of applied results. Must be called from the main thread.
+        """
+        results: list[tuple[Callable[[object], None], Future]] = []
+        with self._lock:
+            while self._finished:
+                owner, future = self._finished.popleft()
+                latest = self._latest.get(owner)
+                if latest is None or latest[0] is not future:
+                    continue # stale or cancelled
+                del self._latest[owner]
+                results.append((latest[1], future))
+
+            if not self._latest and not self._waiting:
+                RasterPool._busy.discard(self)
+
+        for apply, future in results:
+            apply(future.result()) # raises the exception of a failed job
+        return len(results)
+
+    def flush(self) -> None:
+        """Blocks until every submitted job finished and applies all the results."""
+        while self._latest or self._waiting:
+            with self._lock:
+                futures = [future for future, _ in self._latest.values()]
+            for future in futures:
+                try:
+                    future.result()
+                except BaseException:
+                    pass # raised again by `apply_finished`
+            self.apply_finished()
+
+    def shutdown(self) -> None:
+        """Cancels all jobs and stops the workers, a later `submit` starts them again."""
+        with self._lock:
+            self._waiting.clear()
+            for owner in list(self._latest):
+                self.cancel(owner)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._lock:
+            self._finished.clear()
+            self._in_flight = 0
+            RasterPool._busy.discard(self)
+
+    @staticmethod
+    def apply_all_finished() -> None:
+        """Calls `apply_finished` on every pool with unapplied jobs."""
+        if not RasterPool._busy:
+            return
+        for pool in list(RasterPool._busy):
+            pool.apply_finished()
+    #endregion
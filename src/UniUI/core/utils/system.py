@@ -1,11 +1,95 @@
+import ctypes
+import ctypes.util
+import glob
+import os
 import platform
+import pygame
+
+from ..tools.console import Console
+
+DEFAULT_REFRESH_RATE = 60
+
+_refresh_rate: int = None # cached result of get_refresh_rate
+
+
+def get_refresh_rate() -> int:
+    """
+    Returns the refresh rate of the main display, or DEFAULT_REFRESH_RATE if it is unknown.\n
+    Detected once without starting any process and cached; the pygame display module must be initialized.
+    """
+    global _refresh_rate
+    if _refresh_rate is None:
+        _refresh_rate = _detect_refresh_rate()
+        if _refresh_rate is None:
+            Console.warning(f"Could not detect the refresh rate of the display, {DEFAULT_REFRESH_RATE} Hz is used")
+            _refresh_rate = DEFAULT_REFRESH_RATE
+    return _refresh_rate
+
+
+class _SDL_DisplayMode(ctypes.Structure):
+    _fields_ = [
+        ("format", ctypes.c_uint32),
+        ("w", ctypes.c_int),
+        ("h", ctypes.c_int),
+        ("refresh_rate", ctypes.c_int),
+        ("driverdata", ctypes.c_void_p),
+    ]
+
+
+def _sdl_libraries() -> list[str]:
+    """Paths of the SDL2 libraries pygame may be linked to, the ones bundled with pygame first."""
+    package = os.path.dirname(pygame.__file__)
+    paths = [
+        *glob.glob(os.path.join(package, os.pardir, "pygame.libs", "libSDL2-*.so*")), # Linux wheels
+        *glob.glob(os.path.join(package, ".dylibs", "libSDL2*.dylib")), # macOS wheels
+        *glob.glob(os.path.join(package, "SDL2.dll")), # Windows wheels
+    ]
+    system_library = ctypes.util.find_library("SDL2")
+    if system_library is not None:
+        paths.append(system_library)
+    return paths
+
+
+def _sdl_refresh_rate() -> int | None:
+    """
+    Asks SDL for the desktop display mode of the main display. Loading the library pygame already
+    loaded returns the same instance, whose video subsystem pygame has initialized.
+    """
+    for path in _sdl_libraries():
+        try:
+            sdl = ctypes.CDLL(path)
+            get_mode = sdl.SDL_GetDesktopDisplayMode
+        except (OSError, AttributeError):
+            continue
+        get_mode.argtypes = (ctypes.c_int, ctypes.POINTER(_SDL_DisplayMode))
+        get_mode.restype = ctypes.c_int
+
+        mode = _SDL_DisplayMode()
+        # a copy of SDL that pygame does not use has no video subsystem and fails
+        if get_mode(0, ctypes.byref(mode)) == 0 and mode.refresh_rate > 0:
+            return mode.refresh_rate
+    return None
+
+
+def _detect_refresh_rate() -> int | None:
+    # pygame-ce reports the desktop display modes
+    get_desktop_refresh_rates = getattr(pygame.display, "get_desktop_refresh_rates", None)
+    if get_desktop_refresh_rates is not None:
+        try:
+            rates = get_desktop_refresh_rates()
+            if rates and rates[0] > 0:
+                return int(rates[0])
+        except pygame.error:
+            pass
+
+    # pygame does not expose the rates itself, SDL does
+    rate = _sdl_refresh_rate()
+    if rate is not None:
+        return rate
 
-def get_refresh_rate():
     system = platform.system()
 
     if system == "Windows":
-        import ctypes
-
         class DEVMODE(ctypes.Structure):
             _fields_ = [
                 ("dmDeviceName", ctypes.c_wchar * 32),
@@ -43,24 +127,12 @@ def get_refresh_rate():
         user32 = ctypes.windll.user32
         devmode = DEVMODE()
         devmode.dmSize = ctypes.sizeof(DEVMODE)
-        if user32.EnumDisplaySettingsW(None, -1, ctypes.byref(devmode)):
+        # 0 and 1 stand for the default rate of the hardware
+        if user32.EnumDisplaySettingsW(None, -1, ctypes.byref(devmode)) and devmode.dmDisplayFrequency > 1:
             return devmode.dmDisplayFrequency
         else:
             return None
 
-    elif system == "Linux":
-        import subprocess
-        import re
-
-        try:
-            output = subprocess.check_output("xrandr", text=True)
-            match = re.search(r'(\d+\.\d+)\*', output)
-            if match:
-                return float(match.group(1))
-        except Exception:
-            pass
-        return None
-
     # elif system == "Darwin":
     #     try:
     #         import Quartz # type: ignore
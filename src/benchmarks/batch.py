@@ -0,0 +1,106 @@
+"""
+Headless benchmark of building a large scene with and without `Scene.batch`.
+
+Creates groups of one root `Text` and nine child texts, then runs the first frame.
+Reports the time to build the objects, the time of the first frame and their sum.
+Every measurement runs in a fresh scene with the caches of `Text` cleared.
+
+Run from the `src` directory:
+    python -m benchmarks.batch --objects 2000 20000
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # must be set before pygame creates the display
+
+import argparse
+import gc
+import json
+import time
+
+from UniUI import Screen, Scene, Text, Vector2, Align
+
+
+RESOLUTION = (1280, 720)
+GROUP_SIZE = 10 # a root text and its children
+
+
+def run_frame(scene: Scene) -> None:
+    scene._handle_events()
+    scene._run_calls()
+    scene._update_objects()
+    scene._apply_activation()
+    scene._refurbish()
+    scene._present(scene._draw())
+
+
+def build(scene: Scene, objects: int) -> None:
+    for g in range(max(1, objects // GROUP_SIZE)):
+        root = Text(
+            name=f"group {g}", scene=scene, align=Align.TOPLEFT, layer=g % 3,
+            position=Vector2(g % 40 * 150, g // 40 * 60), text=f"group {g}"
+        )
+        for i in range(GROUP_SIZE - 1):
+            Text(
+                name=f"group {g} child {i}", scene=scene, parent=root, align=Align.BOTTOM, layer=i % 2,
+                position=Vector2(0, i * 5), text=f"child {g} {i}"
+            )
+
+
+def measure(objects: int, batched: bool) -> dict[str, object]:
+    Text.line_cache.clear()
+    Text.transform_cache.clear()
+    scene = Scene("benchmark", lambda scene: None)
+    scene._is_loaded = True
+    gc.collect()
+
+    start = time.perf_counter()
+    if batched:
+        with scene.batch():
+            build(scene, objects)
+    else:
+        build(scene, objects)
+    creation = time.perf_counter() - start
+
+    start = time.perf_counter()
+    run_frame(scene)
+    first_frame = time.perf_counter() - start
+
+    result = {
+        "params": {"objects": objects, "batched": batched},
+        "build_ms": creation * 1000,
+        "first_frame_ms": first_frame * 1000,
+        "total_ms": (creation + first_frame) * 1000,
+    }
+    scene.unload()
+    return result
+
+
+def parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.batch", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("-n", "--objects", type=int, nargs="+", default=[20000], help="number of objects of the scene")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> list[dict[str, object]]:
+    args = parse_args(argv)
+    Screen(resolution=Vector2(*RESOLUTION), refresh_rate=0)
+
+    results = []
+    for objects in args.objects:
+        for batched in (False, True):
+            result = measure(objects, batched)
+            results.append(result)
+            print(
+                f"N={objects:<7} {'batch' if batched else 'plain':<5}  build {result['build_ms']:7.1f}ms"
+                f"  first frame {result['first_frame_ms']:6.1f}ms  total {result['total_ms']:7.1f}ms"
+            )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
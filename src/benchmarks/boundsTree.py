@@ -0,0 +1,124 @@
+"""
+Headless benchmark of the bounds tree under root churn.
+
+Builds a scene of N root `Text` objects spread over an area larger than the screen, then
+runs frames in which nothing changes and frames in which a number of roots is destroyed,
+created or moved to another layer. Reports the median time of refreshing the bounds tree
+and of the whole frame for each kind of frame.
+
+Run from the `src` directory:
+    python -m benchmarks.boundsTree --objects 2000 20000 --churn 1 10
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # must be set before pygame creates the display
+
+import argparse
+import itertools
+import json
+import random
+import statistics
+import time
+
+from UniUI import Screen, Scene, Text, Time, Vector2, Align
+
+
+FRAMES = 30
+RESOLUTION = (1280, 720)
+CHURNS = ("idle", "create", "destroy", "layer")
+
+
+def run_frame(scene: Scene) -> tuple[float, float]:
+    """Runs one frame of `scene`, returns the time of refreshing its bounds and of the whole frame."""
+    counter = time.perf_counter
+    Time._update_delta_time(1 / 60)
+
+    start = counter()
+    scene._handle_events()
+    scene._run_calls()
+    scene._update_objects()
+    scene._apply_activation()
+    scene._refurbish()
+    bounds_start = counter()
+    scene._refresh_bounds() # done by `_draw` otherwise
+    bounds_end = counter()
+    scene._present(scene._draw())
+    end = counter()
+    return bounds_end - bounds_start, end - start
+
+
+def create_root(scene: Scene, rng: random.Random, index: int) -> Text:
+    return Text(
+        name=f"text {index}", scene=scene, align=Align.TOPLEFT, text=f"text {index}",
+        position=Vector2(rng.uniform(-2, 2) * RESOLUTION[0], rng.uniform(-2, 2) * RESOLUTION[1]),
+        layer=rng.randrange(8)
+    )
+
+
+def churn(scene: Scene, roots: list[Text], rng: random.Random, kind: str, count: int) -> None:
+    """Applies `count` changes of `kind` to the roots of `scene`."""
+    for _ in range(count):
+        if kind == "create":
+            roots.append(create_root(scene, rng, len(roots)))
+        elif kind == "destroy":
+            roots.pop(rng.randrange(len(roots))).destroy()
+        elif kind == "layer":
+            roots[rng.randrange(len(roots))].layer = rng.randrange(8)
+
+
+def measure(objects: int, count: int, frames: int) -> dict[str, object]:
+    rng = random.Random(objects)
+    scene = Scene("benchmark", lambda scene: None)
+    scene._is_loaded = True
+    roots = [create_root(scene, rng, i) for i in range(objects)]
+    run_frame(scene) # lays out and draws everything once
+
+    times = {kind: ([], []) for kind in CHURNS}
+    for _ in range(frames):
+        for kind in CHURNS:
+            churn(scene, roots, rng, kind, count)
+            bounds, frame = run_frame(scene)
+            times[kind][0].append(bounds)
+            times[kind][1].append(frame)
+
+    scene.unload()
+    Text.line_cache.clear()
+    Text.transform_cache.clear()
+
+    median = lambda values: statistics.median(values) * 1000
+    result: dict[str, object] = {"params": {"objects": objects, "churn": count, "frames": frames}}
+    for kind in CHURNS:
+        result[f"{kind}_bounds_ms"] = median(times[kind][0])
+        result[f"{kind}_frame_ms"] = median(times[kind][1])
+    return result
+
+
+def parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.boundsTree", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("-n", "--objects", type=int, nargs="+", default=[20000], help="number of root Text objects")
+    parser.add_argument("-c", "--churn", type=int, nargs="+", default=[1, 10], help="roots changed in every churn frame")
+    parser.add_argument("-f", "--frames", type=int, default=FRAMES, help="number of measured frames of each kind")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> list[dict[str, object]]:
+    args = parse_args(argv)
+    Screen(resolution=Vector2(*RESOLUTION), refresh_rate=0)
+
+    results = []
+    for objects, count in itertools.product(args.objects, args.churn):
+        result = measure(objects, max(1, count), max(1, args.frames))
+        results.append(result)
+        print(f"N={objects:<6} churn={count:<3}" + "".join(
+            f"  {kind} {result[f'{kind}_bounds_ms']:7.2f}ms/{result[f'{kind}_frame_ms']:7.2f}ms" for kind in CHURNS
+        ))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+Headless benchmark of the scene frame loop.
+
+Builds scenes of N `Text` objects arranged in chains of depth D, changes a percentage
+of them every frame and runs a fixed number of frames without a window. Reports the
+object creation time, the time spent in each phase of the frame, the re-render counts
+and the peak memory. Every parameter accepts several values, all combinations are run.
+
+Run from the `src` directory:
+    python -m benchmarks.frameloop --objects 100 1000 --depth 1 8 --change 0 10 --output results.json
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # must be set before pygame creates the display
+
+import argparse
+import gc
+import itertools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError: # not available on Windows
+    resource = None
+
+import pygame
+
+from UniUI import Screen, Scene, Text, Time, Vector2, Align
+
+
+FRAMES = 120
+RESOLUTION = (1280, 720)
+PHASES = ("events", "update", "activation", "refurbish", "draw", "present")
+CHANGES = ("text", "append", "move")
+
+
+class BenchText(Text):
+    """Text that counts its re-renders and optionally changes itself every frame."""
+
+    rerenders: int = 0
+
+    def __init__(self, name: str, scene: Scene, change: str | None, **kwargs) -> None:
+        super().__init__(name, scene, **kwargs)
+        self.change = change
+        self.frame = 0
+
+    def _refurbish_interior(self) -> None:
+        BenchText.rerenders += 1
+        super()._refurbish_interior()
+
+    def update(self) -> None:
+        super().update()
+        if self.change is None:
+            return
+
+        self.frame += 1
+        if self.change == "text":
+            self.text = f"{self.name} {self.frame}"
+        elif self.change == "append":
+            self.text += f"\n{self.name} {self.frame}"
+        else:
+            self.transform.position.x = self.frame % 50
+
+
+#region Scene
+def build_scene(scene: Scene, objects: int, depth: int, change_percent: float, change: str, async_render: bool = False) -> None:
+    """Creates `objects` texts in chains of `depth`, every n-th of them changes each frame."""
+    step = 100 / change_percent if change_percent > 0 else None
+    columns = max(1, int(RESOLUTION[0] // 120))
+    parent = None
+
+    for i in range(objects):
+        if i % depth == 0:
+            parent = None
+        changes = step is not None and int(i % step) == 0
+
+        parent = BenchText(
+            name=f"text{i}",
+            scene=scene,
+            change=change if changes else None,
+            parent=parent,
+            align=Align.TOPLEFT if parent is None else Align.BOTTOM,
+            position=Vector2((i // depth) % columns * 120, (i // depth) // columns % 40 * 18) if parent is None else Vector2(0, 0),
+            text=f"text{i}",
+            font_size=12,
+            async_render=async_render,
+        )
+
+
+def run_frame(scene: Scene, phases: dict[str, float]) -> None:
+    """Runs one frame of `Scene.start` phase by phase, adding the time of each phase to `phases`."""
+    counter = time.perf_counter
+    Time._update_delta_time(1 / 60) # frames run as fast as possible, keep the delta time stable
+
+    start = counter()
+    scene._handle_events()
+    t1 = counter()
+    scene._run_calls()
+    scene._update_objects()
+    t2 = counter()
+    scene._apply_activation()
+    t3 = counter()
+    scene._refurbish()
+    t4 = counter()
+    rects = scene._draw()
+    t5 = counter()
+    scene._present(rects)
+    t6 = counter()
+
+    phases["events"] += t1 - start
+    phases["update"] += t2 - t1
+    phases["activation"] += t3 - t2
+    phases["refurbish"] += t4 - t3
+    phases["draw"] += t5 - t4
+    phases["present"] += t6 - t5
+#endregion
+
+
+#region Measurement
+def measure(objects: int, depth: int, change_percent: float, change: str, frames: int,
+            dirty_rects: bool, transform_store: bool, culling: bool, async_render: bool, trace_memory: bool) -> dict[str, object]:
+    scene = Scene("benchmark", lambda scene: None, dirty_rects, transform_store)
+    scene.culling = culling
+    scene._is_loaded = True
+    Text.line_cache.clear()
+    Text.line_cache.reset_stats()
+    Text.transform_cache.clear()
+    Text.transform_cache.reset_stats()
+    BenchText.rerenders = 0
+
+    gc.collect()
+    if trace_memory:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    build_scene(scene, objects, depth, change_percent, change, async_render)
+    creation = time.perf_counter() - start
+    creation_rerenders = BenchText.rerenders
+
+    # the first frame lays out and draws everything, it is reported separately
+    phases = dict.fromkeys(PHASES, 0.0)
+    start = time.perf_counter()
+    run_frame(scene, phases)
+    first_frame = time.perf_counter() - start
+
+    BenchText.rerenders = 0
+    Text.line_cache.reset_stats()
+    Text.transform_cache.reset_stats()
+    phases = dict.fromkeys(PHASES, 0.0)
+    start = time.perf_counter()
+    for _ in range(frames):
+        run_frame(scene, phases)
+    total = time.perf_counter() - start
+
+    result: dict[str, object] = {
+        "params": {
+            "objects": objects,
+            "depth": depth,
+            "change_percent": change_percent,
+            "change": change,
+            "frames": frames,
+            "dirty_rects": dirty_rects,
+            "transform_store": transform_store,
+            "culling": culling,
+            "async_render": async_render,
+        },
+        "creation_ms": creation * 1000,
+        "creation_us_per_object": creation / objects * 1e6 if objects else 0.0,
+        "first_frame_ms": first_frame * 1000,
+        "frame_ms": total / frames * 1000,
+        "fps": frames / total if total > 0 else None,
+        "phases_ms": {name: value / frames * 1000 for name, value in phases.items()},
+        "rerenders": {
+            "creation": creation_rerenders,
+            "total": BenchText.rerenders,
+            "per_frame": BenchText.rerenders / frames,
+        },
+        "line_cache": Text.line_cache.stats(),
+        "transform_cache": Text.transform_cache.stats(),
+        "culled_objects": scene.culled_objects,
+    }
+
+    if trace_memory:
+        result["peak_python_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    scene.unload()
+    return result
+
+
+def max_rss_bytes() -> int | None:
+    """Peak resident memory of the whole process, including the pixel data of the surfaces."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+#endregion
+
+
+def parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.frameloop", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("-n", "--objects", type=int, nargs="+", default=[1000], help="number of Text objects")
+    parser.add_argument("-d", "--depth", type=int, nargs="+", default=[1], help="length of the parent chains")
+    parser.add_argument("-c", "--change", type=float, nargs="+", default=[10], help="percentage of objects changing every frame")
+    parser.add_argument("-k", "--kind", choices=CHANGES, nargs="+", default=["text"], help="what the changing objects change")
+    parser.add_argument("-f", "--frames", type=int, default=FRAMES, help="number of measured frames")
+    parser.add_argument("--dirty-rects", action="store_true", help="run the scenes in dirty rectangle mode")
+    parser.add_argument("--transform-store", action="store_true", help="run the scenes with the numpy transform store")
+    parser.add_argument("--no-culling", action="store_true", help="draw the objects outside of the screen as well")
+    parser.add_argument("--async-render", action="store_true", help="rasterize the texts on the worker threads")
+    parser.add_argument("--memory", action="store_true", help="trace the peak python memory, slows down the measured times")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> list[dict[str, object]]:
+    args = parse_args(argv)
+    Screen(resolution=Vector2(*RESOLUTION), refresh_rate=0)
+
+    results = []
+    for objects, depth, change_percent, change in itertools.product(args.objects, args.depth, args.change, args.kind):
+        result = measure(
+            objects, max(1, depth), change_percent, change, max(1, args.frames),
+            args.dirty_rects, args.transform_store, not args.no_culling, args.async_render, args.memory
+        )
+        results.append(result)
+
+        phases = " ".join(f"{name} {value:.2f}" for name, value in result["phases_ms"].items())
+        print(
+            f"N={objects:<6} D={depth:<3} change={change_percent:g}% {change:<5}"
+            f" create {result['creation_ms']:8.1f}ms  frame {result['frame_ms']:7.2f}ms ({phases})"
+            f"  rerenders/frame {result['rerenders']['per_frame']:.1f}"
+        )
+
+    if args.output:
+        report = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "max_rss_bytes": max_rss_bytes(),
+            "results": results,
+        }
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
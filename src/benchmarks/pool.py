@@ -0,0 +1,102 @@
+"""
+Headless benchmark of object churn with and without `Scene.pool`.
+
+Every frame creates a number of short-lived `Text` objects (toasts) and destroys the ones
+created a few frames earlier, once with plain constructors and once through a prewarmed pool.
+Reports the time per frame, the time per created object and the hit rate of the pool.
+
+Run from the `src` directory:
+    python -m benchmarks.pool --spawn 10 50 --lifetime 30
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # must be set before pygame creates the display
+
+import argparse
+import gc
+import json
+import time
+
+from collections import deque
+
+from UniUI import Screen, Scene, Text, Vector2
+
+
+FRAMES = 300
+RESOLUTION = (1280, 720)
+
+
+def run_frame(scene: Scene) -> None:
+    scene._handle_events()
+    scene._run_calls()
+    scene._update_objects()
+    scene._apply_activation()
+    scene._refurbish()
+    scene._present(scene._draw())
+
+
+def measure(spawn: int, lifetime: int, frames: int, pooled: bool) -> dict[str, object]:
+    scene = Scene("benchmark", lambda scene: None)
+    scene._is_loaded = True
+    pool = scene.pool(Text, prewarm=spawn * (lifetime + 1), text="toast", font_size=14) if pooled else None
+    gc.collect()
+
+    alive: deque[list[Text]] = deque()
+    creation = 0.0
+    start = time.perf_counter()
+    for frame in range(frames):
+        created = time.perf_counter()
+        batch = []
+        for i in range(spawn):
+            kwargs = dict(name="toast", text=f"toast {i}", font_size=14, position=Vector2(i * 20 % 600, frame % 400))
+            batch.append(pool.acquire(**kwargs) if pooled else Text(scene=scene, **kwargs))
+        alive.append(batch)
+        if len(alive) > lifetime:
+            for obj in alive.popleft():
+                obj.destroy()
+        creation += time.perf_counter() - created
+        run_frame(scene)
+    total = time.perf_counter() - start
+
+    result = {
+        "params": {"spawn": spawn, "lifetime": lifetime, "frames": frames, "pooled": pooled},
+        "frame_ms": total / frames * 1000,
+        "churn_us_per_object": creation / (spawn * frames) * 1e6,
+        "pool": pool.stats() if pooled else None,
+    }
+    scene.unload()
+    return result
+
+
+def parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.pool", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("-s", "--spawn", type=int, nargs="+", default=[20], help="objects created every frame")
+    parser.add_argument("-l", "--lifetime", type=int, default=30, help="frames an object lives")
+    parser.add_argument("-f", "--frames", type=int, default=FRAMES, help="number of measured frames")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> list[dict[str, object]]:
+    args = parse_args(argv)
+    Screen(resolution=Vector2(*RESOLUTION), refresh_rate=0)
+
+    results = []
+    for spawn in args.spawn:
+        for pooled in (False, True):
+            result = measure(max(1, spawn), max(1, args.lifetime), max(1, args.frames), pooled)
+            results.append(result)
+            hit_rate = f"  hit rate {result['pool']['hit_rate']:.1%}" if pooled else ""
+            print(
+                f"spawn={spawn:<4} {'pooled' if pooled else 'plain ':<6}  frame {result['frame_ms']:6.2f}ms"
+                f"  churn {result['churn_us_per_object']:6.1f}us/object{hit_rate}"
+            )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
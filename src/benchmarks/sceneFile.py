@@ -0,0 +1,118 @@
+"""
+Headless benchmark of loading a scene from a `SceneFile` instead of running its init function.
+
+Builds a scene of groups of one root `Text` and nine child texts with its init function, saves
+it with and without rasters, then loads it again in fresh scenes: with the init function, with
+the init function inside `Scene.batch` and from both files. Reports the best time of the repeats
+to create the objects and draw the first frame, and the sizes of the files.
+
+Run from the `src` directory:
+    python -m benchmarks.sceneFile --objects 2000 20000 --repeat 3
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # must be set before pygame creates the display
+
+import argparse
+import gc
+import json
+import tempfile
+import time
+
+from typing import Callable
+
+from UniUI import Screen, Scene, SceneFile, Text, Vector2, Align
+
+
+RESOLUTION = (1280, 720)
+GROUP_SIZE = 10 # a root text and its children
+
+
+def build(scene: Scene, objects: int) -> None:
+    for g in range(max(1, objects // GROUP_SIZE)):
+        root = Text(
+            name=f"group {g}", scene=scene, align=Align.TOPLEFT, layer=g % 3,
+            position=Vector2(g % 40 * 150, g // 40 * 60), text=f"group {g}"
+        )
+        for i in range(GROUP_SIZE - 1):
+            Text(
+                name=f"group {g} child {i}", scene=scene, parent=root, align=Align.BOTTOM, layer=i % 2,
+                position=Vector2(0, i * 5), text=f"child {g} {i}"
+            )
+
+
+def time_load(init_func: Callable[[Scene], None], repeat: int) -> float:
+    """Returns the best time to run `init_func` in a new scene and draw its first frame, in milliseconds."""
+    best = None
+    for _ in range(repeat):
+        Text.line_cache.clear()
+        Text.transform_cache.clear()
+        scene = Scene("benchmark", init_func)
+        scene._is_loaded = True
+        gc.collect()
+
+        start = time.perf_counter()
+        init_func(scene)
+        scene._refurbish()
+        scene._present(scene._draw())
+        elapsed = time.perf_counter() - start
+
+        best = elapsed if best is None else min(best, elapsed)
+        scene.unload()
+    return best * 1000
+
+
+def measure(objects: int, repeat: int, directory: str) -> dict[str, object]:
+    scene = Scene("benchmark", lambda scene: None)
+    build(scene, objects)
+    paths = {rasters: os.path.join(directory, f"scene_{objects}_{rasters}.uiscene") for rasters in (False, True)}
+    for rasters, path in paths.items():
+        SceneFile.save(scene, path, rasters=rasters)
+    scene.unload()
+
+    def batched(scene: Scene) -> None:
+        with scene.batch():
+            build(scene, objects)
+
+    return {
+        "params": {"objects": objects, "repeat": repeat},
+        "init_ms": time_load(lambda scene: build(scene, objects), repeat),
+        "batch_ms": time_load(batched, repeat),
+        "file_ms": time_load(SceneFile.loader(paths[False]), repeat),
+        "file_rasters_ms": time_load(SceneFile.loader(paths[True]), repeat),
+        "file_bytes": os.path.getsize(paths[False]),
+        "file_rasters_bytes": os.path.getsize(paths[True]),
+    }
+
+
+def parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.sceneFile", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("-n", "--objects", type=int, nargs="+", default=[20000], help="number of objects of the scene")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="loads of every kind, the best one is reported")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> list[dict[str, object]]:
+    args = parse_args(argv)
+    Screen(resolution=Vector2(*RESOLUTION), refresh_rate=0)
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for objects in args.objects:
+            result = measure(max(1, objects), max(1, args.repeat), directory)
+            results.append(result)
+            print(
+                f"N={objects:<7} init {result['init_ms']:7.1f}ms  batch {result['batch_ms']:7.1f}ms"
+                f"  file {result['file_ms']:7.1f}ms ({result['file_bytes'] / 1024:.0f}KiB)"
+                f"  file with rasters {result['file_rasters_ms']:7.1f}ms ({result['file_rasters_bytes'] / 1024:.0f}KiB)"
+            )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
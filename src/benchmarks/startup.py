@@ -0,0 +1,133 @@
+"""
+Cold start benchmark: import time and time to the first frame.
+
+Every run starts a fresh interpreter that imports pygame and UniUI, creates the screen,
+builds a scene of `Text` objects and draws the first frame, timing each step. The medians
+of several runs are compared with budgets; the exit status is 1 if one is exceeded, so the
+benchmark can guard the startup path in CI. The pygame import is reported but not budgeted,
+since it does not depend on UniUI.
+
+Run from the `src` directory:
+    python -m benchmarks.startup --runs 5 --import-budget 50 --first-frame-budget 150
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # inherited by the measured interpreters
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+
+RUNS = 5
+OBJECTS = 100
+RESOLUTION = (1280, 720)
+IMPORT_BUDGET_MS = 50.0
+FIRST_FRAME_BUDGET_MS = 150.0
+STEPS = ("import_pygame", "import_uniui", "screen", "scene", "first_frame")
+
+
+#region Measured process
+def measure(objects: int) -> dict[str, float]:
+    """Runs the startup path once in the current interpreter, returns the milliseconds of every step."""
+    counter = time.perf_counter
+    times: dict[str, float] = {}
+
+    start = counter()
+    import pygame
+    times["import_pygame"] = counter() - start
+
+    start = counter()
+    from UniUI import Screen, Scene, Text, Vector2, Align
+    times["import_uniui"] = counter() - start
+
+    start = counter()
+    Screen(resolution=Vector2(*RESOLUTION), refresh_rate=0)
+    times["screen"] = counter() - start
+
+    start = counter()
+    scene = Scene("startup", lambda scene: None)
+    scene._is_loaded = True
+    columns = RESOLUTION[0] // 120
+    for i in range(objects):
+        Text(
+            name=f"text{i}", scene=scene, align=Align.TOPLEFT, font_size=12, text=f"text{i}",
+            position=Vector2(i % columns * 120, i // columns % 40 * 18)
+        )
+    times["scene"] = counter() - start
+
+    start = counter()
+    scene._frame()
+    times["first_frame"] = counter() - start
+
+    return {name: value * 1000 for name, value in times.items()}
+
+
+def run_child(objects: int) -> dict[str, float]:
+    """Measures the startup path in a new interpreter."""
+    source = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [source, os.environ.get("PYTHONPATH")])))
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup", "--child", "--objects", str(objects)],
+        cwd=source, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    # the last line is the result, the lines before are printed by pygame and UniUI
+    return json.loads(output.strip().splitlines()[-1])
+#endregion
+
+
+def parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("-r", "--runs", type=int, default=RUNS, help="number of fresh interpreters to measure")
+    parser.add_argument("-n", "--objects", type=int, default=OBJECTS, help="number of Text objects in the first frame")
+    parser.add_argument("--import-budget", type=float, default=IMPORT_BUDGET_MS, help="budget of the UniUI import in ms")
+    parser.add_argument("--first-frame-budget", type=float, default=FIRST_FRAME_BUDGET_MS,
+                        help="budget from the end of the imports to the first presented frame in ms")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.child:
+        print(json.dumps(measure(args.objects)))
+        return 0
+
+    runs = [run_child(args.objects) for _ in range(max(1, args.runs))]
+    medians = {name: statistics.median(run[name] for run in runs) for name in STEPS}
+    to_first_frame = medians["screen"] + medians["scene"] + medians["first_frame"]
+
+    checks = {
+        "import_uniui": (medians["import_uniui"], args.import_budget),
+        "to_first_frame": (to_first_frame, args.first_frame_budget),
+    }
+    print(" ".join(f"{name} {value:.1f}ms" for name, value in medians.items()))
+    failed = False
+    for name, (value, budget) in checks.items():
+        ok = value <= budget
+        failed |= not ok
+        print(f"{name:<15}{value:8.1f}ms  budget {budget:8.1f}ms  {'ok' if ok else 'EXCEEDED'}")
+
+    if args.output:
+        report = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "objects": args.objects,
+            "runs": runs,
+            "medians_ms": medians,
+            "budgets_ms": {name: budget for name, (_, budget) in checks.items()},
+            "passed": not failed,
+        }
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Headless benchmark of the scene frame loop with and without the `TransformStore`.
+
+Builds the same scene of moving `Text` objects twice, with and without the store, and runs
+their frames alternately so both see the same machine load. Reports the median time of the
+layout (syncing the store, resolving the world transforms and the screen bounds of the moved
+objects) and of the whole frame, which also blits every text.
+
+Run from the `src` directory:
+    python -m benchmarks.transformStore --objects 20000 --depth 1 10 --change 1 100
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # must be set before pygame creates the display
+
+import argparse
+import itertools
+import json
+import statistics
+import time
+
+from UniUI import Screen, Scene, Text, Time, Vector2
+
+from .frameloop import build_scene
+
+
+FRAMES = 30
+RESOLUTION = (1280, 720)
+
+
+def run_frame(scene: Scene) -> tuple[float, float]:
+    """Runs one frame of `scene`, returns the time of its layout and of the whole frame."""
+    counter = time.perf_counter
+    Time._update_delta_time(1 / 60)
+
+    start = counter()
+    scene._handle_events()
+    scene._run_calls()
+    scene._update_objects()
+    scene._apply_activation()
+    layout_start = counter()
+    scene._refurbish()
+    scene._refresh_bounds() # done by `_draw` otherwise
+    layout_end = counter()
+    scene._present(scene._draw())
+    end = counter()
+    return layout_end - layout_start, end - start
+
+
+def measure(objects: int, depth: int, change_percent: float, frames: int) -> dict[str, object]:
+    scenes = {}
+    for store in (False, True):
+        scene = Scene("benchmark", lambda scene: None, transform_store=store)
+        scene._is_loaded = True
+        build_scene(scene, objects, depth, change_percent, "move")
+        run_frame(scene) # lays out and draws everything once
+        scenes[store] = scene
+
+    times = {store: ([], []) for store in scenes}
+    for _ in range(frames):
+        for store, scene in scenes.items():
+            layout, frame = run_frame(scene)
+            times[store][0].append(layout)
+            times[store][1].append(frame)
+
+    for scene in scenes.values():
+        scene.unload()
+    Text.line_cache.clear()
+    Text.transform_cache.clear()
+
+    median = lambda values: statistics.median(values) * 1000
+    return {
+        "params": {"objects": objects, "depth": depth, "change_percent": change_percent, "frames": frames},
+        "layout_ms": median(times[False][0]),
+        "store_layout_ms": median(times[True][0]),
+        "frame_ms": median(times[False][1]),
+        "store_frame_ms": median(times[True][1]),
+    }
+
+
+def parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.transformStore", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("-n", "--objects", type=int, nargs="+", default=[20000], help="number of Text objects")
+    parser.add_argument("-d", "--depth", type=int, nargs="+", default=[1, 10], help="length of the parent chains")
+    parser.add_argument("-c", "--change", type=float, nargs="+", default=[1, 100], help="percentage of objects moving every frame")
+    parser.add_argument("-f", "--frames", type=int, default=FRAMES, help="number of measured frames of each scene")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> list[dict[str, object]]:
+    args = parse_args(argv)
+    Screen(resolution=Vector2(*RESOLUTION), refresh_rate=0)
+
+    results = []
+    for objects, depth, change_percent in itertools.product(args.objects, args.depth, args.change):
+        result = measure(objects, max(1, depth), change_percent, max(1, args.frames))
+        results.append(result)
+        print(
+            f"N={objects:<6} D={depth:<3} change={change_percent:g}%"
+            f"  layout {result['layout_ms']:7.2f}ms -> store {result['store_layout_ms']:7.2f}ms"
+            f"  frame {result['frame_ms']:7.2f}ms -> store {result['store_frame_ms']:7.2f}ms"
+        )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Micro-benchmark of the Vector2 hot operations.
+
+Run from the `src` directory:
+    python -m benchmarks.vector2
+"""
+import timeit
+
+from UniUI.core.math.vector2 import Vector2
+
+
+NUMBER = 200_000
+
+CASES: dict[str, tuple[str, str]] = {
+    "construct":        ("", "Vector2(1.5, 2.5)"),
+    "add vector":       ("a = Vector2(1, 2); b = Vector2(3, 4)", "a + b"),
+    "add number":       ("a = Vector2(1, 2)", "a + 3"),
+    "sub vector":       ("a = Vector2(1, 2); b = Vector2(3, 4)", "a - b"),
+    "mul vector":       ("a = Vector2(1, 2); b = Vector2(3, 4)", "a * b"),
+    "mul number":       ("a = Vector2(1, 2)", "a * 2.5"),
+    "iadd vector":      ("a = Vector2(1, 2); b = Vector2(3, 4)", "a += b"),
+    "imul number":      ("a = Vector2(1, 2)", "a *= 1.0"),
+    "set x":            ("a = Vector2(1, 2)", "a.x = 3.5"),
+    "get xy":           ("a = Vector2(1, 2)", "a.xy"),
+}
+
+
+def run(number: int = NUMBER) -> dict[str, float]:
+    """Returns the cost of every case in nanoseconds per operation."""
+    results: dict[str, float] = {}
+    for name, (setup, stmt) in CASES.items():
+        seconds = min(timeit.repeat(stmt, setup, globals={"Vector2": Vector2}, number=number, repeat=5))
+        results[name] = seconds / number * 1e9
+    return results
+
+
+def main() -> None:
+    for name, ns in run().items():
+        print(f"{name:<16}{ns:8.1f} ns/op")
+
+
+if __name__ == "__main__":
+    main()
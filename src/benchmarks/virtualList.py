@@ -0,0 +1,111 @@
+"""
+Headless benchmark of `VirtualList`.
+
+Builds lists of N items with `Text` rows, scrolls them by a fixed distance every frame and
+reports the creation time, the frame time, the number of row objects and the peak python
+memory. The results should not depend on N.
+
+Run from the `src` directory:
+    python -m benchmarks.virtualList --items 1000 100000 1000000 --variable
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # must be set before pygame creates the display
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from UniUI import Screen, Scene, Text, Vector2, Align, TextAlign, TextAlignX, TextAlignY, VirtualList
+
+
+FRAMES = 300
+RESOLUTION = (1280, 720)
+LIST_SIZE = (400, 600)
+ROW_HEIGHT = 20
+
+
+def run_frame(scene: Scene) -> None:
+    scene._handle_events()
+    scene._run_calls()
+    scene._update_objects()
+    scene._apply_activation()
+    scene._refurbish()
+    scene._present(scene._draw())
+
+
+def measure(items: int, frames: int, scroll: float, variable: bool) -> dict[str, object]:
+    scene = Scene("benchmark", lambda scene: None)
+    scene._is_loaded = True
+    gc.collect()
+    tracemalloc.start()
+
+    start = time.perf_counter()
+    view = VirtualList(
+        name="list",
+        scene=scene,
+        size=Vector2(*LIST_SIZE),
+        align=Align.TOPLEFT,
+        item_count=items,
+        row_height=(lambda index: ROW_HEIGHT + index % 3 * 4) if variable else ROW_HEIGHT,
+        create_row=lambda view: Text(
+            name="row", scene=view.scene, parent=view, font_size=12,
+            text_align=TextAlign(TextAlignX.LEFT, TextAlignY.MIDDLE)
+        ),
+        bind_row=lambda row, index: setattr(row, "text", f"item {index}"),
+    )
+    run_frame(scene)
+    creation = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        view.scroll_offset += scroll
+        run_frame(scene)
+    total = time.perf_counter() - start
+
+    result = {
+        "params": {"items": items, "frames": frames, "scroll": scroll, "variable": variable},
+        "creation_ms": creation * 1000,
+        "frame_ms": total / frames * 1000,
+        "rows": view.row_count,
+        "visible_range": view.visible_range,
+        "peak_python_bytes": tracemalloc.get_traced_memory()[1],
+    }
+    tracemalloc.stop()
+    scene.unload()
+    return result
+
+
+def parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.virtualList", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("-n", "--items", type=int, nargs="+", default=[1000, 100000], help="number of items of the list")
+    parser.add_argument("-f", "--frames", type=int, default=FRAMES, help="number of measured frames")
+    parser.add_argument("-s", "--scroll", type=float, default=37, help="distance scrolled every frame")
+    parser.add_argument("--variable", action="store_true", help="give the items different heights")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> list[dict[str, object]]:
+    args = parse_args(argv)
+    Screen(resolution=Vector2(*RESOLUTION), refresh_rate=0)
+
+    results = []
+    for items in args.items:
+        result = measure(items, max(1, args.frames), args.scroll, args.variable)
+        results.append(result)
+        print(
+            f"N={items:<8} create {result['creation_ms']:7.1f}ms  frame {result['frame_ms']:6.2f}ms"
+            f"  rows {result['rows']:<4} peak {result['peak_python_bytes'] / 1024:8.1f}KiB"
+        )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
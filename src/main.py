@@ -1,6 +1,6 @@
 from UniUI import *
 
-import pygame.freetype
+import pygame
 
 from pathlib import Path
 
@@ -13,9 +13,10 @@ screen = Screen(
 )
 manager = SceneManager()
 
-# loading font
+# loading font, shared by every text through the registry
 font_path = Path(__file__).parent / "assets" / "FiraCode-Regular.ttf"
-font = pygame.freetype.Font(font_path)
+font = Fonts.get(font_path)
+Fonts.prewarm(font, sizes=[22])
 
 # creating custom Text class to control our text
 class CustomText(Text):
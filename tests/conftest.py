@@ -0,0 +1,47 @@
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # must be set before pygame creates the display
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+import pytest
+
+from UniUI import Screen, Scene, Text, Vector2
+
+
+RESOLUTION = (320, 240)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def screen() -> Screen:
+    return Screen(resolution=Vector2(*RESOLUTION), refresh_rate=0)
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    pygame.event.clear()
+    yield
+    Text.line_cache.clear()
+    Text.transform_cache.clear()
+
+
+def run_frame(scene: Scene) -> None:
+    """Runs one frame of `scene` without waiting or presenting it."""
+    scene._handle_events()
+    scene._run_calls()
+    scene._update_objects()
+    scene._apply_activation()
+    scene._refurbish()
+    scene._draw()
+
+
+def full_redraw(scene: Scene) -> bytes:
+    """Returns the pixels of `scene` drawn from scratch, for comparing with the last frame."""
+    scene._redraw_all()
+    scene._draw()
+    return pygame.image.tostring(Screen.Instance._screen, "RGB")
+
+
+def screen_pixels() -> bytes:
+    return pygame.image.tostring(Screen.Instance._screen, "RGB")
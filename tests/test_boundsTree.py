@@ -0,0 +1,84 @@
+import random
+
+import pygame
+import pytest
+
+from UniUI import Scene, Text, Vector2, Align
+from UniUI.core.utils.boundsTree import BoundsTree
+
+from conftest import RESOLUTION, run_frame, full_redraw, screen_pixels
+
+
+class Box:
+    def __init__(self, rect: pygame.Rect | None) -> None:
+        self._subtree_bounds = rect
+        self._subtree_count = 1
+
+
+def random_rect(rng: random.Random) -> pygame.Rect:
+    return pygame.Rect(rng.randrange(-500, 500), rng.randrange(-500, 500), rng.randrange(1, 80), rng.randrange(1, 80))
+
+
+def test_query_matches_brute_force_under_churn():
+    rng = random.Random(1)
+    order = {}
+    boxes = []
+    for _ in range(200):
+        box = Box(random_rect(rng))
+        order[box] = len(order)
+        boxes.append(box)
+    tree = BoundsTree(boxes, order.__getitem__)
+
+    for step in range(2000):
+        action = rng.random()
+        if action < 0.3:
+            box = Box(random_rect(rng) if rng.random() < 0.9 else None)
+            order[box] = len(order)
+            boxes.append(box)
+            tree.update([box])
+        elif action < 0.6 and boxes:
+            tree.remove(boxes.pop(rng.randrange(len(boxes))))
+        elif boxes:
+            box = rng.choice(boxes)
+            box._subtree_bounds = random_rect(rng)
+            tree.update([box])
+
+        if step % 50 == 0:
+            rect = random_rect(rng).inflate(200, 200)
+            hits = [box for box in boxes if box._subtree_bounds is not None and rect.colliderect(box._subtree_bounds)]
+            found, culled = tree.query(rect)
+            assert found == sorted(hits, key=order.__getitem__)
+            assert culled == sum(box._subtree_bounds is not None for box in boxes) - len(hits)
+
+
+@pytest.mark.parametrize("dirty_rects", [False, True])
+def test_root_churn_draws_like_without_culling(dirty_rects):
+    rng = random.Random(2)
+    scene = Scene("churn", lambda scene: None, dirty_rects=dirty_rects)
+    scene._is_loaded = True
+
+    def create(i: int) -> Text:
+        return Text(
+            name=f"t{i}", scene=scene, align=Align.TOPLEFT, text=f"t{i}", layer=rng.randrange(4),
+            position=Vector2(rng.randrange(-100, RESOLUTION[0]), rng.randrange(-50, RESOLUTION[1]))
+        )
+
+    roots = [create(i) for i in range(60)]
+    run_frame(scene)
+    for frame in range(30):
+        for _ in range(3):
+            action = rng.randrange(3)
+            if action == 0:
+                roots.append(create(len(roots) + frame * 10))
+            elif action == 1:
+                roots.pop(rng.randrange(len(roots))).destroy()
+            else:
+                rng.choice(roots).layer = rng.randrange(4)
+        run_frame(scene)
+
+        drawn = screen_pixels()
+        scene.culling = False
+        assert drawn == full_redraw(scene)
+        scene.culling = True
+
+    scene.unload()
@@ -0,0 +1,59 @@
+import pygame
+
+from UniUI import Scene, Text, Vector2, Align, PointerEventType
+
+from conftest import run_frame, full_redraw, screen_pixels
+
+
+def make_scene(dirty_rects: bool) -> tuple[Scene, Text]:
+    scene = Scene("input", lambda scene: None, dirty_rects=dirty_rects)
+    scene._is_loaded = True
+    button = Text(name="button", scene=scene, align=Align.TOPLEFT, position=Vector2(20, 20), text="button")
+    return scene, button
+
+
+def post_click(position: tuple[int, int]) -> None:
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=position, button=1))
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=position, button=1))
+
+
+def test_moving_listener_with_two_events_in_one_frame_repaints_old_area():
+    scene, button = make_scene(dirty_rects=True)
+    run_frame(scene)
+
+    def move(event):
+        button.transform.position.x += 100
+    button.add_pointer_listener(PointerEventType.DOWN, move)
+
+    post_click(button._drawn_bounds.center)
+    run_frame(scene)
+
+    assert button.transform.position.x == 120
+    assert screen_pixels() == full_redraw(scene)
+
+
+def test_hit_test_between_frames_keeps_damage_of_moved_objects():
+    scene, button = make_scene(dirty_rects=True)
+    run_frame(scene)
+    old_center = button._drawn_bounds.center
+
+    button.transform.position.y += 80
+    assert scene.input.hit_test(Vector2(*old_center)) is None
+    assert scene.input.hit_test(Vector2(*button._drawn_bounds.center)) is button
+    run_frame(scene)
+
+    assert screen_pixels() == full_redraw(scene)
+
+
+def test_destroying_hovered_child_hovers_its_parent():
+    scene, button = make_scene(dirty_rects=False)
+    label = Text(name="label", scene=scene, parent=button, align=Align.TOPLEFT, text="label")
+    button.add_pointer_listener(PointerEventType.ENTER, lambda event: None) # input is handled for listeners only
+    run_frame(scene)
+
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=label._drawn_bounds.center, rel=(0, 0), buttons=(0, 0, 0)))
+    run_frame(scene)
+    assert scene.input.hovered is label
+
+    label.destroy()
+    assert scene.input.hovered is button
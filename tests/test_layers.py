@@ -0,0 +1,67 @@
+import pytest
+
+from UniUI import Scene, Text, Vector2, Align, Color
+
+from conftest import run_frame, full_redraw, screen_pixels
+
+
+def make_scene(dirty_rects: bool, on_demand: bool = False) -> Scene:
+    scene = Scene("layers", lambda scene: None, dirty_rects=dirty_rects, on_demand=on_demand)
+    scene._is_loaded = True
+    return scene
+
+
+def overlapping_texts(scene: Scene, parent: Text = None) -> tuple[Text, Text]:
+    below = Text(
+        name="below", scene=scene, parent=parent, align=Align.TOPLEFT, position=Vector2(10, 10),
+        text="##########", color=Color(255, 0, 0), layer=0
+    )
+    above = Text(
+        name="above", scene=scene, parent=parent, align=Align.TOPLEFT, position=Vector2(14, 12),
+        text="##########", color=Color(0, 0, 255), layer=1
+    )
+    return below, above
+
+
+@pytest.mark.parametrize("children", [False, True])
+def test_layer_change_repaints_in_dirty_rects_mode(children):
+    scene = make_scene(dirty_rects=True)
+    parent = Text(name="parent", scene=scene, align=Align.TOPLEFT, text="") if children else None
+    below, above = overlapping_texts(scene, parent)
+    run_frame(scene)
+    before = screen_pixels()
+
+    below.layer = 2
+    run_frame(scene)
+
+    assert screen_pixels() != before
+    assert screen_pixels() == full_redraw(scene)
+
+
+def test_child_layer_change_invalidates_on_demand_scene():
+    scene = make_scene(dirty_rects=False, on_demand=True)
+    parent = Text(name="parent", scene=scene, align=Align.TOPLEFT, text="")
+    below, above = overlapping_texts(scene, parent)
+    run_frame(scene)
+    before = screen_pixels()
+
+    below.layer = 2
+    run_frame(scene)
+
+    assert screen_pixels() != before
+
+
+
+def test_reparent_repaints_in_dirty_rects_mode():
+    scene = make_scene(dirty_rects=True)
+    a = Text(name="a", scene=scene, align=Align.TOPLEFT, position=Vector2(20, 30), text="a")
+    b = Text(name="b", scene=scene, align=Align.TOPLEFT, position=Vector2(150, 90), text="b")
+    # outlined across the edges of the damaged areas
+    Text(name="bystander", scene=scene, align=Align.TOPLEFT, position=Vector2(23, 33), text="d")
+    child = Text(name="child", scene=scene, parent=a, align=Align.TOPLEFT, position=Vector2(7, 5), text="child")
+    run_frame(scene)
+
+    child.parent = b
+    run_frame(scene)
+
+    assert screen_pixels() == full_redraw(scene)
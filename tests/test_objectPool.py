@@ -0,0 +1,33 @@
+import pytest
+
+from UniUI import Scene, Text, Vector2, Align
+
+from conftest import run_frame
+
+
+def make_scene() -> Scene:
+    scene = Scene("pool", lambda scene: None)
+    scene._is_loaded = True
+    return scene
+
+
+@pytest.mark.parametrize("child", [False, True])
+def test_release_and_acquire_in_the_same_frame(child):
+    scene = make_scene()
+    parent = Text(name="parent", scene=scene, text="parent") if child else None
+    pool = scene.pool(Text)
+    text = pool.acquire(name="first", parent=parent, align=Align.TOPLEFT, text="first")
+    run_frame(scene)
+
+    text.active = False
+    text.destroy()
+    reused = pool.acquire(name="second", parent=parent, align=Align.TOPLEFT, position=Vector2(10, 10), text="second")
+    assert reused is text
+    run_frame(scene)
+
+    assert reused.active
+    if child:
+        assert reused in parent.children
+    else:
+        assert reused in scene.objects
+
@@ -0,0 +1,112 @@
+import zlib
+from array import array
+
+import pytest
+
+from UniUI import BaseObject, Scene, SceneFile, Text, Vector2, Align
+from UniUI.core.sceneFile import _HEADER, _Writer, MAGIC, VERSION
+
+from conftest import run_frame, screen_pixels
+
+
+def tree(scene: Scene) -> list[tuple]:
+    """Every object of the scene with its parent, whether it is active and whether it is taken out, in order."""
+    detached = scene._detached_state()
+
+    def children(parent: BaseObject | None, listed: tuple) -> list[BaseObject]:
+        return [*listed, *(obj for obj in detached if obj.parent is parent and obj not in listed)]
+
+    found = []
+    pending = [(obj, None) for obj in reversed(children(None, scene.objects))]
+    while pending:
+        obj, parent = pending.pop()
+        found.append((obj.name, parent, obj.active, detached.get(obj, False)))
+        pending.extend((child, obj.name) for child in reversed(children(obj, obj.children)))
+    return found
+
+
+def build(scene: Scene) -> None:
+    a = Text(name="a", scene=scene, align=Align.TOPLEFT, text="a")
+    b = Text(name="b", scene=scene, parent=a, align=Align.BOTTOM, text="b")
+    Text(name="b child", scene=scene, parent=b, align=Align.BOTTOM, text="b child")
+    c = Text(name="c", scene=scene, align=Align.TOPLEFT, position=Vector2(100, 0), text="c")
+    Text(name="c child", scene=scene, parent=c, align=Align.BOTTOM, text="c child")
+    BaseObject(name="d", scene=scene, active=False)
+    b.active = False
+    c.active = False
+
+
+def test_round_trip_keeps_inactive_roots_and_children(tmp_path):
+    path = tmp_path / "scene.uiscene"
+    scene = Scene("saved", build)
+    scene._is_loaded = True
+    build(scene)
+    run_frame(scene)
+    SceneFile.save(scene, path)
+    saved, pixels = tree(scene), screen_pixels()
+    scene.unload()
+
+    loaded = Scene("loaded", SceneFile.loader(path))
+    loaded._is_loaded = True
+    SceneFile.load(loaded, path)
+    run_frame(loaded)
+
+    assert tree(loaded) == saved
+    assert ("c", None, False, True) in saved and ("b", "a", False, True) in saved
+    assert screen_pixels() == pixels
+
+
+def test_saving_before_the_deactivation_is_applied(tmp_path):
+    path = tmp_path / "scene.uiscene"
+    scene = Scene("saved", build)
+    scene._is_loaded = True
+    build(scene)
+    SceneFile.save(scene, path)
+    run_frame(scene)
+    saved = tree(scene)
+    scene.unload()
+
+    loaded = Scene("loaded", SceneFile.loader(path))
+    loaded._is_loaded = True
+    SceneFile.load(loaded, path)
+    run_frame(loaded)
+
+    assert tree(loaded) == saved
+
+
+COLUMNS = (
+    "class_names", "class_ids", "parents", "names", "flags", "aligns", "layers", "transforms", "text_objects", "texts",
+    "fonts", "font_sizes", "colors", "text_aligns", "paddings", "text_flags", "steps", "raster_fonts", "raster_sizes",
+    "raster_colors", "raster_lines", "surface_sizes", "rects",
+)
+
+
+def encode(columns: dict[str, object]) -> bytes:
+    """Packs decoded columns again, the way `SceneFile._encode` does."""
+    encoded = [value.encode() for value in columns["strings"]]
+    writer = _Writer()
+    writer.column(array("I", (len(value) for value in encoded)))
+    writer.blob(b"".join(encoded))
+    for key in COLUMNS:
+        writer.column(columns[key])
+    writer.blob(bytes(columns["alpha"]))
+    return _HEADER.pack(MAGIC, VERSION) + zlib.compress(b"".join(writer.parts))
+
+
+@pytest.mark.parametrize("key, index", [("fonts", -2), ("fonts", 1000), ("raster_fonts", -3), ("parents", -2)])
+def test_indices_out_of_range_are_rejected(tmp_path, key, index):
+    path = tmp_path / "scene.uiscene"
+    scene = Scene("saved", build)
+    scene._is_loaded = True
+    build(scene)
+    columns = SceneFile._decode(SceneFile._encode(scene, True))
+    scene.unload()
+    assert len(columns[key]) > 1
+
+    columns[key][-1] = index
+    path.write_bytes(encode(columns))
+    loaded = Scene("loaded", lambda scene: None)
+    loaded._is_loaded = True
+
+    assert SceneFile.load(loaded, path) == []
+    assert loaded.objects == ()
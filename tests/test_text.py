@@ -0,0 +1,31 @@
+import pytest
+
+from UniUI import Scene, Text, Vector2, Align, TextAlign, TextAlignX, TextAlignY
+
+from conftest import run_frame
+
+
+def make_text(scene: Scene, text_align: TextAlign) -> Text:
+    return Text(
+        name="text", scene=scene, align=Align.TOPLEFT, size=Vector2(120, 60),
+        text="text", text_align=text_align
+    )
+
+
+@pytest.mark.parametrize("text_align", [
+    TextAlign(TextAlignX.MIDDLE, TextAlignY.TOP),
+    TextAlign(TextAlignX.MIDDLE, TextAlignY.BOTTOM),
+    TextAlign(TextAlignX.LEFT, TextAlignY.MIDDLE),
+    TextAlign(TextAlignX.RIGHT, TextAlignY.TOP),
+])
+def test_text_align_change_moves_rendered_text(text_align):
+    scene = Scene("text", lambda scene: None)
+    scene._is_loaded = True
+    text = make_text(scene, TextAlign(TextAlignX.MIDDLE, TextAlignY.MIDDLE))
+    run_frame(scene)
+    text.get_render_position()
+
+    text.text_align = text_align
+    run_frame(scene)
+
+    assert text.get_render_position() == make_text(scene, text_align).get_render_position()
@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from UniUI import BaseObject, Scene, Screen, Vector2, Align
+
+from conftest import RESOLUTION
+
+
+def build(scene: Scene, seed: int, objects: int = 300) -> list[BaseObject]:
+    rnd = random.Random(seed)
+    built: list[BaseObject] = []
+    for i in range(objects):
+        parent = rnd.choice(built) if built and rnd.random() < 0.8 else None
+        built.append(BaseObject(
+            name=str(i), scene=scene, parent=parent, align=rnd.choice(list(Align)),
+            position=Vector2(rnd.randint(-50, 50), rnd.random() * 30), size=Vector2(rnd.randint(1, 300), rnd.randint(1, 300)),
+            scale=Vector2(rnd.random() + 0.5, 1), rotation=rnd.randint(0, 90)
+        ))
+    return built
+
+
+def mutate(objects: list[BaseObject], seed: int) -> None:
+    rnd = random.Random(seed)
+    for obj in rnd.sample(objects, 20):
+        obj.transform.position.x += 3
+        obj.transform.width = rnd.randint(1, 200)
+        obj.align = rnd.choice(list(Align))
+    objects[10].parent = objects[3] if objects[3].parent is not objects[10] else None
+
+
+def world(objects: list[BaseObject]) -> list[tuple]:
+    return [(obj.global_position, obj.global_scale, obj.global_rotation) for obj in objects]
+
+
+def test_store_matches_plain_transforms():
+    plain_scene = Scene("plain", lambda scene: None)
+    store_scene = Scene("store", lambda scene: None, transform_store=True)
+    store = store_scene.transform_store
+    plain = build(plain_scene, 1)
+    stored = build(store_scene, 1)
+
+    def check() -> None:
+        store.sync()
+        assert store.is_synced
+        assert world(stored) == world(plain)
+
+    check()
+    for seed in range(3):
+        mutate(plain, seed)
+        mutate(stored, seed)
+        check()
+
+    plain[20].destroy()
+    stored[20].destroy()
+    check()
+
+    Screen.Instance._update_screen(Vector2(200, 150))
+    try:
+        check()
+    finally:
+        Screen.Instance._update_screen(Vector2(*RESOLUTION))